@@ -120,9 +120,7 @@ def ingest(ctx, input_dir: str, output: Optional[str], csv_mode: bool):
 
     # Apply redaction based on mode
     redactor = Redactor(mode=ctx.config['redaction_mode'])
-    redacted_documents = []
-    for doc in documents:
-        redacted_documents.append(redactor.redact_document(doc))
+    redacted_documents = redactor.redact_documents(documents)
 
     ctx.documents = redacted_documents
     click.echo(f"Applied {ctx.config['redaction_mode']} redaction mode")
@@ -174,7 +172,7 @@ def analyze(ctx, input_dir: Optional[str], output_dir: str,
         loader = DataLoader()
         documents = loader.load_all(Path(input_dir))
         redactor = Redactor(mode=ctx.config['redaction_mode'])
-        documents = [redactor.redact_document(doc) for doc in documents]
+        documents = redactor.redact_documents(documents)
 
     click.echo(f"Analyzing {len(documents)} documents...")
 
@@ -278,7 +276,7 @@ def report(ctx, output_format: str, output_dir: str, input_dir: Optional[str]):
         loader = DataLoader()
         documents = loader.load_all(Path(input_dir))
         redactor = Redactor(mode=ctx.config['redaction_mode'])
-        documents = [redactor.redact_document(doc) for doc in documents]
+        documents = redactor.redact_documents(documents)
 
         # Process
         processor = TextProcessor()
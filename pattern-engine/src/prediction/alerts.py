@@ -26,13 +26,62 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from collections import deque
 
+import numpy as np
+
 from .models import Prediction, PredictionType
 
 logger = logging.getLogger(__name__)
 
+# Try to import numba for optional JIT-compiled batch risk scoring
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available, using NumPy batch risk scoring")
+
+
+def _batch_risk_scores_numpy(
+    case_offsets: np.ndarray,
+    weights: np.ndarray,
+    risk_values: np.ndarray,
+) -> np.ndarray:
+    """
+    Weighted mean risk per case over CSR-style flattened predictions.
+
+    Predictions of case i occupy positions case_offsets[i]:case_offsets[i + 1].
+    Cases without predictions or with zero total weight score 0.0.
+    """
+    n_cases = case_offsets.size - 1
+    case_index = np.repeat(np.arange(n_cases), np.diff(case_offsets))
+    weighted_sum = np.bincount(case_index, weights=weights * risk_values, minlength=n_cases)
+    total_weight = np.bincount(case_index, weights=weights, minlength=n_cases)
+    scores = np.zeros(n_cases, dtype=np.float64)
+    np.divide(weighted_sum, total_weight, out=scores, where=total_weight != 0)
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _batch_risk_scores(case_offsets, weights, risk_values):  # pragma: no cover - JIT
+        """Numba version of _batch_risk_scores_numpy, parallel across cases."""
+        n_cases = case_offsets.size - 1
+        scores = np.zeros(n_cases, dtype=np.float64)
+        for i in prange(n_cases):
+            weighted_sum = 0.0
+            total_weight = 0.0
+            for j in range(case_offsets[i], case_offsets[i + 1]):
+                weighted_sum += weights[j] * risk_values[j]
+                total_weight += weights[j]
+            if total_weight != 0.0:
+                scores[i] = weighted_sum / total_weight
+        return scores
+else:
+    _batch_risk_scores = _batch_risk_scores_numpy
+
 
 class AlertSeverity(Enum):
     """Severity levels for alerts."""
@@ -55,6 +104,16 @@ class AlertSeverity(Enum):
         return order[self] < order[other]
 
 
+# Comparisons whose breached thresholds form a contiguous run of the
+# ascending-sorted threshold values: (searchsorted side, run is a prefix)
+_SORTED_COMPARISONS = {
+    "gte": ("right", True),   # threshold <= value
+    "gt": ("left", True),     # threshold < value
+    "lte": ("left", False),   # threshold >= value
+    "lt": ("right", False),   # threshold > value
+}
+
+
 class AlertType(Enum):
     """Types of alerts that can be generated."""
 
@@ -66,11 +125,14 @@ class AlertType(Enum):
     THRESHOLD_BREACH = "threshold_breach"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AlertThreshold:
     """
     Configuration for an alert threshold.
 
+    Thresholds are immutable because AlertManager indexes them by value when
+    they are added; use dataclasses.replace() and re-add to change one.
+
     Attributes:
         alert_type: Type of alert this threshold triggers
         prediction_type: Associated prediction type
@@ -351,14 +413,22 @@ class AlertManager:
             config: Alert configuration
         """
         self._config = config or AlertConfig()
-        self._handlers: List[AlertHandler] = []
+        # Keyed by id() so registration is idempotent and lookups are O(1);
+        # dict insertion order keeps dispatch order stable
+        self._handlers: Dict[int, AlertHandler] = {}
         self._thresholds: List[AlertThreshold] = []
+        # Per prediction type and comparison: (sorted threshold values,
+        # positions in _thresholds). Rebuilt when thresholds change.
+        self._threshold_index: Dict[
+            PredictionType, Dict[str, Tuple[np.ndarray, np.ndarray]]
+        ] = {}
         self._alert_history: Dict[str, List[Alert]] = {}
         self._cooldown_tracker: Dict[str, Dict[str, datetime]] = {}
         self._alert_counter = 0
 
         # Set up default thresholds
         self._setup_default_thresholds()
+        self._rebuild_threshold_index()
 
     def _setup_default_thresholds(self) -> None:
         """Set up default alert thresholds based on configuration."""
@@ -416,6 +486,7 @@ class AlertManager:
             threshold: The threshold to add
         """
         self._thresholds.append(threshold)
+        self._rebuild_threshold_index()
         logger.debug(
             f"Added threshold: {threshold.alert_type.value} "
             f"at {threshold.threshold_value}"
@@ -442,8 +513,58 @@ class AlertManager:
             if not (t.alert_type == alert_type and
                     t.prediction_type == prediction_type)
         ]
+        self._rebuild_threshold_index()
         return len(self._thresholds) < original_count
 
+    def _rebuild_threshold_index(self) -> None:
+        """Index thresholds by prediction type and comparison, sorted by value."""
+        positions: Dict[PredictionType, Dict[str, List[int]]] = {}
+        for pos, threshold in enumerate(self._thresholds):
+            positions.setdefault(threshold.prediction_type, {}).setdefault(
+                threshold.comparison, []
+            ).append(pos)
+
+        self._threshold_index = {}
+        for prediction_type, by_comparison in positions.items():
+            index = {}
+            for comparison, pos_list in by_comparison.items():
+                order = np.array(pos_list, dtype=np.intp)
+                values = np.array(
+                    [self._thresholds[pos].threshold_value for pos in pos_list],
+                    dtype=np.float64,
+                )
+                sort = np.argsort(values, kind="stable")
+                index[comparison] = (values[sort], order[sort])
+            self._threshold_index[prediction_type] = index
+
+    def _breached_thresholds(
+        self,
+        prediction_type: PredictionType,
+        value: float
+    ) -> List[AlertThreshold]:
+        """
+        Find thresholds breached by a value, in registration order.
+
+        Uses binary search over the sorted threshold values, so the cost is
+        O(log K) per comparison kind instead of checking every threshold.
+        """
+        if np.isnan(value):
+            return []
+
+        breached: List[int] = []
+        for comparison, (values, order) in self._threshold_index.get(prediction_type, {}).items():
+            if comparison in _SORTED_COMPARISONS:
+                side, is_prefix = _SORTED_COMPARISONS[comparison]
+                cut = int(np.searchsorted(values, value, side=side))
+                breached.extend((order[:cut] if is_prefix else order[cut:]).tolist())
+            else:
+                breached.extend(
+                    pos for pos in order.tolist() if self._thresholds[pos].check(value)
+                )
+
+        breached.sort()
+        return [self._thresholds[pos] for pos in breached]
+
     def add_handler(self, handler: AlertHandler) -> None:
         """
         Add an alert handler.
@@ -451,7 +572,7 @@ class AlertManager:
         Args:
             handler: The handler to add
         """
-        self._handlers.append(handler)
+        self._handlers.setdefault(id(handler), handler)
         logger.debug(f"Added alert handler: {type(handler).__name__}")
 
     def remove_handler(self, handler: AlertHandler) -> bool:
@@ -464,11 +585,19 @@ class AlertManager:
         Returns:
             True if the handler was removed
         """
-        try:
-            self._handlers.remove(handler)
-            return True
-        except ValueError:
-            return False
+        return self._handlers.pop(id(handler), None) is not None
+
+    def has_handler(self, handler: AlertHandler) -> bool:
+        """
+        Check whether a handler is registered.
+
+        Args:
+            handler: The handler to look up
+
+        Returns:
+            True if the handler is registered
+        """
+        return id(handler) in self._handlers
 
     def check_prediction(self, prediction: Prediction) -> List[Alert]:
         """
@@ -488,14 +617,8 @@ class AlertManager:
         else:
             check_value = float(prediction.predicted_value)
 
-        # Check each threshold
-        for threshold in self._thresholds:
-            if threshold.prediction_type != prediction.prediction_type:
-                continue
-
-            if not threshold.check(check_value):
-                continue
-
+        # Check each breached threshold
+        for threshold in self._breached_thresholds(prediction.prediction_type, check_value):
             # Check cooldown
             if self._is_in_cooldown(prediction.case_id, threshold):
                 logger.debug(
@@ -612,7 +735,7 @@ class AlertManager:
 
     def _notify_handlers(self, alert: Alert) -> None:
         """Notify all handlers of an alert."""
-        for handler in self._handlers:
+        for handler in self._handlers.values():
             try:
                 handler.handle(alert)
             except Exception as e:
@@ -764,35 +887,87 @@ class RiskScorer:
         if not predictions:
             return 0.0
 
-        total_weight = 0.0
-        weighted_sum = 0.0
-
-        for prediction in predictions:
-            weight = self._weights.get(prediction.prediction_type, 0.1)
-
-            # Convert prediction to risk value
-            if prediction.probability is not None:
-                risk_value = prediction.probability
-            elif prediction.prediction_type == PredictionType.COMPLETION_TIME:
-                # Higher completion time = higher risk (normalize somehow)
-                # This is a simplification - in practice, compare to SLA
-                risk_value = min(1.0, float(prediction.predicted_value) / 168.0)  # 168 hours = 1 week
-            else:
-                risk_value = float(prediction.predicted_value)
-
-            weighted_sum += weight * risk_value
-            total_weight += weight
+        n = len(predictions)
+        weights = np.fromiter(
+            (self._weights.get(p.prediction_type, 0.1) for p in predictions),
+            dtype=np.float64,
+            count=n,
+        )
+        risk_values = np.fromiter(
+            (self._risk_value(p) for p in predictions),
+            dtype=np.float64,
+            count=n,
+        )
 
+        total_weight = weights.sum()
         if total_weight == 0:
             return 0.0
 
-        score = weighted_sum / total_weight
+        score = float(weights @ risk_values / total_weight)
 
         if normalize:
             score = max(0.0, min(1.0, score))
 
         return score
 
+    def calculate_risk_scores(
+        self,
+        prediction_groups: List[List[Prediction]],
+        normalize: bool = True
+    ) -> np.ndarray:
+        """
+        Calculate composite risk scores for many cases at once.
+
+        Predictions are flattened into CSR-style arrays (offsets + values)
+        and scored in a single pass, JIT-compiled with numba when available.
+
+        Args:
+            prediction_groups: One list of predictions per case
+            normalize: Whether to normalize scores to 0-1 range
+
+        Returns:
+            Array of composite risk scores, one per case, matching
+            calculate_risk_score applied to each group
+        """
+        lengths = np.fromiter(
+            (len(group) for group in prediction_groups),
+            dtype=np.int64,
+            count=len(prediction_groups),
+        )
+        case_offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=case_offsets[1:])
+
+        n = int(case_offsets[-1])
+        weights = np.fromiter(
+            (self._weights.get(p.prediction_type, 0.1)
+             for group in prediction_groups for p in group),
+            dtype=np.float64,
+            count=n,
+        )
+        risk_values = np.fromiter(
+            (self._risk_value(p) for group in prediction_groups for p in group),
+            dtype=np.float64,
+            count=n,
+        )
+
+        scores = _batch_risk_scores(case_offsets, weights, risk_values)
+
+        if normalize:
+            np.clip(scores, 0.0, 1.0, out=scores)
+
+        return scores
+
+    @staticmethod
+    def _risk_value(prediction: Prediction) -> float:
+        """Convert a prediction to a risk value."""
+        if prediction.probability is not None:
+            return prediction.probability
+        if prediction.prediction_type == PredictionType.COMPLETION_TIME:
+            # Higher completion time = higher risk (normalize somehow)
+            # This is a simplification - in practice, compare to SLA
+            return min(1.0, float(prediction.predicted_value) / 168.0)  # 168 hours = 1 week
+        return float(prediction.predicted_value)
+
     def get_risk_level(self, risk_score: float) -> str:
         """
         Convert a risk score to a risk level.
@@ -23,6 +23,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
@@ -30,6 +31,20 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(timestamp: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp string, memoized.
+
+    SAP event logs repeat the same timestamps across events of a batch
+    (e.g. documents posted in one run), so repeated values become a cache hit.
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 class FeatureType(Enum):
     """Types of features that can be extracted."""
 
@@ -363,10 +378,7 @@ class FeatureExtractor:
         if isinstance(timestamp, datetime):
             return timestamp
         if isinstance(timestamp, str):
-            try:
-                return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            except ValueError:
-                return None
+            return _parse_iso_timestamp(timestamp)
         return None
 
     def _extract_temporal_features(
@@ -20,7 +20,28 @@ import hashlib
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Pattern, Tuple, Match
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Match
+
+
+# Separator used to join text leaves for batch redaction. NUL is not a word
+# character, not whitespace and not part of any pattern's character class, so
+# no match can span two leaves and word boundaries behave as at string edges.
+_BATCH_SEPARATOR = "\x00"
+
+
+def _passthrough_text(text: str) -> str:
+    """Return text unchanged (raw_local redact_text)."""
+    return text
+
+
+def _copy_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of the document (raw_local redact_document)."""
+    return doc.copy()
+
+
+def _copy_documents(docs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return shallow copies of the documents (raw_local redact_documents)."""
+    return [doc.copy() for doc in docs]
 
 
 class RedactionMode(Enum):
@@ -130,6 +151,15 @@ class Redactor:
         re.compile(r'\b(?:SO|DO|DL|IV|PO|PR|SA)\d{8,10}\b'),
     ]
 
+    # Cheap pre-check: every pattern above needs a digit, an "@", or one of
+    # these keywords to match. Text without any of them is returned untouched
+    # without running the individual pattern passes.
+    PII_TRIGGER_PATTERN = re.compile(
+        r'[\d@]|\b(?:Mr|Ms|Dr|Prof|Contact|Attn|Attention|Name|Signed|Approved by|'
+        r'Requested by|Created by|ERNAM|ERDAT|AENAM|AEDAT|Purchase\s*Order|PO\s*N)',
+        re.IGNORECASE
+    )
+
     def __init__(
         self,
         mode: str = "shareable",
@@ -159,6 +189,13 @@ class Redactor:
         self._hash_cache_max_size: int = 100000  # Limit to 100K entries
         self._hash_cache_order: List[str] = []  # Track insertion order for eviction
 
+        # Raw-local instances never redact: bind the no-op variants once here
+        # instead of checking the mode on every call
+        if self.config.mode == RedactionMode.RAW_LOCAL:
+            self.redact_text = _passthrough_text
+            self.redact_document = _copy_document
+            self.redact_documents = _copy_documents
+
     def redact_text(self, text: str) -> str:
         """
         Redact sensitive information from text.
@@ -169,7 +206,10 @@ class Redactor:
         Returns:
             Redacted text with sensitive info replaced
         """
-        if not text or self.config.mode == RedactionMode.RAW_LOCAL:
+        if not text:
+            return text
+
+        if not self.PII_TRIGGER_PATTERN.search(text):
             return text
 
         result = text
@@ -227,8 +267,10 @@ class Redactor:
 
     def _restore_and_hash_sap_docs(self, text: str, placeholders: Dict[str, str]) -> str:
         """Restore SAP doc number placeholders and hash them."""
-        result = text
+        if not placeholders:
+            return text
 
+        replacements = {}
         for placeholder, original in placeholders.items():
             # Hash the original value
             if re.match(r'\d{10}$', original):
@@ -248,9 +290,14 @@ class Redactor:
                 self.stats.sap_docs_hashed += 1
                 self.stats.total_redactions += 1
 
-            result = result.replace(placeholder, hashed)
+            replacements[placeholder] = hashed
 
-        return result
+        # Single pass over the text so batched input stays linear in size
+        return re.sub(
+            r'__SAP_DOC_\d+__',
+            lambda m: replacements.get(m.group(0), m.group(0)),
+            text,
+        )
 
     def redact_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -262,11 +309,87 @@ class Redactor:
         Returns:
             New document with redacted values
         """
-        if self.config.mode == RedactionMode.RAW_LOCAL:
-            return doc.copy()
-
         return self._redact_dict(doc)
 
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Redact line-structured text incrementally.
+
+        Accepts any iterable of text chunks (e.g. an open file, which yields
+        lines) and yields redacted lines as soon as they are complete. Each
+        line is redacted independently, so peak memory is bounded by the
+        longest line rather than the whole text. Patterns therefore never
+        match across line breaks.
+
+        Args:
+            chunks: Iterable of text chunks; need not be aligned to lines
+
+        Yields:
+            Redacted lines, including their trailing newline
+        """
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            end = pending.rfind("\n")
+            if end < 0:
+                continue
+            complete, pending = pending[:end], pending[end + 1:]
+            for line in complete.split("\n"):
+                yield self.redact_text(line) + "\n"
+        if pending:
+            yield self.redact_text(pending)
+
+    def redact_documents(self, docs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Redact a batch of document dictionaries.
+
+        All string leaves of all documents are joined into a single text and
+        redacted in one pass, so the per-pattern regex dispatch cost is paid
+        once per batch instead of once per leaf. Output and statistics are
+        identical to calling redact_document on each document.
+
+        Args:
+            docs: Iterable of document dictionaries to redact
+
+        Returns:
+            List of new documents with redacted values
+        """
+        docs = list(docs)
+
+        leaves: List[str] = []
+        for doc in docs:
+            self._collect_leaves(doc, leaves)
+
+        if any(_BATCH_SEPARATOR in leaf for leaf in leaves):
+            # Cannot split safely; fall back to per-document redaction
+            return [self._redact_dict(doc) for doc in docs]
+
+        redacted = self.redact_text(_BATCH_SEPARATOR.join(leaves)).split(_BATCH_SEPARATOR)
+        redacted_iter = iter(redacted)
+        return [self._rebuild(doc, redacted_iter) for doc in docs]
+
+    def _collect_leaves(self, value: Any, leaves: List[str]) -> None:
+        """Append all non-empty string leaves of a nested value in traversal order."""
+        if isinstance(value, str):
+            if value:
+                leaves.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self._collect_leaves(item, leaves)
+        elif isinstance(value, list):
+            for item in value:
+                self._collect_leaves(item, leaves)
+
+    def _rebuild(self, value: Any, redacted_iter) -> Any:
+        """Rebuild a nested value, taking string leaves from redacted_iter in traversal order."""
+        if isinstance(value, str):
+            return next(redacted_iter) if value else value
+        if isinstance(value, dict):
+            return {key: self._rebuild(item, redacted_iter) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._rebuild(item, redacted_iter) for item in value]
+        return value
+
     def _redact_dict(self, d: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively redact a dictionary."""
         result = {}
@@ -297,22 +420,19 @@ class Redactor:
 
     def _redact_emails(self, text: str) -> str:
         """Redact email addresses."""
-        def replace_email(match):
-            self.stats.emails_redacted += 1
-            self.stats.total_redactions += 1
-            return "[EMAIL]"
-
-        return self.EMAIL_PATTERN.sub(replace_email, text)
+        # subn counts replacements during substitution, without a Python callback per match
+        result, count = self.EMAIL_PATTERN.subn("[EMAIL]", text)
+        self.stats.emails_redacted += count
+        self.stats.total_redactions += count
+        return result
 
     def _redact_phones(self, text: str) -> str:
         """Redact phone numbers."""
         result = text
         for pattern in self.PHONE_PATTERNS:
-            def replace_phone(match):
-                self.stats.phones_redacted += 1
-                self.stats.total_redactions += 1
-                return "[PHONE]"
-            result = pattern.sub(replace_phone, result)
+            result, count = pattern.subn("[PHONE]", result)
+            self.stats.phones_redacted += count
+            self.stats.total_redactions += count
         return result
 
     def _redact_names(self, text: str) -> str:
@@ -338,11 +458,9 @@ class Redactor:
         """Redact physical addresses."""
         result = text
         for pattern in self.ADDRESS_PATTERNS:
-            def replace_address(match):
-                self.stats.addresses_redacted += 1
-                self.stats.total_redactions += 1
-                return "[ADDRESS]"
-            result = pattern.sub(replace_address, result)
+            result, count = pattern.subn("[ADDRESS]", result)
+            self.stats.addresses_redacted += count
+            self.stats.total_redactions += count
         return result
 
     def _redact_po_numbers(self, text: str) -> str:
@@ -494,4 +612,4 @@ def redact_all(
         List of redacted documents
     """
     redactor = Redactor(mode=mode, hash_salt=hash_salt)
-    return [redactor.redact_document(doc) for doc in data]
+    return redactor.redact_documents(data)
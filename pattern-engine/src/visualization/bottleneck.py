@@ -12,21 +12,36 @@ by identifying where process delays occur.
 """
 
 import logging
-import math
-from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from .event_log import extract_transition_arrays, group_transitions
+
 logger = logging.getLogger(__name__)
 
 
-class BottleneckLevel(Enum):
-    """Performance level for process transitions."""
-    FAST = "fast"       # Green - below median
-    MEDIUM = "medium"   # Yellow - between median and 85th percentile
-    SLOW = "slow"       # Red - above 85th percentile (bottleneck)
+class BottleneckLevel(IntEnum):
+    """
+    Performance level for process transitions.
+
+    Levels are ordered integer codes, so they compare by severity and can be
+    stored and filtered as NumPy int8 arrays. `label` gives the lowercase
+    name used in serialized output and style tables.
+    """
+    FAST = 0     # Green - below median
+    MEDIUM = 1   # Yellow - between median and 85th percentile
+    SLOW = 2     # Red - above 85th percentile (bottleneck)
+
+    @property
+    def label(self) -> str:
+        """Lowercase level name, e.g. 'slow'."""
+        return self.name.lower()
+
+    def __str__(self) -> str:
+        return self.label
 
 
 @dataclass
@@ -59,44 +74,22 @@ class TransitionMetrics:
         if not self.durations_hours:
             return
 
-        sorted_durations = sorted(self.durations_hours)
-        n = len(sorted_durations)
-
-        self.mean_hours = sum(sorted_durations) / n
-        self.min_hours = sorted_durations[0]
-        self.max_hours = sorted_durations[-1]
+        durations = np.asarray(self.durations_hours, dtype=np.float64)
 
-        # Median (p50)
-        if n % 2 == 0:
-            self.median_hours = (sorted_durations[n // 2 - 1] + sorted_durations[n // 2]) / 2
-        else:
-            self.median_hours = sorted_durations[n // 2]
+        self.mean_hours = float(durations.mean())
+        self.min_hours = float(durations.min())
+        self.max_hours = float(durations.max())
 
+        # Linear-interpolated percentiles; p50 is the median
+        p50, p85, p95 = np.percentile(durations, [50, 85, 95])
+        self.median_hours = float(p50)
         self.p50_hours = self.median_hours
+        self.p85_hours = float(p85)
+        self.p95_hours = float(p95)
 
-        # Standard deviation
-        if n > 1:
-            variance = sum((x - self.mean_hours) ** 2 for x in sorted_durations) / (n - 1)
-            self.std_hours = math.sqrt(variance)
-
-        # Percentiles
-        self.p85_hours = self._percentile(sorted_durations, 85)
-        self.p95_hours = self._percentile(sorted_durations, 95)
-
-    def _percentile(self, sorted_data: List[float], p: int) -> float:
-        """Calculate percentile from sorted data."""
-        if not sorted_data:
-            return 0.0
-
-        n = len(sorted_data)
-        k = (n - 1) * p / 100
-        f = math.floor(k)
-        c = math.ceil(k)
-
-        if f == c:
-            return sorted_data[int(k)]
-
-        return sorted_data[int(f)] * (c - k) + sorted_data[int(c)] * (k - f)
+        # Sample standard deviation
+        if durations.size > 1:
+            self.std_hours = float(durations.std(ddof=1))
 
     @property
     def mean_days(self) -> float:
@@ -136,7 +129,7 @@ class TransitionMetrics:
             "p50_hours": self.p50_hours,
             "p85_hours": self.p85_hours,
             "p95_hours": self.p95_hours,
-            "level": self.level.value if self.level else None,
+            "level": self.level.label if self.level is not None else None,
         }
 
 
@@ -162,6 +155,11 @@ class BottleneckAnalysis:
     medium_percentile: int = 50
     slow_percentile: int = 85
 
+    @classmethod
+    def empty(cls, medium_percentile: int = 50, slow_percentile: int = 85) -> "BottleneckAnalysis":
+        """Create the result for an event log without events."""
+        return cls(medium_percentile=medium_percentile, slow_percentile=slow_percentile)
+
     def get_bottlenecks(self) -> List[TransitionMetrics]:
         """Get all transitions classified as bottlenecks (slow)."""
         return [
@@ -171,9 +169,12 @@ class BottleneckAnalysis:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get analysis summary."""
-        fast_count = sum(1 for m in self.transitions.values() if m.level == BottleneckLevel.FAST)
-        medium_count = sum(1 for m in self.transitions.values() if m.level == BottleneckLevel.MEDIUM)
-        slow_count = sum(1 for m in self.transitions.values() if m.level == BottleneckLevel.SLOW)
+        levels = np.fromiter(
+            (m.level for m in self.transitions.values() if m.level is not None), dtype=np.int8
+        )
+        fast_count, medium_count, slow_count = np.bincount(
+            levels, minlength=len(BottleneckLevel)
+        ).tolist()
 
         bottlenecks = self.get_bottlenecks()
         worst_bottleneck = max(bottlenecks, key=lambda m: m.mean_hours) if bottlenecks else None
@@ -250,147 +251,71 @@ class BottleneckAnalyzer:
         Returns:
             BottleneckAnalysis with per-transition metrics and classifications
         """
-        analysis = BottleneckAnalysis(
-            medium_percentile=self.medium_percentile,
-            slow_percentile=self.slow_percentile,
-        )
+        analysis = BottleneckAnalysis.empty(self.medium_percentile, self.slow_percentile)
 
-        # Group events by case
-        cases: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        if not events:
+            logger.warning("No cases found in events")
+            return analysis
 
-        for event in events:
-            case_id = event.get("case_id") or event.get("order_id") or event.get("document_number")
-            if case_id:
-                cases[case_id].append(event)
+        transitions = extract_transition_arrays(events)
 
-        analysis.total_cases = len(cases)
+        analysis.total_cases = transitions.total_cases
         analysis.total_events = len(events)
 
-        if not cases:
+        if not transitions.total_cases:
             logger.warning("No cases found in events")
             return analysis
 
-        # Sort events within each case by timestamp
-        for case_id in cases:
-            cases[case_id].sort(key=lambda e: self._parse_timestamp(e.get("timestamp")))
-
-        # Extract all transition durations
-        transition_durations: Dict[Tuple[str, str], List[float]] = defaultdict(list)
-
-        for case_id, case_events in cases.items():
-            for i in range(len(case_events) - 1):
-                from_event = case_events[i]
-                to_event = case_events[i + 1]
-
-                from_type = from_event.get("type") or from_event.get("event_type")
-                to_type = to_event.get("type") or to_event.get("event_type")
-
-                if not from_type or not to_type:
-                    continue
-
-                from_ts = self._parse_timestamp(from_event.get("timestamp") or from_event.get("time"))
-                to_ts = self._parse_timestamp(to_event.get("timestamp") or to_event.get("time"))
-
-                if from_ts and to_ts:
-                    duration_hours = (to_ts - from_ts).total_seconds() / 3600
-                    if duration_hours >= 0:  # Ignore negative durations
-                        transition_durations[(from_type, to_type)].append(duration_hours)
-
-        if not transition_durations:
+        # Keep transitions with a known, non-negative duration
+        timed = ~np.isnan(transitions.duration_hours)
+        if not timed.any():
             logger.warning("No valid transitions found")
             return analysis
 
-        # Compute statistics for each transition
-        for (from_type, to_type), durations in transition_durations.items():
+        durations = transitions.duration_hours[timed]
+
+        # Compute statistics for each transition, grouped by the interned
+        # (from, to) activity ids
+        for from_type, to_type, group_durations in group_transitions(transitions, timed):
             metrics = TransitionMetrics(
                 from_event=from_type,
                 to_event=to_type,
-                count=len(durations),
-                durations_hours=durations,
+                count=int(group_durations.size),
+                durations_hours=group_durations.tolist(),
             )
             metrics.compute_statistics()
             analysis.transitions[(from_type, to_type)] = metrics
 
         # Compute global thresholds
-        all_durations = []
-        for metrics in analysis.transitions.values():
-            all_durations.extend(metrics.durations_hours)
-
-        if all_durations:
-            sorted_all = sorted(all_durations)
-            analysis.global_p50_hours = self._percentile(sorted_all, self.medium_percentile)
-            analysis.global_p85_hours = self._percentile(sorted_all, self.slow_percentile)
-
-        # Classify each transition
-        for key, metrics in analysis.transitions.items():
-            if metrics.count < self.min_samples:
-                # Not enough samples for classification
-                metrics.level = BottleneckLevel.MEDIUM
-                analysis.transition_levels[key] = BottleneckLevel.MEDIUM
-                continue
-
-            if self.use_global_thresholds:
-                # Use global percentiles
-                p50 = analysis.global_p50_hours
-                p85 = analysis.global_p85_hours
-            else:
-                # Use per-transition percentiles
-                p50 = metrics.p50_hours
-                p85 = metrics.p85_hours
-
-            # Classify based on mean duration
-            if metrics.mean_hours <= p50:
-                metrics.level = BottleneckLevel.FAST
-            elif metrics.mean_hours <= p85:
-                metrics.level = BottleneckLevel.MEDIUM
-            else:
-                metrics.level = BottleneckLevel.SLOW
+        global_p50, global_p85 = np.percentile(
+            durations, [self.medium_percentile, self.slow_percentile]
+        )
+        analysis.global_p50_hours = float(global_p50)
+        analysis.global_p85_hours = float(global_p85)
+
+        # Classify each transition on its mean duration
+        all_metrics = list(analysis.transitions.values())
+        counts = np.array([m.count for m in all_metrics])
+        means = np.array([m.mean_hours for m in all_metrics])
+        if self.use_global_thresholds:
+            p50 = analysis.global_p50_hours
+            p85 = analysis.global_p85_hours
+        else:
+            p50 = np.array([m.p50_hours for m in all_metrics])
+            p85 = np.array([m.p85_hours for m in all_metrics])
+
+        level_codes = np.select(
+            [counts < self.min_samples, means <= p50, means <= p85],
+            [BottleneckLevel.MEDIUM, BottleneckLevel.FAST, BottleneckLevel.MEDIUM],
+            default=BottleneckLevel.SLOW,
+        )
 
+        for (key, metrics), code in zip(analysis.transitions.items(), level_codes.tolist()):
+            metrics.level = BottleneckLevel(code)
             analysis.transition_levels[key] = metrics.level
 
         return analysis
 
-    def _percentile(self, sorted_data: List[float], p: int) -> float:
-        """Calculate percentile from sorted data."""
-        if not sorted_data:
-            return 0.0
-
-        n = len(sorted_data)
-        k = (n - 1) * p / 100
-        f = math.floor(k)
-        c = math.ceil(k)
-
-        if f == c:
-            return sorted_data[int(k)]
-
-        return sorted_data[int(f)] * (c - k) + sorted_data[int(c)] * (k - f)
-
-    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
-        """Parse a timestamp value into datetime."""
-        if value is None:
-            return None
-
-        if isinstance(value, datetime):
-            return value
-
-        if isinstance(value, str):
-            formats = [
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-            ]
-
-            for fmt in formats:
-                try:
-                    return datetime.strptime(value.split("+")[0].split("Z")[0], fmt)
-                except ValueError:
-                    continue
-
-        return None
-
 
 def analyze_bottlenecks(
     events: List[Dict[str, Any]],
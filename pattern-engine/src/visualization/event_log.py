@@ -0,0 +1,202 @@
+"""
+Columnar Event Log Preparation for Process Visualizations.
+
+Converts a list of event dictionaries into NumPy arrays of consecutive
+per-case transitions. Timestamps are parsed in bulk into datetime64,
+events are ordered per case with a single lexsort, and activity names are
+interned to integer ids, so the per-event work stays out of the
+interpreter for large event logs.
+
+Event fields:
+- case: 'case_id', falling back to 'order_id' or 'document_number'
+- activity: 'type', falling back to 'event_type'
+- time: 'timestamp', falling back to 'time'
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Microseconds per hour, for converting timedelta64[us] to hours
+_US_PER_HOUR = 3_600_000_000
+
+
+@dataclass
+class TransitionArrays:
+    """
+    Consecutive event-type transitions of an event log, as parallel arrays.
+
+    Transitions are listed case by case (cases in order of first
+    appearance), each case in timestamp order.
+    """
+    activities: List[str]        # Activity name for each id
+    from_ids: np.ndarray         # Activity id of the source event
+    to_ids: np.ndarray           # Activity id of the target event
+    duration_hours: np.ndarray   # NaN when unknown or negative
+    total_cases: int = 0
+
+    def __len__(self) -> int:
+        return len(self.from_ids)
+
+
+def parse_timestamps(values: Sequence[Any]) -> np.ndarray:
+    """
+    Parse timestamp values into a datetime64[us] array.
+
+    Strings are parsed in one vectorized call after dropping any 'Z' or
+    '+hh:mm' suffix; timezone-aware datetimes are converted to UTC.
+    Missing or unparseable values become NaT.
+
+    Args:
+        values: Timestamp strings, datetimes or None
+
+    Returns:
+        Array of datetime64[us] values
+    """
+    result = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[us]")
+
+    string_pos: List[int] = []
+    strings: List[str] = []
+    for pos, value in enumerate(values):
+        if isinstance(value, str):
+            string_pos.append(pos)
+            strings.append(value.split("+")[0].split("Z")[0])
+        elif isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            result[pos] = np.datetime64(value, "us")
+
+    if strings:
+        try:
+            result[string_pos] = np.array(strings, dtype="datetime64[us]")
+        except ValueError:
+            # At least one malformed value: parse individually
+            for pos, value in zip(string_pos, strings):
+                try:
+                    result[pos] = np.datetime64(value, "us")
+                except ValueError:
+                    pass
+
+    return result
+
+
+def extract_transition_arrays(events: List[Dict[str, Any]]) -> TransitionArrays:
+    """
+    Extract consecutive event-type transitions from an event log.
+
+    Events without a case id are ignored. Within a case, events are ordered
+    by timestamp (stable; events without a timestamp sort last) and every
+    consecutive pair whose events both have a type forms a transition.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        TransitionArrays for all cases
+    """
+    n = len(events)
+    case_index: Dict[Any, int] = {}
+    activity_index: Dict[str, int] = {}
+    case_ids = np.empty(n, dtype=np.int64)
+    activity_ids = np.empty(n, dtype=np.int64)
+    raw_timestamps: List[Any] = []
+
+    for pos, event in enumerate(events):
+        case_id = event.get("case_id") or event.get("order_id") or event.get("document_number")
+        case_ids[pos] = case_index.setdefault(case_id, len(case_index)) if case_id else -1
+
+        activity = event.get("type") or event.get("event_type")
+        activity_ids[pos] = (
+            activity_index.setdefault(activity, len(activity_index)) if activity else -1
+        )
+
+        raw_timestamps.append(event.get("timestamp") or event.get("time"))
+
+    activities = list(activity_index)
+    empty = TransitionArrays(
+        activities=activities,
+        from_ids=np.empty(0, dtype=np.int64),
+        to_ids=np.empty(0, dtype=np.int64),
+        duration_hours=np.empty(0, dtype=np.float64),
+        total_cases=len(case_index),
+    )
+    if n < 2:
+        return empty
+
+    timestamps = parse_timestamps(raw_timestamps)
+    missing = np.isnat(timestamps)
+    ticks = timestamps.view(np.int64)
+    sort_key = np.where(missing, np.iinfo(np.int64).max, ticks)
+
+    # Group by case (first-appearance order), then timestamp; lexsort is stable
+    with_case = np.flatnonzero(case_ids >= 0)
+    order = with_case[np.lexsort((sort_key[with_case], case_ids[with_case]))]
+
+    cases = case_ids[order]
+    acts = activity_ids[order]
+    ticks = ticks[order]
+    missing = missing[order]
+
+    is_transition = (cases[1:] == cases[:-1]) & (acts[:-1] >= 0) & (acts[1:] >= 0)
+    if not is_transition.any():
+        return empty
+
+    duration_hours = (ticks[1:] - ticks[:-1]) / _US_PER_HOUR
+    unknown = missing[1:] | missing[:-1] | (duration_hours < 0)
+    duration_hours[unknown] = np.nan
+
+    return TransitionArrays(
+        activities=activities,
+        from_ids=acts[:-1][is_transition],
+        to_ids=acts[1:][is_transition],
+        duration_hours=duration_hours[is_transition],
+        total_cases=len(case_index),
+    )
+
+
+def group_transitions(
+    transitions: TransitionArrays,
+    mask: Optional[np.ndarray] = None,
+) -> List[Tuple[str, str, np.ndarray]]:
+    """
+    Group transition durations by (from, to) activity pair.
+
+    Args:
+        transitions: Transitions from extract_transition_arrays
+        mask: Optional boolean mask selecting the transitions to group
+
+    Returns:
+        List of (from_activity, to_activity, durations) in order of first
+        appearance; durations keep the transitions' order and may hold NaN
+    """
+    from_ids, to_ids, durations = (
+        transitions.from_ids, transitions.to_ids, transitions.duration_hours
+    )
+    if mask is not None:
+        from_ids, to_ids, durations = from_ids[mask], to_ids[mask], durations[mask]
+    if not from_ids.size:
+        return []
+
+    n_activities = len(transitions.activities)
+    unique_keys, first_pos, group = np.unique(
+        from_ids * n_activities + to_ids, return_index=True, return_inverse=True
+    )
+
+    # Renumber groups by first appearance instead of key value
+    appearance = np.argsort(first_pos)
+    rank = np.empty_like(appearance)
+    rank[appearance] = np.arange(appearance.size)
+    group = rank[group.ravel()]
+    unique_keys = unique_keys[appearance]
+
+    grouped = durations[np.argsort(group, kind="stable")]
+    counts = np.bincount(group, minlength=unique_keys.size)
+    splits = np.split(grouped, np.cumsum(counts)[:-1])
+
+    activities = transitions.activities
+    return [
+        (activities[key // n_activities], activities[key % n_activities], group_durations)
+        for key, group_durations in zip(unique_keys.tolist(), splits)
+    ]
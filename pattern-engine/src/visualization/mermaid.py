@@ -18,11 +18,14 @@ Output example:
 """
 
 import logging
-from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
+
+from .event_log import extract_transition_arrays, group_transitions
+
 if TYPE_CHECKING:
     from .bottleneck import BottleneckAnalysis, BottleneckLevel
 
@@ -51,6 +54,20 @@ EVENT_LABELS = {
     "InvoicePosted": "Invoice Posted",
 }
 
+# Position of each event type in the standard flow, for ordering nodes/edges
+_EVENT_RANK = {event: rank for rank, event in enumerate(SAP_O2C_EVENT_ORDER)}
+
+
+def _event_rank(event: str) -> int:
+    """Sort key placing standard O2C events first, in flow order."""
+    return _EVENT_RANK.get(event, 999)
+
+
+@lru_cache(maxsize=4096)
+def _node_label(event: str) -> str:
+    """Display label for an event type node."""
+    return EVENT_LABELS.get(event, event.replace("_", " "))
+
 
 @dataclass
 class TransitionInfo:
@@ -167,8 +184,8 @@ class MermaidGenerator:
             nodes.add(trans.to_event)
 
         # Define node shapes (rounded rectangles for events)
-        for node in sorted(nodes, key=lambda x: SAP_O2C_EVENT_ORDER.index(x) if x in SAP_O2C_EVENT_ORDER else 999):
-            label = EVENT_LABELS.get(node, node.replace("_", " "))
+        for node in sorted(nodes, key=_event_rank):
+            label = _node_label(node)
             lines.append(f"    {node}([{label}])")
 
         lines.append("")
@@ -179,10 +196,7 @@ class MermaidGenerator:
 
         for (from_event, to_event), trans in sorted(
             transitions.items(),
-            key=lambda x: (
-                SAP_O2C_EVENT_ORDER.index(x[0][0]) if x[0][0] in SAP_O2C_EVENT_ORDER else 999,
-                SAP_O2C_EVENT_ORDER.index(x[0][1]) if x[0][1] in SAP_O2C_EVENT_ORDER else 999,
-            )
+            key=lambda x: (_event_rank(x[0][0]), _event_rank(x[0][1])),
         ):
             # Build edge label
             edge_parts = []
@@ -208,8 +222,8 @@ class MermaidGenerator:
                 lines.append(f"    {from_event} --> {to_event}")
 
             # Add style for bottleneck coloring
-            if bottleneck_level:
-                style = self.BOTTLENECK_STYLES.get(bottleneck_level.value, "")
+            if bottleneck_level is not None:
+                style = self.BOTTLENECK_STYLES.get(bottleneck_level.label, "")
                 if style:
                     style_definitions.append(f"    linkStyle {link_index} {style}")
 
@@ -264,77 +278,20 @@ class MermaidGenerator:
         Returns:
             Dictionary mapping (from_event, to_event) to TransitionInfo
         """
-        # Group events by case
-        cases: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-
-        for event in events:
-            case_id = event.get("case_id") or event.get("order_id") or event.get("document_number")
-            if case_id:
-                cases[case_id].append(event)
-
-        # Sort events within each case by timestamp
-        for case_id in cases:
-            cases[case_id].sort(key=lambda e: self._parse_timestamp(e.get("timestamp")))
-
-        # Extract transitions
         transitions: Dict[Tuple[str, str], TransitionInfo] = {}
 
-        for case_id, case_events in cases.items():
-            for i in range(len(case_events) - 1):
-                from_event = case_events[i]
-                to_event = case_events[i + 1]
-
-                from_type = from_event.get("type") or from_event.get("event_type")
-                to_type = to_event.get("type") or to_event.get("event_type")
-
-                if not from_type or not to_type:
-                    continue
-
-                key = (from_type, to_type)
-
-                if key not in transitions:
-                    transitions[key] = TransitionInfo(from_event=from_type, to_event=to_type)
-
-                transitions[key].count += 1
-
-                # Calculate duration if timestamps available
-                from_ts = self._parse_timestamp(from_event.get("timestamp") or from_event.get("time"))
-                to_ts = self._parse_timestamp(to_event.get("timestamp") or to_event.get("time"))
-
-                if from_ts and to_ts:
-                    duration_hours = (to_ts - from_ts).total_seconds() / 3600
-                    if duration_hours >= 0:  # Ignore negative durations
-                        transitions[key].durations.append(duration_hours)
+        arrays = extract_transition_arrays(events)
+        for from_type, to_type, durations in group_transitions(arrays):
+            transitions[(from_type, to_type)] = TransitionInfo(
+                from_event=from_type,
+                to_event=to_type,
+                # Durations are NaN when unknown or negative
+                durations=durations[~np.isnan(durations)].tolist(),
+                count=int(durations.size),
+            )
 
         return transitions
 
-    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
-        """Parse a timestamp value into datetime."""
-        if value is None:
-            return None
-
-        if isinstance(value, datetime):
-            return value
-
-        if isinstance(value, str):
-            # Try common formats
-            formats = [
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-            ]
-
-            for fmt in formats:
-                try:
-                    return datetime.strptime(value.split("+")[0].split("Z")[0], fmt)
-                except ValueError:
-                    continue
-
-        return None
-
     def _empty_diagram(self, title: Optional[str] = None) -> str:
         """Generate an empty diagram placeholder."""
         lines = []
@@ -12,6 +12,7 @@ Tests cover:
 
 import pytest
 import numpy as np
+import dataclasses
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 import tempfile
@@ -282,6 +283,18 @@ class TestFeatureExtractor:
         missing = result.get_feature("non_existent")
         assert missing is None
 
+    def test_parse_timestamp_formats(self, extractor):
+        """Test timestamp parsing of strings, datetimes and invalid values."""
+        parsed = extractor._parse_timestamp("2024-01-15T10:00:00Z")
+        assert parsed == datetime.fromisoformat("2024-01-15T10:00:00+00:00")
+        # Repeated values yield the same (cached) result
+        assert extractor._parse_timestamp("2024-01-15T10:00:00Z") is parsed
+
+        now = datetime.now()
+        assert extractor._parse_timestamp(now) is now
+        assert extractor._parse_timestamp("not-a-date") is None
+        assert extractor._parse_timestamp(None) is None
+
 
 class TestConvenienceFeatureFunctions:
     """Tests for feature extraction convenience functions."""
@@ -731,6 +744,24 @@ class TestAlertThreshold:
         assert threshold.check(12.0) is True
         assert threshold.check(24.0) is False
 
+    def test_threshold_is_immutable(self):
+        """Test thresholds cannot change after being indexed by a manager."""
+        threshold = AlertThreshold(
+            alert_type=AlertType.SLA_WARNING,
+            prediction_type=PredictionType.COMPLETION_TIME,
+            threshold_value=24.0,
+            comparison="lt"
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            threshold.threshold_value = 48.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            threshold.comparison = "gt"
+
+        changed = dataclasses.replace(threshold, threshold_value=48.0)
+        assert changed.check(36.0) is True
+        assert threshold.check(36.0) is False
+
 
 class TestAlert:
     """Tests for Alert class."""
@@ -955,7 +986,26 @@ class TestAlertManager:
         handler = QueueAlertHandler()
         manager.add_handler(handler)
 
-        assert handler in manager._handlers
+        assert manager.has_handler(handler)
+
+    def test_add_handler_is_idempotent(self, manager, high_risk_prediction):
+        """Test registering the same handler twice dispatches once."""
+        handler = QueueAlertHandler()
+        manager.add_handler(handler)
+        manager.add_handler(handler)
+
+        alerts = manager.check_prediction(high_risk_prediction)
+
+        assert handler.size == len(alerts)
+
+    def test_remove_handler(self, manager):
+        """Test removing alert handler."""
+        handler = QueueAlertHandler()
+        manager.add_handler(handler)
+
+        assert manager.remove_handler(handler) is True
+        assert not manager.has_handler(handler)
+        assert manager.remove_handler(handler) is False
 
     def test_handler_receives_alerts(self, manager, high_risk_prediction):
         """Test handlers receive generated alerts."""
@@ -979,6 +1029,35 @@ class TestAlertManager:
 
         assert threshold in manager._thresholds
 
+    def test_breached_thresholds_match_linear_check(self, manager):
+        """Test indexed threshold lookup agrees with checking each threshold."""
+        for value, comparison in [(50.0, "gt"), (100.0, "gte"), (10.0, "lt"),
+                                  (20.0, "lte"), (75.0, "eq"), (100.0, "gt")]:
+            manager.add_threshold(AlertThreshold(
+                alert_type=AlertType.SLA_WARNING,
+                prediction_type=PredictionType.COMPLETION_TIME,
+                threshold_value=value,
+                comparison=comparison,
+            ))
+
+        for check_value in [0.0, 10.0, 15.0, 20.0, 50.0, 75.0, 100.0, 150.0]:
+            expected = [
+                t for t in manager._thresholds
+                if t.prediction_type == PredictionType.COMPLETION_TIME
+                and t.check(check_value)
+            ]
+            assert manager._breached_thresholds(
+                PredictionType.COMPLETION_TIME, check_value
+            ) == expected
+
+    def test_remove_threshold_updates_lookup(self, manager, high_risk_prediction):
+        """Test removed thresholds no longer generate alerts."""
+        assert manager.remove_threshold(
+            AlertType.LATE_DELIVERY_RISK, PredictionType.LATE_DELIVERY
+        )
+
+        assert manager.check_prediction(high_risk_prediction) == []
+
     def test_check_predictions_batch(self, manager, high_risk_prediction, low_risk_prediction):
         """Test checking multiple predictions."""
         alerts = manager.check_predictions([high_risk_prediction, low_risk_prediction])
@@ -1098,6 +1177,40 @@ class TestRiskScorer:
 
         assert 0.0 <= score <= 1.0
 
+    def test_calculate_risk_scores_matches_single(self, scorer):
+        """Test batch risk scores equal per-case scores."""
+        groups = [
+            [
+                Prediction(case_id="case_001", prediction_type=PredictionType.LATE_DELIVERY,
+                           predicted_value=True, probability=0.9),
+                Prediction(case_id="case_001", prediction_type=PredictionType.CREDIT_HOLD,
+                           predicted_value=True, probability=0.7),
+            ],
+            [],
+            [
+                Prediction(case_id="case_003", prediction_type=PredictionType.COMPLETION_TIME,
+                           predicted_value=84.0),
+            ],
+        ]
+
+        scores = scorer.calculate_risk_scores(groups)
+
+        assert scores.shape == (3,)
+        expected = [scorer.calculate_risk_score(group) for group in groups]
+        np.testing.assert_allclose(scores, expected)
+
+    def test_batch_risk_scores_numpy_fallback(self):
+        """Test the NumPy batch kernel used when numba is unavailable."""
+        from src.prediction.alerts import _batch_risk_scores_numpy
+
+        offsets = np.array([0, 2, 2, 3])
+        weights = np.array([0.5, 0.3, 0.0])
+        risks = np.array([0.9, 0.7, 1.0])
+
+        scores = _batch_risk_scores_numpy(offsets, weights, risks)
+
+        np.testing.assert_allclose(scores, [(0.45 + 0.21) / 0.8, 0.0, 0.0])
+
     def test_get_risk_level(self, scorer):
         """Test converting score to risk level."""
         assert scorer.get_risk_level(0.9) == "critical"
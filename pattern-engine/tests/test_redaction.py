@@ -346,6 +346,68 @@ class TestDocumentRedaction:
 
         assert all("[EMAIL]" in email for email in result["emails"])
 
+    def test_redact_documents_matches_per_document(self):
+        """Test batch redaction yields the same output and stats as per-document calls."""
+        docs = [
+            {"text": "Order 1234567890 for Mr. John Smith", "qty": 5},
+            {"contact": {"email": "a@b.com", "phone": "123-456-7890"}},
+            {"notes": ["PO-ABC-123456", "", "Ship to 90210"], "flag": None},
+            {"text": "No PII here"},
+        ]
+        single = Redactor(mode="shareable")
+        batch = Redactor(mode="shareable")
+
+        expected = [single.redact_document(doc) for doc in docs]
+        result = batch.redact_documents(docs)
+
+        assert result == expected
+        assert batch.get_stats() == single.get_stats()
+
+    def test_redact_documents_no_cross_leaf_matches(self):
+        """Test that patterns never match across adjacent leaves."""
+        redactor = Redactor(mode="shareable")
+        docs = [{"a": "123", "b": "456-7890"}]
+        result = redactor.redact_documents(docs)
+        assert result == docs
+
+    def test_redact_documents_raw_local(self):
+        """Test batch redaction is a no-op copy in raw_local mode."""
+        redactor = Redactor(mode="raw_local")
+        docs = [{"email": "a@b.com"}]
+        result = redactor.redact_documents(docs)
+        assert result == docs
+        assert result[0] is not docs[0]
+
+
+class TestStreamRedaction:
+    """Tests for incremental line-based redaction."""
+
+    def test_redact_stream_lines(self):
+        """Test streaming redaction matches per-line redaction."""
+        lines = ["Contact john@example.com\n", "No PII\n", "Call 123-456-7890"]
+        redactor = Redactor(mode="shareable")
+
+        result = list(redactor.redact_stream(lines))
+
+        assert result == ["Contact [EMAIL]\n", "No PII\n", "Call [PHONE]"]
+
+    def test_redact_stream_unaligned_chunks(self):
+        """Test chunks that split lines mid-token are reassembled first."""
+        chunks = ["Contact jo", "hn@example.com\nCall 123-4", "56-7890\n"]
+        redactor = Redactor(mode="shareable")
+
+        result = "".join(redactor.redact_stream(chunks))
+
+        assert result == "Contact [EMAIL]\nCall [PHONE]\n"
+        assert redactor.get_stats()['emails_redacted'] == 1
+        assert redactor.get_stats()['phones_redacted'] == 1
+
+    def test_redact_stream_raw_local(self):
+        """Test streaming in raw_local mode passes text through."""
+        redactor = Redactor(mode="raw_local")
+        text = "a@b.com\n123-456-7890\n"
+        assert "".join(redactor.redact_stream([text])) == text
+
 
 class TestRedactionStats:
     """Tests for redaction statistics tracking."""
@@ -388,6 +450,20 @@ class TestEdgeCases:
         result = redactor.redact_text(text)
         assert result == text
 
+    def test_no_trigger_characters_skips_scan(self):
+        """Test text without digits, '@' or keywords is returned unchanged."""
+        redactor = Redactor(mode="shareable")
+        text = "Standard delivery, handle with care"
+        assert redactor.redact_text(text) is text
+        assert redactor.get_stats()['total_redactions'] == 0
+
+    def test_keyword_only_pii_still_redacted(self):
+        """Test PII that contains no digits is not skipped by the pre-check."""
+        redactor = Redactor(mode="shareable")
+        assert redactor.redact_text("Mr. John Smith") == "[NAME]"
+        assert redactor.redact_text("ERNAM: JSMITH") == "ERNAM: [NAME]"
+        assert "ABCDEFG" not in redactor.redact_text("Purchase Order: ABCDEFG")
+
     def test_mixed_pii(self):
         """Test text with various PII types."""
         redactor = Redactor(mode="shareable")
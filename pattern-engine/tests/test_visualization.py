@@ -30,8 +30,8 @@ from src.visualization import (
 )
 
 
-# Test fixtures
-@pytest.fixture
+# Test fixtures (module-scoped: built once and shared, so tests must not mutate them)
+@pytest.fixture(scope="module")
 def sample_events():
     """Sample O2C events for testing."""
     base = datetime(2024, 1, 1, 10, 0, 0)
@@ -43,7 +43,7 @@ def sample_events():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_case_events():
     """Multiple cases for bottleneck analysis."""
     base = datetime(2024, 1, 1, 10, 0, 0)
@@ -161,12 +161,175 @@ class TestBottleneckAnalyzer:
 
         assert analysis is not None
 
+    def test_analyze_empty_events_result(self):
+        """Test empty input yields a fresh, empty analysis with the thresholds."""
+        analyzer = BottleneckAnalyzer(percentile_thresholds=(40, 80))
+        first = analyzer.analyze([])
+        second = analyzer.analyze([])
+
+        assert first is not second
+        assert first.transitions == {}
+        assert first.total_cases == 0
+        assert first.total_events == 0
+        assert (first.medium_percentile, first.slow_percentile) == (40, 80)
+        assert first.get_summary()["worst_bottleneck"] is None
+
     def test_convenience_function(self, multi_case_events):
         """Test analyze_bottlenecks convenience function."""
         analysis = analyze_bottlenecks(multi_case_events)
 
         assert analysis is not None
 
+    def test_transition_statistics(self, multi_case_events):
+        """Test per-transition statistics and case ordering."""
+        analysis = BottleneckAnalyzer().analyze(list(reversed(multi_case_events)))
+
+        assert analysis.total_cases == 5
+        assert analysis.total_events == 20
+        assert list(analysis.transitions) == [
+            ("OrderCreated", "DeliveryCreated"),
+            ("DeliveryCreated", "GoodsIssued"),
+            ("GoodsIssued", "InvoiceCreated"),
+        ]
+
+        metrics = analysis.transitions[("OrderCreated", "DeliveryCreated")]
+        assert metrics.count == 5
+        assert metrics.durations_hours == [144.0, 120.0, 96.0, 72.0, 48.0]
+        assert metrics.mean_hours == pytest.approx(96.0)
+        assert metrics.median_hours == pytest.approx(96.0)
+        assert metrics.min_hours == pytest.approx(48.0)
+        assert metrics.max_hours == pytest.approx(144.0)
+        assert metrics.p85_hours == pytest.approx(129.6)
+
+    def test_statistics_match_compute_statistics(self):
+        """Test analyzer statistics agree with TransitionMetrics.compute_statistics."""
+        base = datetime(2024, 1, 1)
+        events = []
+        for case in range(7):
+            to_b = base + timedelta(hours=case * case + 1)
+            events += [
+                {"case_id": f"C{case}", "type": "A", "timestamp": base.isoformat()},
+                {"case_id": f"C{case}", "type": "B", "timestamp": to_b.isoformat()},
+                {"case_id": f"C{case}", "type": "C",
+                 "timestamp": (to_b + timedelta(hours=(case % 3) * 5)).isoformat()},
+            ]
+        events += [
+            {"case_id": "C7", "type": "A", "timestamp": base.isoformat()},
+            {"case_id": "C7", "type": "D", "timestamp": (base + timedelta(hours=3)).isoformat()},
+        ]
+
+        analysis = BottleneckAnalyzer().analyze(events)
+        assert len(analysis.transitions) == 3
+
+        for metrics in analysis.transitions.values():
+            expected = TransitionMetrics(
+                from_event=metrics.from_event,
+                to_event=metrics.to_event,
+                count=metrics.count,
+                durations_hours=list(metrics.durations_hours),
+            )
+            expected.compute_statistics()
+            for name in ("mean_hours", "median_hours", "std_hours", "min_hours",
+                         "max_hours", "p50_hours", "p85_hours", "p95_hours"):
+                assert getattr(metrics, name) == pytest.approx(getattr(expected, name))
+
+    def test_transition_levels(self, multi_case_events):
+        """Test classification against global percentile thresholds."""
+        analysis = BottleneckAnalyzer().analyze(multi_case_events)
+
+        assert analysis.global_p50_hours == pytest.approx(72.0)
+        assert analysis.global_p85_hours == pytest.approx(120.0)
+        assert analysis.transition_levels == {
+            ("OrderCreated", "DeliveryCreated"): BottleneckLevel.MEDIUM,
+            ("DeliveryCreated", "GoodsIssued"): BottleneckLevel.FAST,
+            ("GoodsIssued", "InvoiceCreated"): BottleneckLevel.MEDIUM,
+        }
+
+    def test_transition_levels_slow(self):
+        """Test a transition above the slow percentile is a bottleneck."""
+        base = datetime(2024, 1, 1)
+        events = []
+        for i in range(20):
+            events.extend([
+                {"case_id": f"C{i}", "type": "A", "timestamp": base.isoformat()},
+                {"case_id": f"C{i}", "type": "B", "timestamp": (base + timedelta(hours=1)).isoformat()},
+            ])
+        for i in range(3):
+            events.extend([
+                {"case_id": f"S{i}", "type": "A", "timestamp": base.isoformat()},
+                {"case_id": f"S{i}", "type": "C", "timestamp": (base + timedelta(days=9)).isoformat()},
+            ])
+
+        analysis = BottleneckAnalyzer().analyze(events)
+
+        assert analysis.transition_levels[("A", "B")] == BottleneckLevel.FAST
+        assert analysis.transition_levels[("A", "C")] == BottleneckLevel.SLOW
+        assert [m.to_event for m in analysis.get_bottlenecks()] == ["C"]
+
+    def test_min_samples_classified_medium(self, sample_events):
+        """Test transitions with too few samples default to medium."""
+        analysis = BottleneckAnalyzer(min_samples=3).analyze(sample_events)
+
+        assert set(analysis.transition_levels.values()) == {BottleneckLevel.MEDIUM}
+
+    def test_missing_timestamp_has_no_duration(self):
+        """Test events without timestamps still order but yield no duration."""
+        events = [
+            {"case_id": "ORDER001", "type": "InvoiceCreated"},
+            {"case_id": "ORDER001", "type": "OrderCreated", "timestamp": "2024-01-01T10:00:00Z"},
+            {"case_id": "ORDER001", "type": "DeliveryCreated", "time": "2024-01-02 10:00:00"},
+        ]
+
+        analysis = BottleneckAnalyzer().analyze(events)
+
+        assert list(analysis.transitions) == [("OrderCreated", "DeliveryCreated")]
+        assert analysis.transitions[("OrderCreated", "DeliveryCreated")].mean_hours == 24.0
+
+
+class TestEventLog:
+    """Tests for columnar event log preparation."""
+
+    def test_parse_timestamps_formats(self):
+        """Test bulk parsing of supported timestamp forms."""
+        from src.visualization.event_log import parse_timestamps
+
+        parsed = parse_timestamps([
+            "2024-01-01T10:00:00",
+            "2024-01-01T10:00:00.500000Z",
+            "2024-01-01 10:00:00+02:00",
+            "2024-01-01",
+            datetime(2024, 1, 1, 10, 0, 0),
+            None,
+            "not a date",
+        ])
+
+        assert parsed.dtype == "datetime64[us]"
+        assert str(parsed[0]) == "2024-01-01T10:00:00.000000"
+        assert str(parsed[1]) == "2024-01-01T10:00:00.500000"
+        assert str(parsed[2]) == "2024-01-01T10:00:00.000000"
+        assert str(parsed[3]) == "2024-01-01T00:00:00.000000"
+        assert parsed[4] == parsed[0]
+        assert str(parsed[5]) == "NaT"
+        assert str(parsed[6]) == "NaT"
+
+    def test_extract_transition_arrays(self, sample_events):
+        """Test transitions are extracted in timestamp order per case."""
+        from src.visualization.event_log import extract_transition_arrays
+
+        arrays = extract_transition_arrays(list(reversed(sample_events)))
+
+        pairs = [
+            (arrays.activities[f], arrays.activities[t])
+            for f, t in zip(arrays.from_ids, arrays.to_ids)
+        ]
+        assert pairs == [
+            ("OrderCreated", "DeliveryCreated"),
+            ("DeliveryCreated", "GoodsIssued"),
+            ("GoodsIssued", "InvoiceCreated"),
+        ]
+        assert arrays.duration_hours.tolist() == [48.0, 24.0, 48.0]
+        assert arrays.total_cases == 1
+
 
 class TestBottleneckLevel:
     """Tests for BottleneckLevel enum."""
@@ -183,6 +346,20 @@ class TestBottleneckLevel:
         levels = [BottleneckLevel.FAST, BottleneckLevel.MEDIUM, BottleneckLevel.SLOW]
         assert len(levels) == 3
 
+    def test_level_ordering_and_labels(self):
+        """Test levels order by severity and serialize as lowercase labels."""
+        assert BottleneckLevel.FAST < BottleneckLevel.MEDIUM < BottleneckLevel.SLOW
+        assert [level.label for level in BottleneckLevel] == ["fast", "medium", "slow"]
+        assert str(BottleneckLevel.SLOW) == "slow"
+
+    def test_fast_level_is_styled(self, multi_case_events):
+        """Test the FAST level (code 0) still gets its edge style."""
+        analysis = BottleneckAnalyzer().analyze(multi_case_events)
+        diagram = MermaidGenerator().generate(multi_case_events, bottleneck_analysis=analysis)
+
+        assert MermaidGenerator.BOTTLENECK_STYLES["fast"] in diagram
+        assert analysis.to_dict()["transitions"]["DeliveryCreated->GoodsIssued"]["level"] == "fast"
+
 
 class TestTransitionMetrics:
     """Tests for TransitionMetrics dataclass."""
@@ -293,3 +470,20 @@ class TestEdgeCases:
         generator = MermaidGenerator()
         diagram = generator.generate(events)
         assert diagram is not None
+        assert "OrderCreated --> |1.0d| DeliveryCreated" in diagram
+        assert "DeliveryCreated --> |2.0d| InvoiceCreated" in diagram
+
+        dot = GraphVizGenerator().generate(events)
+        assert 'OrderCreated -> DeliveryCreated [label="1.0d"]' in dot
+        assert 'DeliveryCreated -> InvoiceCreated [label="2.0d"]' in dot
+
+    def test_transition_count_without_timestamps(self):
+        """Test transitions without timestamps are counted but untimed."""
+        events = [
+            {"case_id": f"ORDER{i}", "type": t}
+            for i in range(2) for t in ("OrderCreated", "DeliveryCreated")
+        ]
+
+        diagram = MermaidGenerator().generate(events, include_timing=True)
+
+        assert "OrderCreated --> |n=2| DeliveryCreated" in diagram
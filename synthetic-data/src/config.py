@@ -8,7 +8,7 @@ SAP Sales & Distribution documents with realistic distributions and patterns.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any
 
 
 @dataclass
@@ -25,11 +25,11 @@ class GeneratorConfig:
     num_users: int = 30
 
     # Organizational structure
-    sales_orgs: List[str] = field(default_factory=lambda: [
+    sales_orgs: list[str] = field(default_factory=lambda: [
         "1000", "1100", "1200", "2000", "2100", "3000", "3100", "4000"
     ])
 
-    plants: List[str] = field(default_factory=lambda: [
+    plants: list[str] = field(default_factory=lambda: [
         "1000", "1100", "1200", "1300", "1400",
         "2000", "2100", "2200",
         "3000", "3100", "3200", "3300",
@@ -37,7 +37,7 @@ class GeneratorConfig:
     ])
 
     # Plant to sales org mapping
-    plant_sales_org_map: Dict[str, List[str]] = field(default_factory=lambda: {
+    plant_sales_org_map: dict[str, list[str]] = field(default_factory=lambda: {
         "1000": ["1000", "1100", "1200", "1300", "1400"],
         "1100": ["1000", "1100", "1200"],
         "1200": ["1000", "1100", "1200"],
@@ -48,11 +48,11 @@ class GeneratorConfig:
         "4000": ["4000", "4100"],
     })
 
-    distribution_channels: List[str] = field(default_factory=lambda: ["10", "20", "30"])
-    divisions: List[str] = field(default_factory=lambda: ["00", "01", "02", "03"])
+    distribution_channels: list[str] = field(default_factory=lambda: ["10", "20", "30"])
+    divisions: list[str] = field(default_factory=lambda: ["00", "01", "02", "03"])
 
     # Document types
-    order_types: Dict[str, float] = field(default_factory=lambda: {
+    order_types: dict[str, float] = field(default_factory=lambda: {
         "OR": 0.70,   # Standard Order
         "ZOR": 0.10,  # Custom Standard Order
         "RE": 0.08,   # Return Order
@@ -61,13 +61,13 @@ class GeneratorConfig:
         "SO": 0.03,   # Rush Order
     })
 
-    delivery_types: Dict[str, float] = field(default_factory=lambda: {
+    delivery_types: dict[str, float] = field(default_factory=lambda: {
         "LF": 0.85,   # Outbound Delivery
         "LO": 0.10,   # Delivery without Reference
         "LR": 0.05,   # Return Delivery
     })
 
-    invoice_types: Dict[str, float] = field(default_factory=lambda: {
+    invoice_types: dict[str, float] = field(default_factory=lambda: {
         "F2": 0.75,   # Invoice
         "RE": 0.10,   # Credit Memo
         "L2": 0.08,   # Debit Memo
@@ -76,7 +76,7 @@ class GeneratorConfig:
     })
 
     # Item counts per document
-    items_per_order: Dict[str, float] = field(default_factory=lambda: {
+    items_per_order: dict[str, float] = field(default_factory=lambda: {
         "1": 0.30,
         "2": 0.25,
         "3": 0.20,
@@ -87,7 +87,7 @@ class GeneratorConfig:
     })
 
     # Delivery split probabilities
-    deliveries_per_order: Dict[str, float] = field(default_factory=lambda: {
+    deliveries_per_order: dict[str, float] = field(default_factory=lambda: {
         "1": 0.70,    # Single delivery
         "2": 0.18,    # Split into 2
         "3": 0.08,    # Split into 3
@@ -99,7 +99,7 @@ class GeneratorConfig:
     end_date: str = "2024-12-31"
 
     # Timing distributions (in days)
-    timing: Dict[str, Any] = field(default_factory=lambda: {
+    timing: dict[str, Any] = field(default_factory=lambda: {
         # Order to requested delivery date
         "requested_delivery": {
             "mean": 7,
@@ -147,7 +147,7 @@ class TextPatternConfig:
     """Configuration for text patterns that correlate with outcomes."""
 
     # Patterns that cause delays (longer cycle times)
-    delay_patterns: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+    delay_patterns: dict[str, dict[str, Any]] = field(default_factory=lambda: {
         "CREDIT HOLD": {"probability": 0.05, "delay_days": (10, 30), "variants": ["CR HLD", "CREDIT-HOLD", "credit hold", "CRED HOLD"]},
         "WAITING APPROVAL": {"probability": 0.04, "delay_days": (5, 20), "variants": ["WAIT APPR", "PENDING APPROVAL", "AWAITING APPR", "waiting approval"]},
         "HOLD": {"probability": 0.03, "delay_days": (7, 25), "variants": ["ON HOLD", "HELD", "hold", "HLD"]},
@@ -157,7 +157,7 @@ class TextPatternConfig:
     })
 
     # Patterns that expedite (shorter cycle times)
-    expedite_patterns: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+    expedite_patterns: dict[str, dict[str, Any]] = field(default_factory=lambda: {
         "EXPEDITE": {"probability": 0.06, "reduction_pct": (30, 50), "variants": ["EXP", "EXPED", "expedite", "EXPD"]},
         "RUSH": {"probability": 0.05, "reduction_pct": (40, 60), "variants": ["RUSH ORDER", "rush", "RSH"]},
         "URGENT": {"probability": 0.04, "reduction_pct": (35, 55), "variants": ["URG", "URGNT", "urgent", "PRIORITY"]},
@@ -166,7 +166,7 @@ class TextPatternConfig:
     })
 
     # Patterns causing multiple deliveries
-    split_patterns: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+    split_patterns: dict[str, dict[str, Any]] = field(default_factory=lambda: {
         "SHIP PARTIAL": {"probability": 0.08, "extra_deliveries": (1, 3), "variants": ["PARTIAL SHIP", "PART SHIP", "ship partial", "PARTIAL"]},
         "BACKORDER": {"probability": 0.06, "extra_deliveries": (1, 2), "variants": ["BO", "BACK ORDER", "backorder", "B/O"]},
         "SPLIT DELIVERY": {"probability": 0.04, "extra_deliveries": (1, 2), "variants": ["SPLIT DEL", "SPLIT SHIP", "split delivery"]},
@@ -174,7 +174,7 @@ class TextPatternConfig:
     })
 
     # Patterns affecting price
-    price_patterns: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+    price_patterns: dict[str, dict[str, Any]] = field(default_factory=lambda: {
         "PRICE OVERRIDE": {"probability": 0.05, "price_factor": (1.05, 1.25), "variants": ["PR OVRD", "MANUAL PRICE", "price override", "OVERRIDE"]},
         "MANUAL PRICE": {"probability": 0.04, "price_factor": (0.90, 1.30), "variants": ["MAN PR", "MANUAL", "manual price"]},
         "DISCOUNT": {"probability": 0.08, "price_factor": (0.75, 0.95), "variants": ["DISC", "DSC", "discount", "SPECIAL PRICE"]},
@@ -182,7 +182,7 @@ class TextPatternConfig:
     })
 
     # Patterns indicating returns/issues
-    return_patterns: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+    return_patterns: dict[str, dict[str, Any]] = field(default_factory=lambda: {
         "RETURN": {"probability": 0.05, "variants": ["RET", "RTN", "return", "RETURNED"]},
         "RMA": {"probability": 0.04, "variants": ["RMA#", "RMA NUMBER", "rma", "RETURN AUTH"]},
         "DAMAGE": {"probability": 0.03, "variants": ["DMG", "DAMAGED", "damage", "DEFECT"]},
@@ -191,7 +191,7 @@ class TextPatternConfig:
     })
 
     # Neutral/noise patterns (common text that doesn't affect outcomes)
-    noise_patterns: List[str] = field(default_factory=lambda: [
+    noise_patterns: list[str] = field(default_factory=lambda: [
         "PO#", "REF:", "Customer request", "Standard order",
         "Per agreement", "As discussed", "Follow up", "Confirmed",
         "Phone order", "Web order", "EDI order", "Email order",
@@ -211,20 +211,20 @@ class TextPatternConfig:
 class CustomerConfig:
     """Configuration for customer master data generation."""
 
-    regions: List[str] = field(default_factory=lambda: [
+    regions: list[str] = field(default_factory=lambda: [
         "NORTH", "SOUTH", "EAST", "WEST", "CENTRAL",
         "NORTHEAST", "SOUTHEAST", "NORTHWEST", "SOUTHWEST",
         "INTERNATIONAL"
     ])
 
-    industries: List[str] = field(default_factory=lambda: [
+    industries: list[str] = field(default_factory=lambda: [
         "MANUFACTURING", "RETAIL", "WHOLESALE", "TECHNOLOGY",
         "HEALTHCARE", "AUTOMOTIVE", "AEROSPACE", "CHEMICALS",
         "CONSUMER_GOODS", "FOOD_BEVERAGE", "PHARMACEUTICAL",
         "ENERGY", "CONSTRUCTION", "LOGISTICS", "GOVERNMENT"
     ])
 
-    tiers: Dict[str, float] = field(default_factory=lambda: {
+    tiers: dict[str, float] = field(default_factory=lambda: {
         "PLATINUM": 0.05,
         "GOLD": 0.15,
         "SILVER": 0.30,
@@ -232,7 +232,7 @@ class CustomerConfig:
     })
 
     # Order frequency by tier (orders per year per customer average)
-    order_frequency_by_tier: Dict[str, Tuple[int, int]] = field(default_factory=lambda: {
+    order_frequency_by_tier: dict[str, tuple[int, int]] = field(default_factory=lambda: {
         "PLATINUM": (50, 200),
         "GOLD": (20, 80),
         "SILVER": (5, 30),
@@ -244,19 +244,19 @@ class CustomerConfig:
 class MaterialConfig:
     """Configuration for material master data generation."""
 
-    categories: List[str] = field(default_factory=lambda: [
+    categories: list[str] = field(default_factory=lambda: [
         "FINISHED_GOODS", "SEMI_FINISHED", "RAW_MATERIAL",
         "TRADING_GOODS", "SERVICES", "SPARE_PARTS"
     ])
 
-    product_groups: List[str] = field(default_factory=lambda: [
+    product_groups: list[str] = field(default_factory=lambda: [
         "ELECTRONICS", "MECHANICAL", "ELECTRICAL", "HYDRAULIC",
         "PNEUMATIC", "CONSUMABLES", "PACKAGING", "CHEMICALS",
         "COMPONENTS", "ASSEMBLIES", "ACCESSORIES", "TOOLS"
     ])
 
     # Price ranges by category
-    price_ranges: Dict[str, Tuple[float, float]] = field(default_factory=lambda: {
+    price_ranges: dict[str, tuple[float, float]] = field(default_factory=lambda: {
         "FINISHED_GOODS": (100.0, 10000.0),
         "SEMI_FINISHED": (50.0, 5000.0),
         "RAW_MATERIAL": (10.0, 500.0),
@@ -266,7 +266,7 @@ class MaterialConfig:
     })
 
     # Weight ranges (kg)
-    weight_ranges: Dict[str, Tuple[float, float]] = field(default_factory=lambda: {
+    weight_ranges: dict[str, tuple[float, float]] = field(default_factory=lambda: {
         "FINISHED_GOODS": (0.5, 100.0),
         "SEMI_FINISHED": (1.0, 200.0),
         "RAW_MATERIAL": (0.1, 50.0),
@@ -282,7 +282,7 @@ class OutputConfig:
 
     output_dir: str = "sample_output"
 
-    files: Dict[str, str] = field(default_factory=lambda: {
+    files: dict[str, str] = field(default_factory=lambda: {
         "sales_orders": "sales_orders.json",
         "deliveries": "deliveries.json",
         "invoices": "invoices.json",
@@ -299,7 +299,7 @@ class OutputConfig:
     include_metadata: bool = True
 
 
-def get_default_config() -> Dict[str, Any]:
+def get_default_config() -> dict[str, Any]:
     """Get all default configuration as a dictionary."""
     return {
         "generator": GeneratorConfig(),
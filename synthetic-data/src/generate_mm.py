@@ -19,16 +19,31 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
-import random
-from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from faker import Faker
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+if __package__:
+    from .record_io import dump_records, row_record
+else:  # Run as a script: python src/generate_mm.py
+    from record_io import dump_records, row_record
 
 
 # =============================================================================
@@ -100,6 +115,35 @@ NOISE_PATTERNS = [
     "Vendor confirmed", "CONF", "ACK", "Acknowledged",
 ]
 
+
+# Pattern tables tried by _generate_text_pattern(), in order, with the
+# category they produce and the statistic they count towards
+_TEXT_PATTERN_TABLES = (
+    (INVOICE_HOLD_PATTERNS, "invoice_hold", "pos_with_invoice_hold_text"),
+    (QTY_DISCREPANCY_PATTERNS, "qty_discrepancy", "pos_with_qty_discrepancy_text"),
+    (QUALITY_PATTERNS, "quality", "pos_with_quality_text"),
+)
+
+# Uniform draws consumed by one _add_text_noise() call: case change, which
+# addition, and the value of the addition
+_NOISE_ROLLS = 3
+
+# Uniform draws consumed by one _generate_text_pattern() call: whether there
+# is text, one per pattern, whether to use noise, the variant pick, and the
+# _NOISE_ROLLS for the chosen text
+_TEXT_ROLLS = (
+    3 + sum(len(patterns) for patterns, _, _ in _TEXT_PATTERN_TABLES) + _NOISE_ROLLS
+)
+
+# Upper bound of the number of items per purchase order
+_MAX_PO_ITEMS = 5
+
+# PO item numbers (EBELP) by 1-based item position
+_EBELP_LABELS = tuple(f"{item * 10:05d}" for item in range(_MAX_PO_ITEMS + 1))
+
+# Purchasing groups (EKGRP) P01-P09
+_PURCHASING_GROUPS = tuple(f"P{group:02d}" for group in range(1, 10))
+
 # =============================================================================
 # ORGANIZATIONAL DATA
 # =============================================================================
@@ -119,15 +163,65 @@ PLANTS = {
 
 STORAGE_LOCATIONS = ["0001", "0002", "0003", "0010", "0020"]
 
+# Struct-of-arrays views of the tables above, indexed by small integer ids
+# so the per-document loop gathers by index instead of walking dicts
+_PORG_CODES = np.array(list(PURCHASING_ORGS))
+_PORG_INDEX = {code: idx for idx, code in enumerate(PURCHASING_ORGS)}
+_PORG_REGION = np.array([info["region"] for info in PURCHASING_ORGS.values()])
+_PORG_CURRENCY = np.array([info["currency"] for info in PURCHASING_ORGS.values()])
+
+_PLANT_CODES = np.array(list(PLANTS))
+_PLANT_PURCH = np.array(
+    [_PORG_INDEX[info["purch_org"]] for info in PLANTS.values()], dtype=np.int8
+)
+
+# Plants per purchasing org id; orgs without plants may use any plant
+_PLANTS_BY_PORG = [
+    _PLANT_CODES[_PLANT_PURCH == idx] if (_PLANT_PURCH == idx).any() else _PLANT_CODES
+    for idx in range(len(_PORG_CODES))
+]
+
 VENDOR_INDUSTRIES = ["MANUFACTURING", "DISTRIBUTOR", "TRADING", "SERVICE"]
 MATERIAL_CATEGORIES = ["RAW", "SEMIFINISHED", "SPARE", "CONSUMABLE"]
 
+# PO creation times fall in business hours, 06:00:00-19:59:59
+_PO_FIRST_SECOND, _PO_END_SECOND = 6 * 3600, 20 * 3600
+_PO_TIME_LABELS = [
+    f"{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+    for second in range(_PO_FIRST_SECOND, _PO_END_SECOND)
+]
+
+# Purchase order document types
+PO_TYPES = {"NB": 0.80, "ZNB": 0.15, "FO": 0.05}
+
+
+def _compile_weights(options: dict[str, float]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compile weighted options into (choices, normalized cumulative weights).
+
+    Sampling is then one searchsorted() of uniform draws, the same draws
+    rng.choice(p=...) makes, without rebuilding the arrays per call.
+    """
+    cdf = np.cumsum(np.fromiter(options.values(), dtype=np.float64, count=len(options)))
+    return np.array(list(options)), cdf / cdf[-1]
+
+
+def _sample_weights(
+    distribution: tuple[np.ndarray, np.ndarray], rng: np.random.Generator, size: int
+) -> np.ndarray:
+    """Draw `size` options from a distribution compiled by _compile_weights()."""
+    choices, cdf = distribution
+    return choices[np.searchsorted(cdf, rng.random(size), side="right")]
+
+
+_PO_TYPE_DIST = _compile_weights(PO_TYPES)
+
 
 # =============================================================================
 # DATA CLASSES FOR OUTPUT
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TextRecord:
     """Text record for header or item texts."""
     text_id: str
@@ -136,9 +230,9 @@ class TextRecord:
     changed_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class POItem:
-    """EKPO-shaped purchase order item."""
+    """EKPO-shaped purchase order item (layout of the PurchaseOrder.items dicts)."""
     ebelp: str  # Item number (00010, 00020, etc.)
     matnr: str  # Material number
     werks: str  # Plant
@@ -147,10 +241,10 @@ class POItem:
     netpr: float  # Net price
     netwr: float  # Net value
     waers: str  # Currency
-    item_texts: List[Dict] = field(default_factory=list)
+    item_texts: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PurchaseOrder:
     """EKKO-shaped purchase order header."""
     ebeln: str  # PO number (10-digit)
@@ -163,13 +257,13 @@ class PurchaseOrder:
     ernam: str  # Created by user
     bedat: str  # Document date
     eindt: str  # Delivery date
-    header_texts: List[Dict] = field(default_factory=list)
-    items: List[Dict] = field(default_factory=list)
+    header_texts: list[dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GRItem:
-    """MSEG-shaped goods receipt item."""
+    """MSEG-shaped goods receipt item (layout of the GoodsReceipt.items dicts)."""
     zeession: str  # Item number
     matnr: str  # Material number
     werks: str  # Plant
@@ -180,7 +274,7 @@ class GRItem:
     ebelp: str  # Reference PO item
 
 
-@dataclass
+@dataclass(slots=True)
 class GoodsReceipt:
     """MKPF-shaped goods receipt header."""
     mblnr: str  # Material document number
@@ -188,12 +282,12 @@ class GoodsReceipt:
     bldat: str  # Document date
     budat: str  # Posting date
     usnam: str  # User name
-    items: List[Dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRItem:
-    """RSEG-shaped invoice receipt item."""
+    """RSEG-shaped invoice receipt item (layout of the InvoiceReceipt.items dicts)."""
     buzei: str  # Item number
     matnr: str  # Material number
     menge: float  # Quantity invoiced
@@ -203,7 +297,7 @@ class IRItem:
     mblnr: str  # Reference GR number
 
 
-@dataclass
+@dataclass(slots=True)
 class InvoiceReceipt:
     """RBKP-shaped invoice receipt header."""
     belnr: str  # Invoice document number
@@ -214,12 +308,12 @@ class InvoiceReceipt:
     rmwwr: float  # Gross invoice amount
     waers: str  # Currency
     zlspr: str  # Payment block (empty or block code)
-    items: List[Dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MMDocFlow:
-    """Document flow record for MM documents."""
+    """Document flow record for MM documents (layout of MMDocFlowTable rows)."""
     vbelv: str  # Preceding document
     posnv: str  # Preceding item
     vbtyp_v: str  # Preceding doc type (F=PO, E=GR, P=IR)
@@ -230,7 +324,70 @@ class MMDocFlow:
     erdat: str  # Creation date
 
 
-@dataclass
+class MMDocFlowTable:
+    """
+    MM document flow records stored column-wise, one list per MMDocFlow field.
+
+    Flows are added a document at a time, repeating the document-level
+    values for each of its items, so no per-flow object is created.
+    """
+
+    COLUMNS = tuple(f.name for f in fields(MMDocFlow))
+
+    def __init__(self) -> None:
+        self.vbelv: list[str] = []
+        self.posnv: list[str] = []
+        self.vbtyp_v: list[str] = []
+        self.vbeln: list[str] = []
+        self.posnn: list[str] = []
+        self.vbtyp_n: list[str] = []
+        self.rfmng: list[float] = []
+        self.erdat: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.vbelv)
+
+    def add_document(
+        self,
+        vbelv: str,
+        vbtyp_v: str,
+        vbeln: str,
+        vbtyp_n: str,
+        erdat: str,
+        posnv: list[str],
+        posnn: list[str],
+        rfmng: list[float],
+    ) -> None:
+        """Add one flow per item from document vbelv to document vbeln."""
+        n = len(posnv)
+        self.vbelv.extend([vbelv] * n)
+        self.posnv.extend(posnv)
+        self.vbtyp_v.extend([vbtyp_v] * n)
+        self.vbeln.extend([vbeln] * n)
+        self.posnn.extend(posnn)
+        self.vbtyp_n.extend([vbtyp_n] * n)
+        self.rfmng.extend(rfmng)
+        self.erdat.extend([erdat] * n)
+
+    def extend(self, other: MMDocFlowTable) -> None:
+        """Append all flows of another table."""
+        for name in self.COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+
+    def columns(self) -> dict[str, list[Any]]:
+        """Column lists by field name, in MMDocFlow field order."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yield each flow as a record dict."""
+        names = self.COLUMNS
+        return (
+            dict(zip(names, values, strict=True))
+            for values in zip(*self.columns().values(), strict=True)
+        )
+
+
+@dataclass(slots=True)
 class Vendor:
     """Vendor master data."""
     lifnr: str  # Vendor number
@@ -238,9 +395,10 @@ class Vendor:
     land1: str  # Country
     brsch: str  # Industry
     ekorg: str  # Purchasing organization
+    waers: str  # Order currency of the purchasing organization
 
 
-@dataclass
+@dataclass(slots=True)
 class MMMaterial:
     """Material master data for MM."""
     matnr: str  # Material number
@@ -250,7 +408,7 @@ class MMMaterial:
     base_price: float  # Base price
 
 
-@dataclass
+@dataclass(slots=True)
 class MMUser:
     """User master data for MM."""
     bname: str  # User ID
@@ -258,6 +416,101 @@ class MMUser:
     ekorg: str  # Purchasing organization
 
 
+@dataclass
+class DocumentDraws:
+    """Per-purchase-order random draws, sampled up front as arrays."""
+    vendor_idx: np.ndarray  # Index into the vendor list
+    po_day: np.ndarray  # PO date, in days after the start date
+    po_time_idx: np.ndarray  # PO creation time, index into _PO_TIME_LABELS
+    delivery_lead_days: np.ndarray  # PO date to requested delivery date
+    gr_delay_days: np.ndarray  # Requested delivery date to goods receipt
+    ir_delay_days: np.ndarray  # Goods receipt to invoice receipt
+    skip_gr: np.ndarray  # No goods receipt (cancelled PO, etc.)
+    skip_ir: np.ndarray  # No invoice receipt yet
+    po_type: np.ndarray  # PO document type (BSART)
+    purchasing_group: np.ndarray  # Index into _PURCHASING_GROUPS
+    text_rolls: np.ndarray  # Header text decision, shape (count, _TEXT_ROLLS)
+    num_items: np.ndarray  # Items on the PO
+
+    # Per-item draws, shape (count, _MAX_PO_ITEMS); only the first
+    # num_items columns of a row are used
+    item_material_idx: np.ndarray  # Index into the material list
+    item_qty: np.ndarray  # Ordered quantity
+    item_plant_roll: np.ndarray  # Uniform draw selecting the plant
+    item_text_roll: np.ndarray  # Uniform draw deciding on an item text
+    item_lgort_idx: np.ndarray  # Index into STORAGE_LOCATIONS for the GR item
+
+    noise_names: list[str]  # Person names for text noise
+
+
+def _make_faker(seed: int) -> Faker:
+    """
+    Create a seeded Faker instance.
+
+    Faker is imported here rather than at module level because loading its
+    providers is slow, and importing this module for its tables and data
+    classes does not need it.
+    """
+    from faker import Faker
+
+    Faker.seed(seed)
+    return Faker()
+
+
+# POs generated between progress messages
+PROGRESS_INTERVAL = 1000
+
+# Rows per Parquet row group; also bounds the record dicts held at once
+PARQUET_ROW_GROUP_SIZE = 64_000
+
+
+def _arrow_schema(cls: type, keys: tuple[str, ...] = ()) -> pa.Schema:
+    """
+    Arrow schema of a dataclass's scalar fields, preceded by string key
+    columns. List-valued fields are not included; they are written as
+    separate tables.
+
+    Raises:
+        TypeError: If a scalar field's annotation has no Arrow type
+    """
+    scalar_types = {"str": pa.string(), "float": pa.float64()}
+    schema_fields = [pa.field(key, pa.string()) for key in keys]
+    for f in fields(cls):
+        if isinstance(f.type, str) and f.type.startswith("list["):
+            continue
+        if f.type not in scalar_types:
+            raise TypeError(f"No Parquet type for {cls.__name__}.{f.name}: {f.type}")
+        schema_fields.append(pa.field(f.name, scalar_types[f.type]))
+    return pa.schema(schema_fields)
+
+
+def _write_parquet(path: Path, schema: pa.Schema, records: Iterable[dict[str, Any]]) -> int:
+    """
+    Write record dicts to path as a Parquet table with the given schema.
+
+    Records are converted one row group at a time, so only that many dicts
+    exist at once; keys outside the schema are ignored. Repeated short
+    strings (document types, org codes, currencies) are dictionary encoded.
+
+    Returns:
+        Number of records written
+    """
+    records = iter(records)
+    count = 0
+    with pq.ParquetWriter(path, schema, compression="snappy", use_dictionary=True) as writer:
+        while batch := list(islice(records, PARQUET_ROW_GROUP_SIZE)):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def _records(rows: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Record dicts of dataclass rows or of an MMDocFlowTable."""
+    if isinstance(rows, MMDocFlowTable):
+        return rows.records()
+    return map(row_record, rows)
+
+
 # =============================================================================
 # MAIN GENERATOR CLASS
 # =============================================================================
@@ -278,9 +531,12 @@ class SAPMMGenerator:
         output_dir: str = "sample_output",
         start_date: str = "2024-01-01",
         end_date: str = "2024-12-31",
+        jobs: int = 1,
     ):
         self.count = count
         self.seed = seed
+        # jobs=0 uses one worker per CPU
+        self.jobs = max(1, jobs if jobs else os.cpu_count() or 1)
         self.output_dir = Path(output_dir)
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
@@ -288,9 +544,7 @@ class SAPMMGenerator:
 
         # Initialize random generators
         self.rng = np.random.default_rng(seed)
-        random.seed(seed)
-        self.faker = Faker()
-        Faker.seed(seed)
+        self.faker = _make_faker(seed)
 
         # Document number counters
         self.po_counter = 4500000000
@@ -298,20 +552,44 @@ class SAPMMGenerator:
         self.ir_counter = 5100000000
 
         # Master data storage
-        self.vendors: List[Vendor] = []
-        self.materials: List[MMMaterial] = []
-        self.users: List[MMUser] = []
+        self.vendors: list[Vendor] = []
+        self.materials: list[MMMaterial] = []
+        self.users: list[MMUser] = []
 
         # Transaction data storage
-        self.purchase_orders: List[PurchaseOrder] = []
-        self.goods_receipts: List[GoodsReceipt] = []
-        self.invoice_receipts: List[InvoiceReceipt] = []
-        self.doc_flows: List[MMDocFlow] = []
+        self.purchase_orders: list[PurchaseOrder] = []
+        self.goods_receipts: list[GoodsReceipt] = []
+        self.invoice_receipts: list[InvoiceReceipt] = []
+        self.doc_flows = MMDocFlowTable()
 
         # Lookup maps
-        self.vendor_by_id: Dict[str, Vendor] = {}
-        self.material_by_id: Dict[str, MMMaterial] = {}
-        self.user_by_org: Dict[str, List[MMUser]] = defaultdict(list)
+        self.vendor_by_id: dict[str, Vendor] = {}
+        self.material_by_id: dict[str, MMMaterial] = {}
+        self.user_by_org: dict[str, list[MMUser]] = {}
+
+        # Pre-sampled per-document draws, set by generate_all()
+        self._draws: DocumentDraws | None = None
+
+        # User names by purchasing org, set by _index_users()
+        self._all_user_names: list[str] = []
+        self._user_names_by_org: dict[str, list[str]] = {}
+
+        # Material master data as parallel arrays, set by _index_materials()
+        self._mat_matnr = np.empty(0, dtype=str)
+        self._mat_price = np.empty(0, dtype=np.float64)
+        self._mat_meins = np.empty(0, dtype=str)
+
+        # ISO date labels by day offset from start_date, see _date_label()
+        self._date_labels = [
+            (self.start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+            for day in range(self.date_range_days + 1)
+        ]
+
+        # "MM/DD" labels for every day of the period, for dates in text noise
+        self._noise_dates = [
+            (self.start_date + timedelta(days=day)).strftime("%m/%d")
+            for day in range(self.date_range_days + 1)
+        ]
 
         # Statistics
         self.stats = {
@@ -338,23 +616,35 @@ class SAPMMGenerator:
         self.ir_counter += 1
         return str(self.ir_counter)
 
-    def _random_date(self) -> datetime:
-        """Generate random date within range."""
-        days = self.rng.integers(0, self.date_range_days)
-        return self.start_date + timedelta(days=int(days))
-
-    def _random_time(self) -> str:
-        """Generate random time string."""
-        hour = self.rng.integers(6, 20)
-        minute = self.rng.integers(0, 60)
-        second = self.rng.integers(0, 60)
-        return f"{hour:02d}:{minute:02d}:{second:02d}"
+    def _prealloc_randoms(self, count: int, num_noise_names: int = 200) -> DocumentDraws:
+        """
+        Draw the per-document random values for `count` purchase orders at once.
 
-    def _weighted_choice(self, options: Dict[str, float]) -> str:
-        """Select from weighted options."""
-        choices = list(options.keys())
-        weights = list(options.values())
-        return self.rng.choice(choices, p=np.array(weights) / sum(weights))
+        Every purchase order consumes exactly one value from each array, so
+        the generation loop indexes them instead of calling the RNG. Faker
+        names for text noise are generated once into a pool.
+        """
+        item_shape = (count, _MAX_PO_ITEMS)
+        return DocumentDraws(
+            vendor_idx=self.rng.integers(0, len(self.vendors), size=count),
+            po_day=self.rng.integers(0, self.date_range_days, size=count),
+            po_time_idx=self.rng.integers(0, len(_PO_TIME_LABELS), size=count),
+            delivery_lead_days=self.rng.integers(7, 31, size=count),
+            gr_delay_days=self.rng.integers(1, 5, size=count),
+            ir_delay_days=self.rng.integers(3, 10, size=count),
+            skip_gr=self.rng.random(count) < 0.03,
+            skip_ir=self.rng.random(count) < 0.05,
+            po_type=_sample_weights(_PO_TYPE_DIST, self.rng, count),
+            purchasing_group=self.rng.integers(0, len(_PURCHASING_GROUPS), size=count),
+            text_rolls=self.rng.random((count, _TEXT_ROLLS)),
+            num_items=self.rng.integers(1, _MAX_PO_ITEMS + 1, size=count),
+            item_material_idx=self.rng.integers(0, len(self.materials), size=item_shape),
+            item_qty=self.rng.integers(10, 500, size=item_shape).astype(np.float64),
+            item_plant_roll=self.rng.random(item_shape),
+            item_text_roll=self.rng.random(item_shape),
+            item_lgort_idx=self.rng.integers(0, len(STORAGE_LOCATIONS), size=item_shape),
+            noise_names=[self.faker.name() for _ in range(num_noise_names)],
+        )
 
     # =========================================================================
     # MASTER DATA GENERATION
@@ -364,14 +654,15 @@ class SAPMMGenerator:
         """Generate vendor master data."""
         for i in range(num_vendors):
             lifnr = f"VEND{i + 1:04d}"
-            ekorg = self.rng.choice(list(PURCHASING_ORGS.keys()))
+            porg_idx = self.rng.integers(0, len(_PORG_CODES))
 
             vendor = Vendor(
                 lifnr=lifnr,
                 name1=self.faker.company(),
-                land1=PURCHASING_ORGS[ekorg]["region"],
-                brsch=self.rng.choice(VENDOR_INDUSTRIES),
-                ekorg=ekorg,
+                land1=str(_PORG_REGION[porg_idx]),
+                brsch=VENDOR_INDUSTRIES[self.rng.integers(0, len(VENDOR_INDUSTRIES))],
+                ekorg=str(_PORG_CODES[porg_idx]),
+                waers=str(_PORG_CURRENCY[porg_idx]),
             )
             self.vendors.append(vendor)
             self.vendor_by_id[lifnr] = vendor
@@ -380,7 +671,7 @@ class SAPMMGenerator:
         """Generate material master data for MM."""
         for i in range(num_materials):
             matnr = f"MMAT{i + 1:03d}"
-            category = self.rng.choice(MATERIAL_CATEGORIES)
+            category = MATERIAL_CATEGORIES[self.rng.integers(0, len(MATERIAL_CATEGORIES))]
 
             price_ranges = {
                 "RAW": (10.0, 200.0),
@@ -404,7 +695,7 @@ class SAPMMGenerator:
         """Generate user master data for MM."""
         for i in range(num_users):
             bname = f"MMUSER{i + 1:03d}"
-            ekorg = self.rng.choice(list(PURCHASING_ORGS.keys()))
+            ekorg = str(_PORG_CODES[self.rng.integers(0, len(_PORG_CODES))])
 
             user = MMUser(
                 bname=bname,
@@ -412,149 +703,177 @@ class SAPMMGenerator:
                 ekorg=ekorg,
             )
             self.users.append(user)
-            self.user_by_org[ekorg].append(user)
+            self.user_by_org.setdefault(ekorg, []).append(user)
+
+    def _index_materials(self) -> None:
+        """Build the parallel material arrays gathered by item index."""
+        self._mat_matnr = np.array([m.matnr for m in self.materials])
+        self._mat_price = np.array([m.base_price for m in self.materials], dtype=np.float64)
+        self._mat_meins = np.array([m.meins for m in self.materials])
+
+    def _index_users(self) -> None:
+        """Build the user name lists sampled by _get_user_for_org()."""
+        self._all_user_names = [user.bname for user in self.users]
+        self._user_names_by_org = {
+            ekorg: [user.bname for user in users]
+            for ekorg, users in self.user_by_org.items()
+            if users
+        }
 
     def _get_user_for_org(self, ekorg: str) -> str:
-        """Get a random user for the given purchasing organization."""
-        if self.user_by_org[ekorg]:
-            return self.rng.choice(self.user_by_org[ekorg]).bname
-        return self.rng.choice(self.users).bname
+        """Get a random user for the given purchasing organization, or any user if it has none."""
+        names = self._user_names_by_org.get(ekorg, self._all_user_names)
+        return names[self.rng.integers(0, len(names))]
 
     # =========================================================================
     # TEXT PATTERN GENERATION
     # =========================================================================
 
-    def _generate_text_pattern(self) -> Tuple[Optional[str], Optional[str]]:
+    def _generate_text_pattern(
+        self, rolls: list[float] | None = None
+    ) -> tuple[str | None, str | None, str | None]:
         """
         Generate text content with pattern or noise.
-        Returns (text_content, pattern_category).
-        """
-        if self.rng.random() > 0.50:
-            return None, None
+        Returns (text_content, pattern_category, pattern_key), where
+        pattern_key is the canonical pattern the text was drawn from (None
+        for noise or no text).
 
-        # Invoice hold patterns
-        for pattern, info in INVOICE_HOLD_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["pos_with_invoice_hold_text"] += 1
-                return self._add_text_noise(chosen), "invoice_hold"
-
-        # Quantity discrepancy patterns
-        for pattern, info in QTY_DISCREPANCY_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["pos_with_qty_discrepancy_text"] += 1
-                return self._add_text_noise(chosen), "qty_discrepancy"
-
-        # Quality patterns
-        for pattern, info in QUALITY_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["pos_with_quality_text"] += 1
-                return self._add_text_noise(chosen), "quality"
+        The decision consumes _TEXT_ROLLS uniform draws, taken from `rolls`
+        when pre-sampled and otherwise drawn in a single call.
+        """
+        if rolls is None:
+            rolls = self.rng.random(_TEXT_ROLLS).tolist()
+
+        if rolls[0] > 0.50:
+            return None, None, None
+
+        # Selects the variant or noise text once a branch is taken
+        pick = rolls[-_NOISE_ROLLS - 1]
+        noise_rolls = rolls[-_NOISE_ROLLS:]
+
+        # Invoice hold, quantity discrepancy and quality patterns, in order
+        roll_idx = 1
+        for patterns, category, stat in _TEXT_PATTERN_TABLES:
+            for pattern, info in patterns.items():
+                if rolls[roll_idx] < info["probability"]:
+                    variants = [pattern] + info.get("variants", [])
+                    chosen = variants[int(pick * len(variants))]
+                    self.stats[stat] += 1
+                    return self._add_text_noise(chosen, noise_rolls), category, pattern
+                roll_idx += 1
 
         # Noise patterns
-        if self.rng.random() < 0.15:
-            chosen = self.rng.choice(NOISE_PATTERNS)
+        if rolls[roll_idx] < 0.15:
+            chosen = NOISE_PATTERNS[int(pick * len(NOISE_PATTERNS))]
             self.stats["pos_with_noise_text"] += 1
-            return self._add_text_noise(chosen), "noise"
-
-        return None, None
-
-    def _add_text_noise(self, text: str) -> str:
-        """Add realistic noise to text."""
-        noise_additions = [
-            "",
-            f" - {self.faker.name()}",
-            f" REF#{self.faker.bothify('####')}",
-            " - please review",
-            " - vendor notified",
-            f" {self.faker.date_this_year().strftime('%m/%d')}",
-        ]
+            return self._add_text_noise(chosen, noise_rolls), "noise", None
 
-        case_choice = self.rng.random()
-        if case_choice < 0.3:
+        return None, None, None
+
+    def _add_text_noise(self, text: str, rolls: list[float]) -> str:
+        """
+        Add realistic noise to text.
+
+        Driven by _NOISE_ROLLS uniform draws: case change, which addition,
+        and the name, reference number or date the addition uses.
+        """
+        case_roll, addition_roll, value_roll = rolls
+        if case_roll < 0.3:
             text = text.upper()
-        elif case_choice < 0.5:
+        elif case_roll < 0.5:
             text = text.lower()
 
-        text += self.rng.choice(noise_additions)
+        # Only the chosen addition is built
+        addition = int(addition_roll * 6)
+        if addition == 1:
+            names = self._draws.noise_names
+            text += f" - {names[int(value_roll * len(names))]}"
+        elif addition == 2:
+            text += f" REF#{int(value_roll * 10000):04d}"
+        elif addition == 3:
+            text += " - please review"
+        elif addition == 4:
+            text += " - vendor notified"
+        elif addition == 5:
+            text += f" {self._noise_dates[int(value_roll * len(self._noise_dates))]}"
         return text
 
-    def _create_text_record(self, text: str, created_date: datetime) -> Dict:
-        """Create a text record dictionary."""
+    def _create_text_record(self, text: str, created_on: str) -> dict:
+        """Create a text record dictionary, stamped at midnight of created_on."""
         return {
-            "text_id": self.faker.bothify("####"),
+            "text_id": f"{self.rng.integers(0, 10000):04d}",
             "text": text,
             "lang": "EN",
-            "changed_at": created_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "changed_at": f"{created_on}T00:00:00Z",
         }
 
+    def _date_label(self, day: int) -> str:
+        """ISO date string for a day offset from start_date."""
+        labels = self._date_labels
+        # Follow-on documents can fall past end_date; extend the table as needed
+        while day >= len(labels):
+            labels.append(
+                (self.start_date + timedelta(days=len(labels))).strftime("%Y-%m-%d")
+            )
+        return labels[day]
+
     # =========================================================================
     # TIMING AND OUTCOME CALCULATIONS
     # =========================================================================
 
     def _calculate_gr_timing(
         self,
-        po_date: datetime,
-        delivery_date: datetime,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> datetime:
-        """Calculate goods receipt date based on patterns."""
-        base_days = int(self.rng.integers(1, 5))
-        actual_date = delivery_date + timedelta(days=base_days)
+        delivery_day: int,
+        pattern_category: str | None,
+        pattern_key: str | None,
+        base_days: int,
+    ) -> int:
+        """Calculate goods receipt day (offset from start_date) based on patterns."""
+        actual_day = delivery_day + base_days
 
         # Quality hold adds delay
         if pattern_category == "quality":
-            for pattern, info in QUALITY_PATTERNS.items():
-                if "hold_days" in info:
-                    hold_min, hold_max = info["hold_days"]
-                    actual_date += timedelta(days=int(self.rng.integers(hold_min, hold_max + 1)))
-                    break
+            info = QUALITY_PATTERNS.get(pattern_key)
+            if info and "hold_days" in info:
+                hold_min, hold_max = info["hold_days"]
+                actual_day += int(self.rng.integers(hold_min, hold_max + 1))
 
-        return actual_date
+        return actual_day
 
     def _calculate_ir_timing(
         self,
-        gr_date: datetime,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> Tuple[datetime, str]:
-        """Calculate invoice receipt date and payment block."""
-        base_days = int(self.rng.integers(3, 10))
-        invoice_date = gr_date + timedelta(days=base_days)
+        gr_day: int,
+        pattern_category: str | None,
+        pattern_key: str | None,
+        base_days: int,
+    ) -> tuple[int, str]:
+        """Calculate invoice receipt day (offset from start_date) and payment block."""
+        invoice_day = gr_day + base_days
         payment_block = ""
 
         # Invoice hold patterns
         if pattern_category == "invoice_hold":
-            for pattern, info in INVOICE_HOLD_PATTERNS.items():
-                all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-                if any(v in t.upper() for v in all_variants for t in text_patterns):
-                    hold_min, hold_max = info["hold_days"]
-                    invoice_date += timedelta(days=int(self.rng.integers(hold_min, hold_max + 1)))
-                    payment_block = "A"  # Blocked for payment
-                    self.stats["invoices_on_hold"] += 1
-                    break
+            info = INVOICE_HOLD_PATTERNS.get(pattern_key)
+            if info:
+                hold_min, hold_max = info["hold_days"]
+                invoice_day += int(self.rng.integers(hold_min, hold_max + 1))
+                payment_block = "A"  # Blocked for payment
+                self.stats["invoices_on_hold"] += 1
 
-        return invoice_date, payment_block
+        return invoice_day, payment_block
 
     def _calculate_qty_factor(
-        self, text_patterns: List[str], pattern_category: Optional[str]
+        self, pattern_category: str | None, pattern_key: str | None
     ) -> float:
         """Calculate quantity factor for GR (short/over ship scenarios)."""
         if pattern_category != "qty_discrepancy":
             return 1.0
 
-        for pattern, info in QTY_DISCREPANCY_PATTERNS.items():
-            all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-            if any(v in t.upper() for v in all_variants for t in text_patterns):
-                factor_min, factor_max = info["qty_factor"]
-                self.stats["grs_with_qty_variance"] += 1
-                return self.rng.uniform(factor_min, factor_max)
+        info = QTY_DISCREPANCY_PATTERNS.get(pattern_key)
+        if info:
+            factor_min, factor_max = info["qty_factor"]
+            self.stats["grs_with_qty_variance"] += 1
+            return self.rng.uniform(factor_min, factor_max)
 
         return 1.0
 
@@ -562,53 +881,67 @@ class SAPMMGenerator:
     # DOCUMENT GENERATION
     # =========================================================================
 
-    def _generate_purchase_order(self, vendor: Vendor) -> Tuple[PurchaseOrder, List[str], Optional[str]]:
+    def _generate_purchase_order(
+        self, vendor: Vendor, doc_idx: int
+    ) -> tuple[PurchaseOrder, str | None, str | None]:
         """Generate a single purchase order with items."""
-        po_date = self._random_date()
+        draws = self._draws
+        po_date = self._date_label(int(draws.po_day[doc_idx]))
         ekorg = vendor.ekorg
         ernam = self._get_user_for_org(ekorg)
 
         # Generate text pattern
-        text_content, pattern_category = self._generate_text_pattern()
-        text_patterns = [text_content] if text_content else []
+        text_content, pattern_category, pattern_key = self._generate_text_pattern(
+            draws.text_rolls[doc_idx].tolist()
+        )
 
         # PO type
-        bsart = self._weighted_choice({"NB": 0.80, "ZNB": 0.15, "FO": 0.05})
+        bsart = str(draws.po_type[doc_idx])
 
         # Delivery date: 7-30 days from PO
-        eindt = po_date + timedelta(days=int(self.rng.integers(7, 31)))
+        eindt = self._date_label(int(draws.po_day[doc_idx] + draws.delivery_lead_days[doc_idx]))
 
         # Generate items
-        num_items = int(self.rng.integers(1, 6))
+        num_items = int(draws.num_items[doc_idx])
         items = []
-        available_plants = [p for p, info in PLANTS.items() if info["purch_org"] == ekorg]
-        if not available_plants:
-            available_plants = list(PLANTS.keys())
-
-        for item_idx in range(1, num_items + 1):
-            material = self.rng.choice(self.materials)
-            menge = float(self.rng.integers(10, 500))
-            netpr = material.base_price
+        available_plants = _PLANTS_BY_PORG[_PORG_INDEX[ekorg]]
+        currency = vendor.waers
+
+        # Gather the item columns for this PO
+        material_idx = draws.item_material_idx[doc_idx, :num_items]
+        plant_idx = (draws.item_plant_roll[doc_idx, :num_items] * len(available_plants)).astype(int)
+        item_columns = zip(
+            self._mat_matnr[material_idx].tolist(),
+            self._mat_price[material_idx].tolist(),
+            self._mat_meins[material_idx].tolist(),
+            available_plants[plant_idx].tolist(),
+            draws.item_qty[doc_idx, :num_items].tolist(),
+            draws.item_text_roll[doc_idx, :num_items].tolist(),
+            strict=True,
+        )
+
+        for item_idx, (matnr, netpr, meins, werks, menge, text_roll) in enumerate(
+            item_columns, start=1
+        ):
             netwr = round(menge * netpr, 2)
 
             item_texts = []
-            if self.rng.random() < 0.10:
-                item_text, _ = self._generate_text_pattern()
+            if text_roll < 0.10:
+                item_text, _, _ = self._generate_text_pattern()
                 if item_text:
                     item_texts.append(self._create_text_record(item_text, po_date))
 
-            item = POItem(
-                ebelp=f"{item_idx * 10:05d}",
-                matnr=material.matnr,
-                werks=self.rng.choice(available_plants),
-                menge=menge,
-                meins=material.meins,
-                netpr=netpr,
-                netwr=netwr,
-                waers=PURCHASING_ORGS[ekorg]["currency"],
-                item_texts=item_texts,
-            )
-            items.append(asdict(item))
+            items.append({
+                "ebelp": _EBELP_LABELS[item_idx],
+                "matnr": matnr,
+                "werks": werks,
+                "menge": menge,
+                "meins": meins,
+                "netpr": netpr,
+                "netwr": netwr,
+                "waers": currency,
+                "item_texts": item_texts,
+            })
 
         header_texts = []
         if text_content:
@@ -618,126 +951,140 @@ class SAPMMGenerator:
             ebeln=self._next_po_number(),
             bsart=bsart,
             ekorg=ekorg,
-            ekgrp=f"P{self.rng.integers(1, 10):02d}",
+            ekgrp=_PURCHASING_GROUPS[draws.purchasing_group[doc_idx]],
             lifnr=vendor.lifnr,
-            erdat=po_date.strftime("%Y-%m-%d"),
-            erzet=self._random_time(),
+            erdat=po_date,
+            erzet=_PO_TIME_LABELS[draws.po_time_idx[doc_idx]],
             ernam=ernam,
-            bedat=po_date.strftime("%Y-%m-%d"),
-            eindt=eindt.strftime("%Y-%m-%d"),
+            bedat=po_date,
+            eindt=eindt,
             header_texts=header_texts,
             items=items,
         )
 
-        return po, text_patterns, pattern_category
+        return po, pattern_category, pattern_key
 
     def _generate_goods_receipt(
         self,
         po: PurchaseOrder,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> Optional[GoodsReceipt]:
-        """Generate goods receipt for a purchase order."""
+        pattern_category: str | None,
+        pattern_key: str | None,
+        doc_idx: int,
+    ) -> tuple[GoodsReceipt, int] | None:
+        """
+        Generate goods receipt for a purchase order.
+
+        Returns:
+            The goods receipt and its posting day (offset from start_date),
+            or None if the PO has no GR
+        """
+        draws = self._draws
         # 3% chance of no GR (cancelled PO, etc.)
-        if self.rng.random() < 0.03:
+        if draws.skip_gr[doc_idx]:
             return None
 
-        po_date = datetime.strptime(po.erdat, "%Y-%m-%d")
-        delivery_date = datetime.strptime(po.eindt, "%Y-%m-%d")
-        gr_date = self._calculate_gr_timing(po_date, delivery_date, text_patterns, pattern_category)
+        po_day = int(draws.po_day[doc_idx])
+        gr_day = self._calculate_gr_timing(
+            po_day + int(draws.delivery_lead_days[doc_idx]),
+            pattern_category, pattern_key, int(draws.gr_delay_days[doc_idx]),
+        )
+        gr_date = self._date_label(gr_day)
 
-        qty_factor = self._calculate_qty_factor(text_patterns, pattern_category)
+        qty_factor = self._calculate_qty_factor(pattern_category, pattern_key)
+
+        lgort_idx = draws.item_lgort_idx[doc_idx].tolist()
 
         gr_items = []
-        for po_item in po.items:
+        for item_pos, po_item in enumerate(po.items):
             received_qty = round(po_item["menge"] * qty_factor, 2)
 
-            gr_item = GRItem(
-                zeession=po_item["ebelp"],
-                matnr=po_item["matnr"],
-                werks=po_item["werks"],
-                lgort=self.rng.choice(STORAGE_LOCATIONS),
-                menge=received_qty,
-                meins=po_item["meins"],
-                ebeln=po.ebeln,
-                ebelp=po_item["ebelp"],
-            )
-            gr_items.append(asdict(gr_item))
+            gr_items.append({
+                "zeession": po_item["ebelp"],
+                "matnr": po_item["matnr"],
+                "werks": po_item["werks"],
+                "lgort": STORAGE_LOCATIONS[lgort_idx[item_pos]],
+                "menge": received_qty,
+                "meins": po_item["meins"],
+                "ebeln": po.ebeln,
+                "ebelp": po_item["ebelp"],
+            })
 
         gr = GoodsReceipt(
             mblnr=self._next_gr_number(),
-            mjahr=str(gr_date.year),
-            bldat=gr_date.strftime("%Y-%m-%d"),
-            budat=gr_date.strftime("%Y-%m-%d"),
+            mjahr=gr_date[:4],
+            bldat=gr_date,
+            budat=gr_date,
             usnam=self._get_user_for_org(po.ekorg),
             items=gr_items,
         )
 
         # Create document flow: PO -> GR
-        for gr_item in gr_items:
-            flow = MMDocFlow(
-                vbelv=po.ebeln,
-                posnv=gr_item["ebelp"],
-                vbtyp_v="F",  # PO
-                vbeln=gr.mblnr,
-                posnn=gr_item["zeession"],
-                vbtyp_n="E",  # GR
-                rfmng=gr_item["menge"],
-                erdat=gr.budat,
-            )
-            self.doc_flows.append(flow)
+        self.doc_flows.add_document(
+            vbelv=po.ebeln,
+            vbtyp_v="F",  # PO
+            vbeln=gr.mblnr,
+            vbtyp_n="E",  # GR
+            erdat=gr.budat,
+            posnv=[gr_item["ebelp"] for gr_item in gr_items],
+            posnn=[gr_item["zeession"] for gr_item in gr_items],
+            rfmng=[gr_item["menge"] for gr_item in gr_items],
+        )
 
-        return gr
+        return gr, gr_day
 
     def _generate_invoice_receipt(
         self,
         po: PurchaseOrder,
         gr: GoodsReceipt,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> Optional[InvoiceReceipt]:
-        """Generate invoice receipt for a goods receipt."""
+        gr_day: int,
+        pattern_category: str | None,
+        pattern_key: str | None,
+        doc_idx: int,
+    ) -> InvoiceReceipt | None:
+        """Generate invoice receipt for a goods receipt posted on gr_day."""
         # 5% chance of no IR yet
-        if self.rng.random() < 0.05:
+        if self._draws.skip_ir[doc_idx]:
             return None
 
-        gr_date = datetime.strptime(gr.budat, "%Y-%m-%d")
-        ir_date, payment_block = self._calculate_ir_timing(gr_date, text_patterns, pattern_category)
+        ir_day, payment_block = self._calculate_ir_timing(
+            gr_day, pattern_category, pattern_key,
+            int(self._draws.ir_delay_days[doc_idx]),
+        )
+        ir_date = self._date_label(ir_day)
 
         ir_items = []
         total_amount = 0.0
 
+        # Index PO items once instead of scanning them for every GR item
+        po_items_by_ebelp = {po_item["ebelp"]: po_item for po_item in po.items}
+
         for gr_item in gr.items:
             # Find matching PO item for pricing
-            po_item = next(
-                (pi for pi in po.items if pi["ebelp"] == gr_item["ebelp"]),
-                None
-            )
+            po_item = po_items_by_ebelp.get(gr_item["ebelp"])
             if not po_item:
                 continue
 
             wrbtr = round(gr_item["menge"] * po_item["netpr"], 2)
             total_amount += wrbtr
 
-            ir_item = IRItem(
-                buzei=gr_item["zeession"],
-                matnr=gr_item["matnr"],
-                menge=gr_item["menge"],
-                wrbtr=wrbtr,
-                ebeln=gr_item["ebeln"],
-                ebelp=gr_item["ebelp"],
-                mblnr=gr.mblnr,
-            )
-            ir_items.append(asdict(ir_item))
+            ir_items.append({
+                "buzei": gr_item["zeession"],
+                "matnr": gr_item["matnr"],
+                "menge": gr_item["menge"],
+                "wrbtr": wrbtr,
+                "ebeln": gr_item["ebeln"],
+                "ebelp": gr_item["ebelp"],
+                "mblnr": gr.mblnr,
+            })
 
         vendor = self.vendor_by_id.get(po.lifnr)
-        currency = PURCHASING_ORGS[po.ekorg]["currency"] if vendor else "USD"
+        currency = vendor.waers if vendor else "USD"
 
         ir = InvoiceReceipt(
             belnr=self._next_ir_number(),
-            gjahr=str(ir_date.year),
-            bldat=ir_date.strftime("%Y-%m-%d"),
-            budat=ir_date.strftime("%Y-%m-%d"),
+            gjahr=ir_date[:4],
+            bldat=ir_date,
+            budat=ir_date,
             lifnr=po.lifnr,
             rmwwr=round(total_amount, 2),
             waers=currency,
@@ -746,18 +1093,17 @@ class SAPMMGenerator:
         )
 
         # Create document flow: GR -> IR
-        for ir_item in ir_items:
-            flow = MMDocFlow(
-                vbelv=gr.mblnr,
-                posnv=ir_item["buzei"],
-                vbtyp_v="E",  # GR
-                vbeln=ir.belnr,
-                posnn=ir_item["buzei"],
-                vbtyp_n="P",  # IR
-                rfmng=ir_item["menge"],
-                erdat=ir.budat,
-            )
-            self.doc_flows.append(flow)
+        buzei = [ir_item["buzei"] for ir_item in ir_items]
+        self.doc_flows.add_document(
+            vbelv=gr.mblnr,
+            vbtyp_v="E",  # GR
+            vbeln=ir.belnr,
+            vbtyp_n="P",  # IR
+            erdat=ir.budat,
+            posnv=buzei,
+            posnn=buzei,
+            rfmng=[ir_item["menge"] for ir_item in ir_items],
+        )
 
         return ir
 
@@ -788,22 +1134,10 @@ class SAPMMGenerator:
         # Generate transaction data
         print(f"\nGenerating {self.count} purchase orders with document chains...")
 
-        for i in range(self.count):
-            vendor = self.rng.choice(self.vendors)
-
-            po, text_patterns, pattern_category = self._generate_purchase_order(vendor)
-            self.purchase_orders.append(po)
-
-            gr = self._generate_goods_receipt(po, text_patterns, pattern_category)
-            if gr:
-                self.goods_receipts.append(gr)
-
-                ir = self._generate_invoice_receipt(po, gr, text_patterns, pattern_category)
-                if ir:
-                    self.invoice_receipts.append(ir)
-
-            if (i + 1) % 1000 == 0:
-                print(f"  Generated {i + 1} POs...")
+        if self.jobs > 1 and self.count > 1:
+            self._generate_documents_parallel()
+        else:
+            self._generate_documents()
 
         print(f"\nGeneration complete:")
         print(f"  Purchase Orders: {len(self.purchase_orders)}")
@@ -821,28 +1155,210 @@ class SAPMMGenerator:
         print(f"  Invoices on Hold: {self.stats['invoices_on_hold']}")
         print(f"  GRs with Qty Variance: {self.stats['grs_with_qty_variance']}")
 
-    def save_output(self) -> None:
-        """Save all generated data to JSON files."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    def _generate_documents(self, report_progress: bool = True) -> None:
+        """Generate `count` PO -> GR -> IR document chains in this process."""
+        self._index_users()
+        self._index_materials()
+        self._draws = self._prealloc_randoms(self.count)
+
+        # Progress is reported between blocks, keeping the per-PO loop branch-free
+        for block_start in range(0, self.count, PROGRESS_INTERVAL):
+            block_end = min(block_start + PROGRESS_INTERVAL, self.count)
+
+            for i in range(block_start, block_end):
+                vendor = self.vendors[self._draws.vendor_idx[i]]
+
+                po, pattern_category, pattern_key = self._generate_purchase_order(vendor, i)
+                self.purchase_orders.append(po)
+
+                receipt = self._generate_goods_receipt(po, pattern_category, pattern_key, i)
+                if receipt:
+                    gr, gr_day = receipt
+                    self.goods_receipts.append(gr)
+
+                    ir = self._generate_invoice_receipt(
+                        po, gr, gr_day, pattern_category, pattern_key, i
+                    )
+                    if ir:
+                        self.invoice_receipts.append(ir)
+
+            if report_progress and block_end % PROGRESS_INTERVAL == 0:
+                print(f"  Generated {block_end} POs...")
+
+    def _generate_documents_parallel(self) -> None:
+        """
+        Generate the document chains in `jobs` worker processes.
 
-        files = {
-            "purchase_orders.json": [asdict(po) for po in self.purchase_orders],
-            "goods_receipts.json": [asdict(gr) for gr in self.goods_receipts],
-            "invoice_receipts.json": [asdict(ir) for ir in self.invoice_receipts],
-            "mm_doc_flows.json": [asdict(df) for df in self.doc_flows],
-            "vendors.json": [asdict(v) for v in self.vendors],
-            "mm_materials.json": [asdict(m) for m in self.materials],
+        The PO range is split into contiguous shards. Each shard gets its own
+        random stream spawned from the seed, so output is reproducible for a
+        given seed and job count (but differs from a single-process run).
+        Each shard numbers its documents from its first PO index, so GR/IR
+        number ranges have gaps where documents were skipped.
+        """
+        jobs = min(self.jobs, self.count)
+        bounds = np.linspace(0, self.count, jobs + 1).astype(int)
+        shard_seeds = np.random.SeedSequence(self.seed).spawn(jobs)
+        master_data = (self.vendors, self.materials, self.users)
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _generate_shard,
+                    self._shard_params(start, stop, shard_seed),
+                    master_data,
+                )
+                for start, stop, shard_seed in zip(
+                    bounds[:-1], bounds[1:], shard_seeds, strict=True
+                )
+            ]
+            for future in futures:
+                pos, grs, irs, doc_flows, stats = future.result()
+                self.purchase_orders.extend(pos)
+                self.goods_receipts.extend(grs)
+                self.invoice_receipts.extend(irs)
+                self.doc_flows.extend(doc_flows)
+                for key, value in stats.items():
+                    self.stats[key] += value
+                print(f"  Generated {len(self.purchase_orders)} POs...")
+
+    def _shard_params(
+        self, start: int, stop: int, shard_seed: np.random.SeedSequence
+    ) -> dict[str, Any]:
+        """Constructor and counter settings for the generator of one shard."""
+        return {
+            "count": int(stop - start),
+            "seed": int(shard_seed.generate_state(1)[0]),
+            "start_date": self.start_date.strftime("%Y-%m-%d"),
+            "end_date": self.end_date.strftime("%Y-%m-%d"),
+            "first_doc": int(start),
         }
 
+    def save_output(self, output_format: str = "json") -> None:
+        """
+        Save all generated data, one file per table.
+
+        Args:
+            output_format: 'json' (indented JSON arrays, documents with
+                nested items) or 'parquet' (normalized columnar tables,
+                requires pyarrow)
+        """
+        if output_format == "parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+            written = self._save_parquet()
+        elif output_format == "json":
+            written = self._save_json()
+        else:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
         print("\nSaving output files...")
-        for filename, data in files.items():
-            filepath = self.output_dir / filename
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"  {filepath} ({len(data)} records)")
+        for filepath, count in written:
+            print(f"  {filepath} ({count} records)")
 
         print("\nDone!")
 
+    def _save_json(self) -> Iterator[tuple[Path, int]]:
+        """Write one JSON file per table, yielding each path and record count."""
+        tables = {
+            "purchase_orders": self.purchase_orders,
+            "goods_receipts": self.goods_receipts,
+            "invoice_receipts": self.invoice_receipts,
+            "mm_doc_flows": self.doc_flows,
+            "vendors": self.vendors,
+            "mm_materials": self.materials,
+        }
+        for name, rows in tables.items():
+            filepath = self.output_dir / f"{name}.json"
+            yield filepath, dump_records(filepath, _records(rows))
+
+    def _save_parquet(self) -> Iterator[tuple[Path, int]]:
+        """
+        Write one Parquet file per table, yielding each path and row count.
+
+        Document items and texts are normalized into their own tables keyed
+        by document number (po_items, po_texts, gr_items, ir_items), so no
+        column is nested. PO header texts have a null ebelp.
+        """
+        pos, grs, irs = self.purchase_orders, self.goods_receipts, self.invoice_receipts
+        tables = {
+            "purchase_orders": (_arrow_schema(PurchaseOrder), map(row_record, pos)),
+            "po_items": (
+                _arrow_schema(POItem, ("ebeln",)),
+                ({"ebeln": po.ebeln, **item} for po in pos for item in po.items),
+            ),
+            "po_texts": (_arrow_schema(TextRecord, ("ebeln", "ebelp")), self._po_text_records()),
+            "goods_receipts": (_arrow_schema(GoodsReceipt), map(row_record, grs)),
+            "gr_items": (
+                _arrow_schema(GRItem, ("mblnr",)),
+                ({"mblnr": gr.mblnr, **item} for gr in grs for item in gr.items),
+            ),
+            "invoice_receipts": (_arrow_schema(InvoiceReceipt), map(row_record, irs)),
+            "ir_items": (
+                _arrow_schema(IRItem, ("belnr",)),
+                ({"belnr": ir.belnr, **item} for ir in irs for item in ir.items),
+            ),
+            "vendors": (_arrow_schema(Vendor), map(row_record, self.vendors)),
+            "mm_materials": (_arrow_schema(MMMaterial), map(row_record, self.materials)),
+        }
+        for name, (schema, records) in tables.items():
+            filepath = self.output_dir / f"{name}.parquet"
+            yield filepath, _write_parquet(filepath, schema, records)
+
+        # Flows are already columnar: one Arrow array per column
+        filepath = self.output_dir / "mm_doc_flows.parquet"
+        pq.write_table(
+            pa.table(self.doc_flows.columns(), schema=_arrow_schema(MMDocFlow)),
+            filepath, compression="snappy", use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+        )
+        yield filepath, len(self.doc_flows)
+
+    def _po_text_records(self) -> Iterator[dict[str, Any]]:
+        """PO header and item texts as flat records keyed by ebeln/ebelp."""
+        for po in self.purchase_orders:
+            for text in po.header_texts:
+                yield {"ebeln": po.ebeln, "ebelp": None, **text}
+            for item in po.items:
+                for text in item["item_texts"]:
+                    yield {"ebeln": po.ebeln, "ebelp": item["ebelp"], **text}
+
+
+def _generate_shard(
+    params: dict[str, Any],
+    master_data: tuple[list[Vendor], list[MMMaterial], list[MMUser]],
+) -> tuple[
+    list[PurchaseOrder], list[GoodsReceipt], list[InvoiceReceipt], MMDocFlowTable, dict[str, int]
+]:
+    """
+    Generate one shard of document chains in a worker process.
+
+    Returns only the shard's documents, flows and statistics, so none of the
+    worker generator's other state is pickled back to the parent.
+    """
+    first_doc = params.pop("first_doc")
+    generator = SAPMMGenerator(**params)
+    generator.po_counter += first_doc
+    generator.gr_counter += first_doc
+    generator.ir_counter += first_doc
+
+    generator.vendors, generator.materials, generator.users = master_data
+    generator.vendor_by_id = {vendor.lifnr: vendor for vendor in generator.vendors}
+    generator.material_by_id = {material.matnr: material for material in generator.materials}
+    for user in generator.users:
+        generator.user_by_org.setdefault(user.ekorg, []).append(user)
+
+    generator._generate_documents(report_progress=False)
+
+    return (
+        generator.purchase_orders,
+        generator.goods_receipts,
+        generator.invoice_receipts,
+        generator.doc_flows,
+        generator.stats,
+    )
+
 
 def main():
     """Main entry point for the generator CLI."""
@@ -853,6 +1369,7 @@ def main():
 Examples:
   python src/generate_mm.py --count 5000 --output sample_output/ --seed 42
   python src/generate_mm.py --count 2500 --seed 123
+  python src/generate_mm.py --count 50000 --format parquet
         """
     )
     parser.add_argument(
@@ -885,8 +1402,22 @@ Examples:
         default="2024-12-31",
         help="End date for documents (default: 2024-12-31)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for document generation; 0 uses all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "parquet"],
+        default="json",
+        help="Output file format; parquet requires pyarrow (default: json)",
+    )
 
     args = parser.parse_args()
+    if args.format == "parquet" and not PYARROW_AVAILABLE:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
 
     generator = SAPMMGenerator(
         count=args.count,
@@ -894,10 +1425,11 @@ Examples:
         output_dir=args.output,
         start_date=args.start_date,
         end_date=args.end_date,
+        jobs=args.jobs,
     )
 
     generator.generate_all()
-    generator.save_output()
+    generator.save_output(args.format)
 
 
 if __name__ == "__main__":
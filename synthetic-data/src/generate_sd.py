@@ -19,115 +19,219 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
-import random
-import sys
+import os
+import re
+from bisect import bisect_right
 from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any
 
 import numpy as np
 from faker import Faker
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+if __package__:
+    from .record_io import dump_records, row_record
+else:  # Run as a script: python src/generate_sd.py
+    from record_io import dump_records, row_record
+
 
 # =============================================================================
 # TEXT PATTERNS CONFIGURATION
 # =============================================================================
 
 # Patterns that cause delays (longer cycle times)
-DELAY_PATTERNS = {
-    "HOLD": {
+DELAY_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "HOLD": MappingProxyType({
         "probability": 0.05,
         "delay_days": (10, 20),
-        "variants": ["CREDIT HOLD", "hold for credit", "CR HLD", "CRED HOLD", "HLD", "ON HOLD"],
-    },
-    "BACKORDER": {
+        "variants": ("CREDIT HOLD", "hold for credit", "CR HLD", "CRED HOLD", "HLD", "ON HOLD"),
+    }),
+    "BACKORDER": MappingProxyType({
         "probability": 0.07,
         "delay_days": (15, 25),
-        "variants": ["out of stock", "BO", "B/O", "BACK ORDER", "backorder", "OUT OF STK"],
-    },
-    "BLOCKED": {
+        "variants": ("out of stock", "BO", "B/O", "BACK ORDER", "backorder", "OUT OF STK"),
+    }),
+    "BLOCKED": MappingProxyType({
         "probability": 0.03,
         "delay_days": (10, 30),
-        "variants": ["BLK", "BLOCK", "blocked", "BLKD"],
-    },
-    "COMPLIANCE REVIEW": {
+        "variants": ("BLK", "BLOCK", "blocked", "BLKD"),
+    }),
+    "COMPLIANCE REVIEW": MappingProxyType({
         "probability": 0.02,
         "delay_days": (14, 30),
-        "variants": ["COMPL REV", "COMPLIANCE CHK"],
-    },
-}
+        "variants": ("COMPL REV", "COMPLIANCE CHK"),
+    }),
+})
 
 # Patterns that expedite (shorter cycle times)
-EXPEDITE_PATTERNS = {
-    "EXPEDITE": {
+EXPEDITE_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "EXPEDITE": MappingProxyType({
         "probability": 0.08,
         "reduction_days": 2,
-        "variants": ["EXP", "EXPED", "expedite", "EXPD", "EXPDT"],
-    },
-    "RUSH": {
+        "variants": ("EXP", "EXPED", "expedite", "EXPD", "EXPDT"),
+    }),
+    "RUSH": MappingProxyType({
         "probability": 0.05,
         "reduction_days": 3,
-        "variants": ["RUSH ORDER", "rush", "RSH", "URGENT"],
-    },
-    "urgent": {
+        "variants": ("RUSH ORDER", "rush", "RSH", "URGENT"),
+    }),
+    "urgent": MappingProxyType({
         "probability": 0.04,
         "reduction_days": 2,
-        "variants": ["URG", "URGNT", "PRIORITY", "HOT"],
-    },
-}
+        "variants": ("URG", "URGNT", "PRIORITY", "HOT"),
+    }),
+})
 
 # Patterns causing multiple deliveries
-SPLIT_PATTERNS = {
-    "SHIP PARTIAL": {
+SPLIT_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "SHIP PARTIAL": MappingProxyType({
         "probability": 0.06,
         "extra_deliveries": (1, 2),
-        "variants": ["PARTIAL SHIP", "partial shipment ok", "PART SHIP", "PARTIAL"],
-    },
-    "SPLIT DELIVERY": {
+        "variants": ("PARTIAL SHIP", "partial shipment ok", "PART SHIP", "PARTIAL"),
+    }),
+    "SPLIT DELIVERY": MappingProxyType({
         "probability": 0.03,
         "extra_deliveries": (1, 2),
-        "variants": ["SPLIT DEL", "SPLIT SHIP", "split delivery"],
-    },
-}
+        "variants": ("SPLIT DEL", "SPLIT SHIP", "split delivery"),
+    }),
+})
 
 # Patterns affecting price
-PRICE_PATTERNS = {
-    "PRICE OVERRIDE": {
+PRICE_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "PRICE OVERRIDE": MappingProxyType({
         "probability": 0.04,
         "price_factor": (1.10, 1.30),
-        "variants": ["special pricing", "MANUAL PRICE", "PR OVRD", "OVERRIDE"],
-    },
-    "DISCOUNT": {
+        "variants": ("special pricing", "MANUAL PRICE", "PR OVRD", "OVERRIDE"),
+    }),
+    "DISCOUNT": MappingProxyType({
         "probability": 0.05,
         "price_factor": (0.80, 0.95),
-        "variants": ["DISC", "DSC", "discount", "SPECIAL PRICE"],
-    },
-}
+        "variants": ("DISC", "DSC", "discount", "SPECIAL PRICE"),
+    }),
+})
 
 # Patterns indicating returns/issues
-RETURN_PATTERNS = {
-    "RETURN DUE TO DAMAGE": {
+RETURN_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "RETURN DUE TO DAMAGE": MappingProxyType({
         "probability": 0.03,
-        "variants": ["damaged goods", "DMG", "DAMAGED", "DEFECT", "damage"],
-    },
-    "RMA": {
+        "variants": ("damaged goods", "DMG", "DAMAGED", "DEFECT", "damage"),
+    }),
+    "RMA": MappingProxyType({
         "probability": 0.02,
-        "variants": ["RMA#", "RETURN AUTH", "rma"],
-    },
-}
+        "variants": ("RMA#", "RETURN AUTH", "rma"),
+    }),
+})
 
 # Neutral/noise patterns
-NOISE_PATTERNS = [
+NOISE_PATTERNS: tuple[str, ...] = (
     "CUSTOMER REQUEST", "per customer", "CUST REQ", "Customer request",
     "PO#", "REF:", "Standard order", "Per agreement", "As discussed",
     "Follow up", "Confirmed", "Phone order", "Web order", "EDI order",
     "Scheduled", "Recurring", "Contract", "See attached", "Per quote",
     "Updated", "Revised", "Amendment", "custmer request",  # typo intentional
     "CUSTMER REQ", "cust request",  # abbreviations and typos
-]
+)
+
+
+def _compile_pattern_matcher(patterns: Mapping[str, Mapping[str, Any]]) -> re.Pattern[str]:
+    """
+    Compile a pattern table into one case-insensitive regex.
+
+    Each canonical pattern and its variants form one capture group, in table
+    order. The groups sit in a lookahead so finditer() tries every start
+    position, and match.lastindex identifies the pattern that matched.
+    """
+    groups = [
+        "(" + "|".join(re.escape(v) for v in (pattern, *info.get("variants", ()))) + ")"
+        for pattern, info in patterns.items()
+    ]
+    return re.compile("(?=" + "|".join(groups) + ")", re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
+def _matching_pattern_index(matcher: re.Pattern[str], text: str) -> int:
+    """
+    Return the table index of the first pattern matcher finds in text, or -1.
+
+    Generated texts are drawn from a small set of variants, casings and
+    suffixes and repeat heavily, so results are memoized per text.
+    """
+    hits = [match.lastindex for match in matcher.finditer(text)]
+    return min(hits) - 1 if hits else -1
+
+
+DELAY_MATCHER = _compile_pattern_matcher(DELAY_PATTERNS)
+EXPEDITE_MATCHER = _compile_pattern_matcher(EXPEDITE_PATTERNS)
+SPLIT_MATCHER = _compile_pattern_matcher(SPLIT_PATTERNS)
+PRICE_MATCHER = _compile_pattern_matcher(PRICE_PATTERNS)
+
+# Outcome parameters of each pattern, indexed like its matcher's groups.
+# Inclusive day/count ranges are stored as half-open rng.integers bounds.
+_DELAY_DAY_BOUNDS = tuple(
+    (info["delay_days"][0], info["delay_days"][1] + 1) for info in DELAY_PATTERNS.values()
+)
+_EXPEDITE_REDUCTION_DAYS = tuple(info["reduction_days"] for info in EXPEDITE_PATTERNS.values())
+_SPLIT_EXTRA_BOUNDS = tuple(
+    (info["extra_deliveries"][0], info["extra_deliveries"][1] + 1)
+    for info in SPLIT_PATTERNS.values()
+)
+_PRICE_FACTOR_RANGES = tuple(info["price_factor"] for info in PRICE_PATTERNS.values())
+
+# Price texts that add manual pricing conditions (ZPR0, ZK01)
+MANUAL_PRICING_MATCHER = re.compile("OVERRIDE|MANUAL", re.IGNORECASE)
+
+# Matcher resolving the pattern of each category with outcome parameters
+_MATCHER_BY_CATEGORY: Mapping[str, re.Pattern[str]] = MappingProxyType({
+    "delay": DELAY_MATCHER,
+    "expedite": EXPEDITE_MATCHER,
+    "split": SPLIT_MATCHER,
+    "price": PRICE_MATCHER,
+})
+
+# Pattern tables tried by _generate_text_pattern(), in order, with the
+# category they produce and the statistic they count towards
+_TEXT_PATTERN_TABLES = (
+    (DELAY_PATTERNS, "delay", "orders_with_delay_text"),
+    (EXPEDITE_PATTERNS, "expedite", "orders_with_expedite_text"),
+    (PRICE_PATTERNS, "price", "orders_with_price_text"),
+    (SPLIT_PATTERNS, "split", "orders_with_split_text"),
+    (RETURN_PATTERNS, "return", "orders_with_return_text"),
+)
+
+# Every text pattern flattened into one sequence, in the order they are
+# tried, as (probability, variants incl. the canonical text, category, stat)
+_TEXT_PATTERN_ENTRIES = tuple(
+    (info["probability"], (pattern, *info.get("variants", ())), category, stat)
+    for patterns, category, stat in _TEXT_PATTERN_TABLES
+    for pattern, info in patterns.items()
+)
+
+# Uniform draws consumed by one _add_text_noise() call: case change, which
+# addition, and the value of the addition
+_NOISE_ROLLS = 3
+
+# Uniform draws consumed by one _generate_text_pattern() call: whether there
+# is text, one per pattern, whether to use noise, the variant pick, and the
+# _NOISE_ROLLS for the chosen text
+_TEXT_ROLLS = 3 + len(_TEXT_PATTERN_ENTRIES) + _NOISE_ROLLS
+
+# Number of Faker names pooled for names in text noise
+_NOISE_NAME_POOL_SIZE = 200
 
 # =============================================================================
 # PRICING CONDITION CONFIGURATION (KONV)
@@ -135,7 +239,7 @@ NOISE_PATTERNS = [
 
 # Standard SAP SD pricing procedure condition types
 # Order follows typical SD pricing procedure (e.g., RVAA01)
-PRICING_PROCEDURE = [
+PRICING_PROCEDURE: tuple[tuple[Any, ...], ...] = (
     # Step, Counter, CondType, Description, CalcType, FromStep, ToStep, Required, ManualPct
     (10, 0, "PR00", "Price", "C", None, None, True, 0.0),  # Base price from material/customer
     (20, 0, "K004", "Material Discount %", "A", 10, None, False, 0.15),  # % off PR00
@@ -148,53 +252,153 @@ PRICING_PROCEDURE = [
     (400, 0, "HD00", "Header Discount", "A", None, None, False, 0.08),  # Header-level discount
     (500, 0, "AMIW", "Min Value Surcharge", "B", None, None, False, 0.02),  # Minimum order surcharge
     (900, 0, "NETW", "Net Value", "X", None, None, True, 0.0),  # Final subtotal
-]
+)
 
 # Manual override conditions (ZPR0, ZK01) - applied when PRICE OVERRIDE pattern present
-MANUAL_PRICING_CONDITIONS = [
+MANUAL_PRICING_CONDITIONS: tuple[tuple[Any, ...], ...] = (
     (35, 1, "ZPR0", "Manual Price Override", "B", None, None),  # Fixed price override
     (45, 1, "ZK01", "Manual Discount", "A", 10, None),  # Manual % discount
-]
+)
+
+# Conditions priced once per order on the header (kposn "000000")
+HEADER_CONDITION_TYPES = ("HD00", "AMIW", "NETW")
+
+# How an item-level condition is valued
+RULE_NONE = 0  # Not valued at item level
+RULE_BASE_PRICE = 1  # PR00: the item's net value
+RULE_TAX = 2  # MWST: tax rate on the running value
+RULE_FREIGHT = 3  # KF00: random fixed amount
+RULE_DISCOUNT = 4  # Other percentage conditions: random discount
+
+
+def _item_pricing_rule(kschl: str, krech: str) -> int:
+    """Valuation rule for an item-level condition type."""
+    if kschl == "PR00":
+        return RULE_BASE_PRICE
+    if kschl == "MWST":
+        return RULE_TAX
+    if kschl == "KF00":
+        return RULE_FREIGHT
+    if krech == "A":
+        return RULE_DISCOUNT
+    return RULE_NONE
+
+
+# Item-level steps of PRICING_PROCEDURE, resolved once at import: subtotal
+# and header-only steps are dropped, and the KONV step/counter strings are
+# preformatted as (kschl, ktext, krech, required, prob, stunr, zaession, rule)
+ITEM_PRICING_STEPS = tuple(
+    (
+        kschl, ktext, krech, required, prob, f"{step:03d}", f"{counter:02d}",
+        _item_pricing_rule(kschl, krech),
+    )
+    for step, counter, kschl, ktext, krech, _from, _to, required, prob in PRICING_PROCEDURE
+    if krech != "X" and kschl not in HEADER_CONDITION_TYPES
+)
+
+# MANUAL_PRICING_CONDITIONS as (kschl, ktext, krech, stunr, zaession)
+MANUAL_PRICING_STEPS = tuple(
+    (kschl, ktext, krech, f"{step:03d}", f"{counter:02d}")
+    for step, counter, kschl, ktext, krech, _from, _to in MANUAL_PRICING_CONDITIONS
+)
 
 # Tax rates by sales organization
-TAX_RATES = {
+TAX_RATES: Mapping[str, float] = MappingProxyType({
     "1000": 0.0875,   # US - varies by state, using avg
     "2000": 0.19,     # EU - German VAT
     "3000": 0.10,     # APAC - Singapore GST
-}
+})
 
 # =============================================================================
 # ORGANIZATIONAL DATA
 # =============================================================================
 
-SALES_ORGS = {
-    "1000": {"name": "US Sales", "region": "US", "currency": "USD"},
-    "2000": {"name": "EU Sales", "region": "EU", "currency": "EUR"},
-    "3000": {"name": "APAC Sales", "region": "APAC", "currency": "USD"},
-}
-
-PLANTS = {
-    "1000": {"name": "US Main Plant", "sales_org": "1000"},
-    "1100": {"name": "US Distribution", "sales_org": "1000"},
-    "2000": {"name": "EU Manufacturing", "sales_org": "2000"},
-    "3000": {"name": "APAC Hub", "sales_org": "3000"},
-}
-
-PLANT_TO_SALES_ORG = {
-    "1000": ["1000", "1100"],
-    "2000": ["2000"],
-    "3000": ["3000"],
-}
-
-INDUSTRIES = ["RETAIL", "INDUSTRIAL", "WHOLESALE", "GOVERNMENT"]
-MATERIAL_CATEGORIES = ["FINISHED", "SEMIFINISHED", "RAW"]
+SALES_ORGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "1000": MappingProxyType({"name": "US Sales", "region": "US", "currency": "USD"}),
+    "2000": MappingProxyType({"name": "EU Sales", "region": "EU", "currency": "EUR"}),
+    "3000": MappingProxyType({"name": "APAC Sales", "region": "APAC", "currency": "USD"}),
+})
+
+PLANTS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "1000": MappingProxyType({"name": "US Main Plant", "sales_org": "1000"}),
+    "1100": MappingProxyType({"name": "US Distribution", "sales_org": "1000"}),
+    "2000": MappingProxyType({"name": "EU Manufacturing", "sales_org": "2000"}),
+    "3000": MappingProxyType({"name": "APAC Hub", "sales_org": "3000"}),
+})
+
+PLANT_TO_SALES_ORG: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "1000": ("1000", "1100"),
+    "2000": ("2000",),
+    "3000": ("3000",),
+})
+
+# Tuple views of the tables above, indexed by sales org id, so per-document
+# lookups index a tuple instead of walking nested dicts
+_SALES_ORG_CODES = tuple(SALES_ORGS)
+_SALES_ORG_INDEX = {code: idx for idx, code in enumerate(_SALES_ORG_CODES)}
+_SALES_ORG_REGION = tuple(info["region"] for info in SALES_ORGS.values())
+_SALES_ORG_CURRENCY = tuple(info["currency"] for info in SALES_ORGS.values())
+_SALES_ORG_TAX_RATE = tuple(TAX_RATES.get(code, 0.10) for code in _SALES_ORG_CODES)
+
+# Plants per sales org id; orgs without plants may use any plant
+_PLANTS_BY_SALES_ORG = tuple(
+    tuple(PLANT_TO_SALES_ORG.get(code, list(PLANTS))) for code in _SALES_ORG_CODES
+)
+
+INDUSTRIES: tuple[str, ...] = ("RETAIL", "INDUSTRIAL", "WHOLESALE", "GOVERNMENT")
+MATERIAL_CATEGORIES: tuple[str, ...] = ("FINISHED", "SEMIFINISHED", "RAW")
+
+# Base price range (low, high) by material category, in MATERIAL_CATEGORIES order
+MATERIAL_PRICE_RANGES: tuple[tuple[float, float], ...] = (
+    (100.0, 5000.0),
+    (50.0, 2000.0),
+    (10.0, 500.0),
+)
+
+# Sales order types (AUART) as a codebook: an order's type is handled as
+# its integer code while the order is generated
+ORDER_TYPES = ("OR", "ZOR", "RE", "CR")
+ORDER_OR, ORDER_ZOR, ORDER_RE, ORDER_CR = range(len(ORDER_TYPES))
+
+# Relative frequency of each order type, as a cumulative distribution
+# sampled with one uniform draw (last bound pinned to 1.0)
+ORDER_TYPE_WEIGHTS = (0.85, 0.05, 0.03, 0.02)
+ORDER_TYPE_CDF: tuple[float, ...] = (
+    *(np.cumsum(ORDER_TYPE_WEIGHTS[:-1]) / sum(ORDER_TYPE_WEIGHTS)).tolist(),
+    1.0,
+)
+
+# Item category (PSTYV) by order type code: returns and credit memos use REN
+ITEM_CATEGORY_BY_ORDER_TYPE = ("TAN", "TAN", "REN", "REN")
+
+# Sales order distribution channels (VTWEG) and divisions (SPART)
+DISTRIBUTION_CHANNELS: tuple[str, ...] = ("10", "20")
+DIVISIONS: tuple[str, ...] = ("00", "10")
+
+# Upper bounds of items per sales order and schedule lines per item
+_MAX_ORDER_ITEMS = 5
+_MAX_SCHEDULE_LINES = 3
+
+# Item numbers (POSNR) by 1-based item position
+_POSNR_LABELS = tuple(f"{item * 10:06d}" for item in range(_MAX_ORDER_ITEMS + 1))
+
+# Schedule line numbers (ETENR) by 0-based line index
+_ETENR_LABELS = tuple(f"{line + 1:04d}" for line in range(_MAX_SCHEDULE_LINES))
+
+# Deliveries per order without a split pattern: 70% one, 20% two, 8% three
+# and 2% three or four (evenly), as a cumulative distribution over 1-4
+DELIVERY_COUNT_CDF: tuple[float, ...] = (0.70, 0.90, 0.99, 1.0)
+
+# Most deliveries (and so invoices) one order can produce: up to 4 by
+# default, or one per split of the split patterns
+_MAX_ORDER_DELIVERIES = max(len(DELIVERY_COUNT_CDF), *(high for _, high in _SPLIT_EXTRA_BOUNDS))
 
 
 # =============================================================================
 # DATA CLASSES FOR OUTPUT
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TextRecord:
     """Text record for header or item texts."""
     text_id: str
@@ -203,7 +407,7 @@ class TextRecord:
     changed_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleLine:
     """VBEP-shaped schedule line for sales order items."""
     etenr: str  # Schedule line number (0001, 0002, etc.)
@@ -218,7 +422,7 @@ class ScheduleLine:
     meins: str  # Unit of measure
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingCondition:
     """KONV-shaped pricing condition record."""
     knumv: str  # Condition document number
@@ -236,7 +440,7 @@ class PricingCondition:
     ktext: str  # Condition description
 
 
-@dataclass
+@dataclass(slots=True)
 class SalesOrderItem:
     """VBAP-shaped sales order item."""
     posnr: str  # Item number (000010, 000020, etc.)
@@ -246,11 +450,11 @@ class SalesOrderItem:
     netwr: float  # Net value
     waerk: str  # Currency
     pstyv: str  # Item category
-    item_texts: List[Dict] = field(default_factory=list)
-    schedule_lines: List[Dict] = field(default_factory=list)  # VBEP schedule lines
+    item_texts: list[dict] = field(default_factory=list)
+    schedule_lines: list[dict] = field(default_factory=list)  # VBEP schedule lines
 
 
-@dataclass
+@dataclass(slots=True)
 class SalesOrder:
     """VBAK-shaped sales order header."""
     vbeln: str  # Sales document number (10-digit)
@@ -266,12 +470,12 @@ class SalesOrder:
     knumv: str = ""  # Condition document number (links to KONV)
     netwr: float = 0.0  # Net value of order
     waerk: str = "USD"  # Currency
-    header_texts: List[Dict] = field(default_factory=list)
-    items: List[Dict] = field(default_factory=list)
-    conditions: List[Dict] = field(default_factory=list)  # KONV pricing conditions
+    header_texts: list[dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
+    conditions: list[dict] = field(default_factory=list)  # KONV pricing conditions
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryItem:
     """LIPS-shaped delivery item."""
     posnr: str  # Item number
@@ -282,18 +486,18 @@ class DeliveryItem:
     posnr_ref: str  # Reference item
 
 
-@dataclass
+@dataclass(slots=True)
 class Delivery:
     """LIKP-shaped delivery header."""
     vbeln: str  # Delivery number
     erdat: str  # Creation date
     wadat: str  # Planned goods issue date
-    wadat_ist: Optional[str]  # Actual goods issue date
+    wadat_ist: str | None  # Actual goods issue date
     kunnr: str  # Ship-to customer
-    items: List[Dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InvoiceItem:
     """VBRP-shaped invoice item."""
     posnr: str  # Item number
@@ -304,7 +508,7 @@ class InvoiceItem:
     posnr_ref: str  # Reference item
 
 
-@dataclass
+@dataclass(slots=True)
 class Invoice:
     """VBRK-shaped invoice header."""
     vbeln: str  # Invoice number
@@ -313,10 +517,10 @@ class Invoice:
     netwr: float  # Net value
     waerk: str  # Currency
     kunrg: str  # Payer
-    items: List[Dict] = field(default_factory=list)
+    items: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocFlow:
     """VBFA-shaped document flow record."""
     vbelv: str  # Preceding document
@@ -329,7 +533,70 @@ class DocFlow:
     erdat: str  # Creation date
 
 
-@dataclass
+class DocFlowTable:
+    """
+    VBFA document flow records stored column-wise, one list per DocFlow field.
+
+    Flows are added a document at a time, repeating the document-level
+    values for each of its items, so no per-flow object is created.
+    """
+
+    COLUMNS = tuple(f.name for f in fields(DocFlow))
+
+    def __init__(self) -> None:
+        self.vbelv: list[str] = []
+        self.posnv: list[str] = []
+        self.vbtyp_v: list[str] = []
+        self.vbeln: list[str] = []
+        self.posnn: list[str] = []
+        self.vbtyp_n: list[str] = []
+        self.rfmng: list[float] = []
+        self.erdat: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.vbelv)
+
+    def add_document(
+        self,
+        vbelv: str,
+        vbtyp_v: str,
+        vbeln: str,
+        vbtyp_n: str,
+        erdat: str,
+        posnv: list[str],
+        posnn: list[str],
+        rfmng: list[float],
+    ) -> None:
+        """Add one flow per item from document vbelv to document vbeln."""
+        n = len(posnv)
+        self.vbelv.extend([vbelv] * n)
+        self.posnv.extend(posnv)
+        self.vbtyp_v.extend([vbtyp_v] * n)
+        self.vbeln.extend([vbeln] * n)
+        self.posnn.extend(posnn)
+        self.vbtyp_n.extend([vbtyp_n] * n)
+        self.rfmng.extend(rfmng)
+        self.erdat.extend([erdat] * n)
+
+    def extend(self, other: DocFlowTable) -> None:
+        """Append all flows of another table."""
+        for name in self.COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+
+    def columns(self) -> dict[str, list[Any]]:
+        """Column lists by field name, in DocFlow field order."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yield each flow as a record dict."""
+        names = self.COLUMNS
+        return (
+            dict(zip(names, values, strict=True))
+            for values in zip(*self.columns().values(), strict=True)
+        )
+
+
+@dataclass(slots=True)
 class Customer:
     """Customer master data."""
     kunnr: str  # Customer number
@@ -340,7 +607,7 @@ class Customer:
     vkorg: str  # Sales organization
 
 
-@dataclass
+@dataclass(slots=True)
 class Material:
     """Material master data."""
     matnr: str  # Material number
@@ -352,13 +619,142 @@ class Material:
     base_price: float  # Base price for calculations
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMaster:
     """User master data (for created_by fields)."""
     bname: str  # User ID
     name_text: str  # User name
     vkorg: str  # Sales organization
-    werks: List[str]  # Assigned plants
+    werks: list[str]  # Assigned plants
+
+
+@dataclass(slots=True)
+class PatternContext:
+    """Text pattern of an order, resolved once against the pattern tables."""
+    category: str | None = None  # Pattern category, None for noise or no text
+    pattern_idx: int = -1  # Table index of the matched pattern of the category, -1 if none
+    manual_pricing: bool = False  # Price text asking for manual conditions
+
+    @classmethod
+    def resolve(cls, text: str | None, category: str | None) -> PatternContext:
+        """Match an order's header text against the table of its category."""
+        matcher = _MATCHER_BY_CATEGORY.get(category)
+        if not text or matcher is None:
+            return cls(category=category)
+        return cls(
+            category=category,
+            pattern_idx=_matching_pattern_index(matcher, text),
+            manual_pricing=category == "price" and MANUAL_PRICING_MATCHER.search(text) is not None,
+        )
+
+
+# Rows per Parquet row group; also bounds the record dicts held at once
+PARQUET_ROW_GROUP_SIZE = 64_000
+
+
+def _arrow_schema(cls: type, keys: tuple[str, ...] = ()) -> pa.Schema:
+    """
+    Arrow schema of a dataclass's scalar fields, preceded by string key
+    columns. List-valued fields are not included; they are written as
+    separate tables.
+
+    Raises:
+        TypeError: If a scalar field's annotation has no Arrow type
+    """
+    scalar_types = {"str": pa.string(), "str | None": pa.string(), "float": pa.float64()}
+    schema_fields = [pa.field(key, pa.string()) for key in keys]
+    for f in fields(cls):
+        if isinstance(f.type, str) and f.type.startswith("list["):
+            continue
+        if f.type not in scalar_types:
+            raise TypeError(f"No Parquet type for {cls.__name__}.{f.name}: {f.type}")
+        schema_fields.append(pa.field(f.name, scalar_types[f.type]))
+    return pa.schema(schema_fields)
+
+
+def _write_parquet(path: Path, schema: pa.Schema, records: Iterable[dict[str, Any]]) -> int:
+    """
+    Write record dicts to path as a Parquet table with the given schema.
+
+    Records are converted one row group at a time, so only that many dicts
+    exist at once; keys outside the schema are ignored. Repeated short
+    strings (document types, org codes, currencies) are dictionary encoded.
+
+    Returns:
+        Number of records written
+    """
+    records = iter(records)
+    count = 0
+    with pq.ParquetWriter(path, schema, compression="snappy", use_dictionary=True) as writer:
+        while batch := list(islice(records, PARQUET_ROW_GROUP_SIZE)):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def _write_rows_parquet(path: Path, schema: pa.Schema, rows: list[Any]) -> int:
+    """
+    Write dataclass rows to path as a Parquet table with the given schema.
+
+    Each row group is gathered straight into one list per schema column,
+    so no per-row record dict is built; fields outside the schema (nested
+    items and texts) are not read.
+
+    Returns:
+        Number of rows written
+    """
+    getters = [(name, attrgetter(name)) for name in schema.names]
+    with pq.ParquetWriter(path, schema, compression="snappy", use_dictionary=True) as writer:
+        for start in range(0, len(rows), PARQUET_ROW_GROUP_SIZE):
+            batch = rows[start:start + PARQUET_ROW_GROUP_SIZE]
+            columns = {name: list(map(getter, batch)) for name, getter in getters}
+            writer.write_table(pa.table(columns, schema=schema))
+    return len(rows)
+
+
+def _records(rows: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Record dicts of dataclass rows or of a DocFlowTable."""
+    if isinstance(rows, DocFlowTable):
+        return rows.records()
+    return map(row_record, rows)
+
+
+# Uniforms drawn per _RngPool refill
+RNG_POOL_BLOCK_SIZE = 1 << 16
+
+
+class _RngPool:
+    """
+    Scalar random draws served from blocks of uniforms drawn in bulk.
+
+    Document generation makes many conditional scalar draws. A scalar
+    Generator call costs far more than the value it draws, so the pool
+    draws RNG_POOL_BLOCK_SIZE uniforms at once and hands them out in order;
+    integer and range draws are derived from one uniform each.
+    """
+
+    def __init__(self, rng: np.random.Generator, block_size: int = RNG_POOL_BLOCK_SIZE):
+        self._rng = rng
+        self._block_size = block_size
+        self._values: list[float] = []
+        self._pos = 0
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)."""
+        pos = self._pos
+        if pos == len(self._values):
+            self._values = self._rng.random(self._block_size).tolist()
+            pos = 0
+        self._pos = pos + 1
+        return self._values[pos]
+
+    def integers(self, low: int, high: int) -> int:
+        """Uniform int in [low, high)."""
+        return low + int(self.random() * (high - low))
+
+    def uniform(self, low: float, high: float) -> float:
+        """Uniform float in [low, high)."""
+        return low + (high - low) * self.random()
 
 
 # =============================================================================
@@ -381,9 +777,12 @@ class SAPSDGenerator:
         output_dir: str = "sample_output",
         start_date: str = "2024-01-01",
         end_date: str = "2024-12-31",
+        jobs: int = 1,
     ):
         self.count = count
         self.seed = seed
+        # jobs=0 uses one worker per CPU
+        self.jobs = max(1, jobs if jobs else os.cpu_count() or 1)
         self.output_dir = Path(output_dir)
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
@@ -391,7 +790,9 @@ class SAPSDGenerator:
 
         # Initialize random generators with seed for reproducibility
         self.rng = np.random.default_rng(seed)
-        random.seed(seed)
+        # Scalar draws of document generation, served in bulk from self.rng
+        self._pool = _RngPool(self.rng)
+        # Faker keeps its own seeded stream; it only names master data and noise
         self.faker = Faker()
         Faker.seed(seed)
 
@@ -401,20 +802,38 @@ class SAPSDGenerator:
         self.invoice_counter = 9000000000
 
         # Master data storage
-        self.customers: List[Customer] = []
-        self.materials: List[Material] = []
-        self.users: List[UserMaster] = []
+        self.customers: list[Customer] = []
+        self.materials: list[Material] = []
+        self.users: list[UserMaster] = []
 
         # Transaction data storage
-        self.sales_orders: List[SalesOrder] = []
-        self.deliveries: List[Delivery] = []
-        self.invoices: List[Invoice] = []
-        self.doc_flows: List[DocFlow] = []
+        self.sales_orders: list[SalesOrder] = []
+        self.deliveries: list[Delivery] = []
+        self.invoices: list[Invoice] = []
+        self.doc_flows = DocFlowTable()
 
         # Lookup maps
-        self.customer_by_id: Dict[str, Customer] = {}
-        self.material_by_id: Dict[str, Material] = {}
-        self.user_by_org: Dict[str, List[UserMaster]] = defaultdict(list)
+        self.customer_by_id: dict[str, Customer] = {}
+        self.material_by_id: dict[str, Material] = {}
+        self.user_by_org: dict[str, list[UserMaster]] = defaultdict(list)
+
+        # User names by sales org, set by _index_users()
+        self._all_user_names: list[str] = []
+        self._user_names_by_org: dict[str, list[str]] = {}
+
+        # ISO date labels by day offset from start_date, see _date_label()
+        self._date_labels = [
+            (self.start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+            for day in range(self.date_range_days + 1)
+        ]
+
+        # Faker names and "MM/DD" labels for every day of the period, for
+        # names and dates in text noise
+        self._noise_names = [self.faker.name() for _ in range(_NOISE_NAME_POOL_SIZE)]
+        self._noise_dates = [
+            (self.start_date + timedelta(days=day)).strftime("%m/%d")
+            for day in range(self.date_range_days + 1)
+        ]
 
         # Statistics tracking
         self.stats = {
@@ -447,188 +866,188 @@ class SAPSDGenerator:
         self.invoice_counter += 1
         return str(self.invoice_counter)
 
-    def _random_date(self) -> datetime:
-        """Generate random date within configured range."""
-        days = self.rng.integers(0, self.date_range_days)
-        return self.start_date + timedelta(days=int(days))
+    def _date_label(self, day: int) -> str:
+        """ISO date string for a day offset from start_date."""
+        labels = self._date_labels
+        # Follow-on documents can fall past end_date; extend the table as needed
+        while day >= len(labels):
+            labels.append(
+                (self.start_date + timedelta(days=len(labels))).strftime("%Y-%m-%d")
+            )
+        return labels[day]
 
     def _random_time(self) -> str:
         """Generate random time string HH:MM:SS."""
-        hour = self.rng.integers(6, 20)
-        minute = self.rng.integers(0, 60)
-        second = self.rng.integers(0, 60)
+        hour = self._pool.integers(6, 20)
+        minute = self._pool.integers(0, 60)
+        second = self._pool.integers(0, 60)
         return f"{hour:02d}:{minute:02d}:{second:02d}"
 
-    def _weighted_choice(self, options: Dict[str, float]) -> str:
-        """Select from weighted options."""
-        choices = list(options.keys())
-        weights = list(options.values())
-        return self.rng.choice(choices, p=np.array(weights) / sum(weights))
-
     # =========================================================================
     # MASTER DATA GENERATION
     # =========================================================================
 
     def generate_customers(self, num_customers: int = 500) -> None:
-        """Generate customer master data."""
-        for i in range(num_customers):
+        """Generate customer master data, drawing each random column at once."""
+        org_idxs = self.rng.integers(0, len(_SALES_ORG_CODES), size=num_customers).tolist()
+        industry_idxs = self.rng.integers(0, len(INDUSTRIES), size=num_customers).tolist()
+
+        for i, (org_idx, industry_idx) in enumerate(zip(org_idxs, industry_idxs, strict=True)):
             kunnr = f"CUST{i + 1:04d}"
-            vkorg = self.rng.choice(list(SALES_ORGS.keys()))
-            region = SALES_ORGS[vkorg]["region"]
+            region = _SALES_ORG_REGION[org_idx]
 
             customer = Customer(
                 kunnr=kunnr,
                 name1=self.faker.company(),
                 land1=region,
                 regio=region,
-                brsch=self.rng.choice(INDUSTRIES),
-                vkorg=vkorg,
+                brsch=INDUSTRIES[industry_idx],
+                vkorg=_SALES_ORG_CODES[org_idx],
             )
             self.customers.append(customer)
             self.customer_by_id[kunnr] = customer
 
     def generate_materials(self, num_materials: int = 200) -> None:
-        """Generate material master data."""
-        for i in range(num_materials):
-            matnr = f"MAT{i + 1:03d}"
-            category = self.rng.choice(MATERIAL_CATEGORIES)
+        """Generate material master data, drawing each random column at once."""
+        category_idxs = self.rng.integers(0, len(MATERIAL_CATEGORIES), size=num_materials)
+        weights = self.rng.uniform(0.5, 50.0, size=num_materials).round(2).tolist()
 
-            # Price ranges by category
-            price_ranges = {
-                "FINISHED": (100.0, 5000.0),
-                "SEMIFINISHED": (50.0, 2000.0),
-                "RAW": (10.0, 500.0),
-            }
-            price_range = price_ranges[category]
+        # Base price uniform within the range of each material's category
+        price_bounds = np.array(MATERIAL_PRICE_RANGES)[category_idxs]
+        prices = self.rng.uniform(price_bounds[:, 0], price_bounds[:, 1]).round(2).tolist()
+
+        for i, (category_idx, brgew, base_price) in enumerate(
+            zip(category_idxs.tolist(), weights, prices, strict=True)
+        ):
+            matnr = f"MAT{i + 1:03d}"
+            category = MATERIAL_CATEGORIES[category_idx]
 
             material = Material(
                 matnr=matnr,
                 maktx=f"{self.faker.word().title()} {self.faker.word().title()} {category}",
                 mtart=category,
                 meins="EA",
-                brgew=round(self.rng.uniform(0.5, 50.0), 2),
+                brgew=brgew,
                 gewei="KG",
-                base_price=round(self.rng.uniform(price_range[0], price_range[1]), 2),
+                base_price=base_price,
             )
             self.materials.append(material)
             self.material_by_id[matnr] = material
 
     def generate_users(self, num_users: int = 50) -> None:
-        """Generate user master data."""
-        for i in range(num_users):
+        """Generate user master data, drawing sales orgs at once."""
+        org_idxs = self.rng.integers(0, len(_SALES_ORG_CODES), size=num_users).tolist()
+
+        for i, org_idx in enumerate(org_idxs):
             bname = f"USER{i + 1:03d}"
-            vkorg = self.rng.choice(list(SALES_ORGS.keys()))
-            available_plants = PLANT_TO_SALES_ORG.get(vkorg, list(PLANTS.keys()))
+            vkorg = _SALES_ORG_CODES[org_idx]
 
             user = UserMaster(
                 bname=bname,
                 name_text=self.faker.name(),
                 vkorg=vkorg,
-                werks=list(available_plants),
+                werks=list(_PLANTS_BY_SALES_ORG[org_idx]),
             )
             self.users.append(user)
             self.user_by_org[vkorg].append(user)
 
+    def _index_users(self) -> None:
+        """Build the user name lists sampled by _get_user_for_org()."""
+        self._all_user_names = [user.bname for user in self.users]
+        self._user_names_by_org = {
+            vkorg: [user.bname for user in users]
+            for vkorg, users in self.user_by_org.items()
+            if users
+        }
+
     def _get_user_for_org(self, vkorg: str) -> str:
-        """Get a random user for the given sales organization."""
-        if self.user_by_org[vkorg]:
-            return self.rng.choice(self.user_by_org[vkorg]).bname
-        return self.rng.choice(self.users).bname
+        """Get a random user for the given sales organization, or any user if it has none."""
+        names = self._user_names_by_org.get(vkorg, self._all_user_names)
+        return names[self._pool.integers(0, len(names))]
 
     # =========================================================================
     # TEXT PATTERN GENERATION
     # =========================================================================
 
-    def _generate_text_pattern(self) -> Tuple[Optional[str], Optional[str]]:
+    def _generate_text_pattern(
+        self, rolls: list[float] | None = None
+    ) -> tuple[str | None, str | None]:
         """
         Generate text content with pattern or noise.
         Returns (text_content, pattern_category) where category is None for noise.
+
+        The decision consumes _TEXT_ROLLS uniform draws, taken from `rolls`
+        when pre-sampled and otherwise drawn in a single call.
         """
+        if rolls is None:
+            rolls = self.rng.random(_TEXT_ROLLS).tolist()
+
         # 60% of orders have some text
-        if self.rng.random() > 0.60:
+        if rolls[0] > 0.60:
             return None, None
 
-        # Check each pattern category with its probability
-        # Delay patterns
-        for pattern, info in DELAY_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["orders_with_delay_text"] += 1
-                return self._add_text_noise(chosen), "delay"
-
-        # Expedite patterns
-        for pattern, info in EXPEDITE_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["orders_with_expedite_text"] += 1
-                return self._add_text_noise(chosen), "expedite"
-
-        # Price patterns
-        for pattern, info in PRICE_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["orders_with_price_text"] += 1
-                return self._add_text_noise(chosen), "price"
-
-        # Split patterns
-        for pattern, info in SPLIT_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["orders_with_split_text"] += 1
-                return self._add_text_noise(chosen), "split"
-
-        # Return patterns
-        for pattern, info in RETURN_PATTERNS.items():
-            if self.rng.random() < info["probability"]:
-                variants = [pattern] + info.get("variants", [])
-                chosen = self.rng.choice(variants)
-                self.stats["orders_with_return_text"] += 1
-                return self._add_text_noise(chosen), "return"
+        # Selects the variant or noise text once a branch is taken
+        pick = rolls[-_NOISE_ROLLS - 1]
+        noise_rolls = rolls[-_NOISE_ROLLS:]
+
+        # Delay, expedite, price, split and return patterns, in order
+        for roll, (probability, variants, category, stat) in zip(
+            rolls[1:len(_TEXT_PATTERN_ENTRIES) + 1], _TEXT_PATTERN_ENTRIES, strict=True
+        ):
+            if roll < probability:
+                chosen = variants[int(pick * len(variants))]
+                self.stats[stat] += 1
+                return self._add_text_noise(chosen, noise_rolls), category
 
         # Noise patterns (10% as specified)
-        if self.rng.random() < 0.10:
-            chosen = self.rng.choice(NOISE_PATTERNS)
+        if rolls[len(_TEXT_PATTERN_ENTRIES) + 1] < 0.10:
+            chosen = NOISE_PATTERNS[int(pick * len(NOISE_PATTERNS))]
             self.stats["orders_with_noise_text"] += 1
-            return self._add_text_noise(chosen), "noise"
+            return self._add_text_noise(chosen, noise_rolls), "noise"
 
         return None, None
 
-    def _add_text_noise(self, text: str) -> str:
-        """Add realistic noise to text: context, abbreviations, typos."""
-        noise_additions = [
-            "",
-            " - customer needs by Friday",
-            f" - {self.faker.name()}",
-            f" REF#{self.faker.bothify('####')}",
-            " - please expedite",
-            " per customer request",
-            " - mgmt approved",
-            f" {self.faker.date_this_year().strftime('%m/%d')}",
-        ]
+    def _add_text_noise(self, text: str, rolls: list[float]) -> str:
+        """
+        Add realistic noise to text: context, abbreviations, typos.
+
+        Driven by _NOISE_ROLLS uniform draws: case change, which addition,
+        and the name, reference number or date the addition uses.
+        """
+        case_roll, addition_roll, value_roll = rolls
 
         # Randomly apply casing variations
-        case_choice = self.rng.random()
-        if case_choice < 0.3:
+        if case_roll < 0.3:
             text = text.upper()
-        elif case_choice < 0.5:
+        elif case_roll < 0.5:
             text = text.lower()
 
-        # Add noise
-        text += self.rng.choice(noise_additions)
-
+        # Add noise; only the chosen addition is built
+        addition = int(addition_roll * 8)
+        if addition == 1:
+            text += " - customer needs by Friday"
+        elif addition == 2:
+            names = self._noise_names
+            text += f" - {names[int(value_roll * len(names))]}"
+        elif addition == 3:
+            text += f" REF#{int(value_roll * 10000):04d}"
+        elif addition == 4:
+            text += " - please expedite"
+        elif addition == 5:
+            text += " per customer request"
+        elif addition == 6:
+            text += " - mgmt approved"
+        elif addition == 7:
+            text += f" {self._noise_dates[int(value_roll * len(self._noise_dates))]}"
         return text
 
-    def _create_text_record(self, text: str, created_date: datetime) -> Dict:
-        """Create a text record dictionary."""
+    def _create_text_record(self, text: str, created_day: int) -> dict:
+        """Create a text record dictionary, changed at midnight of a day offset."""
         return {
-            "text_id": self.faker.bothify("####"),
+            "text_id": f"{self._pool.integers(0, 10000):04d}",
             "text": text,
             "lang": "EN",
-            "changed_at": created_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "changed_at": f"{self._date_label(created_day)}T00:00:00Z",
         }
 
     # =========================================================================
@@ -637,110 +1056,79 @@ class SAPSDGenerator:
 
     def _calculate_delivery_timing(
         self,
-        order_date: datetime,
-        requested_date: datetime,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> Tuple[datetime, datetime, bool]:
+        order_day: int,
+        requested_day: int,
+        pattern: PatternContext,
+    ) -> tuple[int, int, bool]:
         """
-        Calculate planned and actual delivery dates based on patterns.
-        Returns (planned_date, actual_date, is_delayed).
+        Calculate planned and actual delivery dates based on patterns, as
+        day offsets from start_date.
+        Returns (planned_day, actual_day, is_delayed).
         """
         # Base delivery time: 3-7 days from order
-        base_days = int(self.rng.integers(3, 8))
-        planned_date = requested_date
+        base_days = self._pool.integers(3, 8)
+        planned_day = requested_day
 
         # Calculate actual date based on patterns
         actual_days = base_days
 
         # Check for delay patterns in text
-        if pattern_category == "delay":
-            # Find which delay pattern matched
-            for pattern, info in DELAY_PATTERNS.items():
-                all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-                if any(v in t.upper() for v in all_variants for t in text_patterns):
-                    delay_min, delay_max = info["delay_days"]
-                    actual_days += int(self.rng.integers(delay_min, delay_max + 1))
-                    break
+        if pattern.category == "delay":
+            # Delay range of the matched delay pattern
+            if pattern.pattern_idx >= 0:
+                actual_days += self._pool.integers(*_DELAY_DAY_BOUNDS[pattern.pattern_idx])
 
         # Check for expedite patterns
-        elif pattern_category == "expedite":
-            for pattern, info in EXPEDITE_PATTERNS.items():
-                all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-                if any(v in t.upper() for v in all_variants for t in text_patterns):
-                    reduction = info["reduction_days"]
-                    actual_days = max(1, actual_days - reduction)
-                    break
+        elif pattern.category == "expedite":
+            if pattern.pattern_idx >= 0:
+                reduction = _EXPEDITE_REDUCTION_DAYS[pattern.pattern_idx]
+                actual_days = max(1, actual_days - reduction)
 
         # Random timing anomalies
         else:
-            roll = self.rng.random()
+            roll = self._pool.random()
             # 15% of deliveries: actual > requested (delays)
             if roll < 0.15:
-                delay = int(self.rng.integers(1, 8))
+                delay = self._pool.integers(1, 8)
                 actual_days += delay
                 self.stats["deliveries_delayed"] += 1
 
                 # 5% significantly later (>10 days)
                 if roll < 0.05:
-                    actual_days += int(self.rng.integers(10, 20))
+                    actual_days += self._pool.integers(10, 20)
                     self.stats["deliveries_severely_delayed"] += 1
 
-        actual_date = order_date + timedelta(days=actual_days)
-        is_delayed = actual_date > planned_date
+        actual_day = order_day + actual_days
+        is_delayed = actual_day > planned_day
 
-        return planned_date, actual_date, is_delayed
+        return planned_day, actual_day, is_delayed
 
-    def _calculate_invoice_date(
-        self, delivery_date: datetime, text_patterns: List[str]
-    ) -> datetime:
-        """Calculate invoice date based on delivery date and patterns."""
+    def _calculate_invoice_date(self, delivery_day: int) -> int:
+        """Calculate invoice date (day offset) based on delivery date (day offset)."""
         # Base: 1-3 days after delivery
-        base_days = int(self.rng.integers(1, 4))
+        base_days = self._pool.integers(1, 4)
 
         # 10% of invoices: >7 days after delivery (invoice lag)
-        if self.rng.random() < 0.10:
-            base_days += int(self.rng.integers(7, 14))
+        if self._pool.random() < 0.10:
+            base_days += self._pool.integers(7, 14)
             self.stats["invoices_lagged"] += 1
 
-        return delivery_date + timedelta(days=base_days)
+        return delivery_day + base_days
 
-    def _determine_delivery_count(
-        self, text_patterns: List[str], pattern_category: Optional[str]
-    ) -> int:
+    def _determine_delivery_count(self, pattern: PatternContext) -> int:
         """Determine number of deliveries for an order."""
         # Check for split patterns
-        if pattern_category == "split":
-            for pattern, info in SPLIT_PATTERNS.items():
-                all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-                if any(v in t.upper() for v in all_variants for t in text_patterns):
-                    extra_min, extra_max = info["extra_deliveries"]
-                    return 1 + int(self.rng.integers(extra_min, extra_max + 1))
-
-        # Default distribution: 70% single, 20% two, 8% three, 2% more
-        roll = self.rng.random()
-        if roll < 0.70:
-            return 1
-        elif roll < 0.90:
-            return 2
-        elif roll < 0.98:
-            return 3
-        else:
-            return int(self.rng.integers(3, 5))
+        if pattern.category == "split" and pattern.pattern_idx >= 0:
+            return 1 + self._pool.integers(*_SPLIT_EXTRA_BOUNDS[pattern.pattern_idx])
 
-    def _apply_price_modification(
-        self, base_price: float, text_patterns: List[str], pattern_category: Optional[str]
-    ) -> float:
-        """Apply price modifications based on text patterns."""
-        if pattern_category != "price":
-            return base_price
+        # Default distribution, sampled with one uniform draw
+        return 1 + bisect_right(DELIVERY_COUNT_CDF, self._pool.random())
 
-        for pattern, info in PRICE_PATTERNS.items():
-            all_variants = [pattern.upper()] + [v.upper() for v in info.get("variants", [])]
-            if any(v in t.upper() for v in all_variants for t in text_patterns):
-                factor_min, factor_max = info["price_factor"]
-                factor = self.rng.uniform(factor_min, factor_max)
-                return base_price * factor
+    def _apply_price_modification(self, base_price: float, pattern: PatternContext) -> float:
+        """Apply price modifications based on text patterns."""
+        if pattern.category == "price" and pattern.pattern_idx >= 0:
+            factor = self._pool.uniform(*_PRICE_FACTOR_RANGES[pattern.pattern_idx])
+            return base_price * factor
 
         return base_price
 
@@ -750,76 +1138,76 @@ class SAPSDGenerator:
 
     def _generate_schedule_lines(
         self,
-        order_date: datetime,
-        requested_date: datetime,
+        order_day: int,
+        requested_day: int,
         quantity: float,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> List[Dict]:
+        pattern: PatternContext,
+    ) -> list[dict]:
         """
         Generate VBEP-style schedule lines for an item.
 
         Most items have 1 schedule line, but backorder/partial scenarios
-        may have multiple lines representing split confirmations.
+        may have multiple lines representing split confirmations. Dates are
+        day offsets from start_date.
         """
         schedule_lines = []
         remaining_qty = quantity
 
         # Determine number of schedule lines
         num_lines = 1
-        if pattern_category == "split":
-            num_lines = int(self.rng.integers(2, 4))
-        elif pattern_category == "delay":
+        if pattern.category == "split":
+            num_lines = self._pool.integers(2, _MAX_SCHEDULE_LINES + 1)
+        elif pattern.category == "delay":
             # Delayed items sometimes have partial confirmations
-            if self.rng.random() < 0.3:
+            if self._pool.random() < 0.3:
                 num_lines = 2
 
         # Calculate base ATP date (material availability)
-        base_atp_days = int(self.rng.integers(1, 4))
-        if pattern_category == "delay":
-            base_atp_days += int(self.rng.integers(5, 15))
+        base_atp_days = self._pool.integers(1, 4)
+        if pattern.category == "delay":
+            base_atp_days += self._pool.integers(5, 15)
 
         for line_idx in range(num_lines):
-            etenr = f"{(line_idx + 1):04d}"
+            etenr = _ETENR_LABELS[line_idx]
 
             # Quantity for this schedule line
             if line_idx < num_lines - 1:
-                line_qty = round(remaining_qty * self.rng.uniform(0.3, 0.7), 0)
+                line_qty = round(remaining_qty * self._pool.uniform(0.3, 0.7), 0)
             else:
                 line_qty = remaining_qty
             remaining_qty -= line_qty
 
             # Dates for this schedule line
-            atp_offset = base_atp_days + (line_idx * int(self.rng.integers(3, 10)))
-            mbdat = order_date + timedelta(days=atp_offset)
+            atp_offset = base_atp_days + (line_idx * self._pool.integers(3, 10))
+            mbdat = order_day + atp_offset
 
             # Loading date: 1-2 days after ATP
-            lddat = mbdat + timedelta(days=int(self.rng.integers(1, 3)))
+            lddat = mbdat + self._pool.integers(1, 3)
 
             # Transport planning: 1 day after loading
-            tddat = lddat + timedelta(days=1)
+            tddat = lddat + 1
 
             # Goods issue: 1-2 days after transport planning
-            wadat = tddat + timedelta(days=int(self.rng.integers(1, 3)))
+            wadat = tddat + self._pool.integers(1, 3)
 
             # Confirmed delivery: requested or later based on ATP
-            confirmed_date = max(requested_date, wadat + timedelta(days=int(self.rng.integers(1, 3))))
+            confirmed_day = max(requested_day, wadat + self._pool.integers(1, 3))
             if line_idx > 0:
-                confirmed_date += timedelta(days=int(self.rng.integers(5, 15)))
+                confirmed_day += self._pool.integers(5, 15)
 
             schedule_line = ScheduleLine(
                 etenr=etenr,
-                edatu=confirmed_date.strftime("%Y-%m-%d"),
+                edatu=self._date_label(confirmed_day),
                 wmeng=line_qty,
                 bmeng=line_qty,
-                mbdat=mbdat.strftime("%Y-%m-%d"),
-                lddat=lddat.strftime("%Y-%m-%d"),
-                tddat=tddat.strftime("%Y-%m-%d"),
-                wadat=wadat.strftime("%Y-%m-%d"),
+                mbdat=self._date_label(mbdat),
+                lddat=self._date_label(lddat),
+                tddat=self._date_label(tddat),
+                wadat=self._date_label(wadat),
                 lmeng=quantity if line_idx == 0 else 0.0,  # Required qty only on first line
                 meins="EA",
             )
-            schedule_lines.append(asdict(schedule_line))
+            schedule_lines.append(row_record(schedule_line))
 
         return schedule_lines
 
@@ -830,20 +1218,20 @@ class SAPSDGenerator:
     def _generate_pricing_conditions(
         self,
         vbeln: str,
-        items: List[Dict],
+        items: list[dict],
         vkorg: str,
-        pattern_category: Optional[str],
-        text_patterns: List[str],
-    ) -> Tuple[List[Dict], float]:
+        pattern: PatternContext,
+    ) -> tuple[list[dict], float]:
         """
         Generate KONV-style pricing conditions following standard pricing procedure.
 
         Returns (conditions_list, total_net_value).
         """
         knumv = f"K{vbeln}"  # Condition document number
-        conditions = []
-        currency = SALES_ORGS[vkorg]["currency"]
-        tax_rate = TAX_RATES.get(vkorg, 0.10)
+        conditions: list[dict] = []
+        org_idx = _SALES_ORG_INDEX[vkorg]
+        currency = _SALES_ORG_CURRENCY[org_idx]
+        tax_rate = _SALES_ORG_TAX_RATE[org_idx]
 
         # Track totals for header conditions
         total_gross = 0.0
@@ -852,10 +1240,7 @@ class SAPSDGenerator:
         total_tax = 0.0
 
         # Check if manual pricing is involved
-        has_manual_pricing = pattern_category == "price" and any(
-            "OVERRIDE" in t.upper() or "MANUAL" in t.upper()
-            for t in text_patterns
-        )
+        has_manual_pricing = pattern.manual_pricing
 
         # Generate item-level conditions
         for item in items:
@@ -867,43 +1252,34 @@ class SAPSDGenerator:
             running_value = base_value
             item_gross = base_value
 
-            for step_info in PRICING_PROCEDURE:
-                step, counter, kschl, ktext, krech, from_step, to_step, required, prob = step_info
-
-                # Skip subtotal steps at item level
-                if krech == "X":
-                    continue
-
-                # Skip header-only conditions at item level
-                if kschl in ("HD00", "AMIW", "NETW"):
-                    continue
-
+            # Subtotal and header-only steps are not priced per item
+            for kschl, ktext, krech, required, prob, stunr, zaession, rule in ITEM_PRICING_STEPS:
                 # Determine if this condition applies
                 applies = required
                 if not required and prob > 0:
-                    applies = self.rng.random() < prob
+                    applies = self._pool.random() < prob
 
                 if not applies:
                     continue
 
                 # Calculate condition value
-                if kschl == "PR00":
+                if rule == RULE_BASE_PRICE:
                     # Base price - already calculated
                     kbetr = unit_price
                     kwert = base_value
-                elif kschl == "MWST":
+                elif rule == RULE_TAX:
                     # Tax on running value
                     kbetr = tax_rate * 100  # Tax rate as percentage
                     kwert = round(running_value * tax_rate, 2)
                     total_tax += kwert
-                elif kschl == "KF00":
+                elif rule == RULE_FREIGHT:
                     # Freight - fixed per item
-                    kbetr = round(self.rng.uniform(5.0, 50.0), 2)
+                    kbetr = round(self._pool.uniform(5.0, 50.0), 2)
                     kwert = kbetr
                     total_freight += kwert
-                elif krech == "A":
+                elif rule == RULE_DISCOUNT:
                     # Percentage discount
-                    discount_pct = self.rng.uniform(0.02, 0.15)
+                    discount_pct = self._pool.uniform(0.02, 0.15)
                     kbetr = -round(discount_pct * 100, 2)  # Negative for discounts
                     kwert = -round(running_value * discount_pct, 2)
                     running_value += kwert  # Reduce running value
@@ -911,121 +1287,116 @@ class SAPSDGenerator:
                 else:
                     continue
 
-                condition = PricingCondition(
-                    knumv=knumv,
-                    kposn=posnr,
-                    stunr=f"{step:03d}",
-                    zaession=f"{counter:02d}",
-                    kschl=kschl,
-                    kbetr=kbetr,
-                    konwa=currency if krech != "A" else "%",
-                    kpein=1.0,
-                    kmein="EA",
-                    kwert=kwert,
-                    krech=krech,
-                    kawrt=item_gross if krech == "A" else 0.0,
-                    ktext=ktext,
-                )
-                conditions.append(asdict(condition))
+                conditions.append({
+                    "knumv": knumv,
+                    "kposn": posnr,
+                    "stunr": stunr,
+                    "zaession": zaession,
+                    "kschl": kschl,
+                    "kbetr": kbetr,
+                    "konwa": currency if krech != "A" else "%",
+                    "kpein": 1.0,
+                    "kmein": "EA",
+                    "kwert": kwert,
+                    "krech": krech,
+                    "kawrt": item_gross if krech == "A" else 0.0,
+                    "ktext": ktext,
+                })
 
             total_gross += item_gross
 
             # Add manual pricing conditions if applicable
             if has_manual_pricing:
-                for manual_step, manual_counter, manual_kschl, manual_ktext, manual_krech, manual_from, manual_to in MANUAL_PRICING_CONDITIONS:
-                    if self.rng.random() < 0.5:  # 50% chance each manual condition appears
+                for manual_kschl, manual_ktext, manual_krech, manual_stunr, manual_zaession in MANUAL_PRICING_STEPS:
+                    if self._pool.random() < 0.5:  # 50% chance each manual condition appears
                         if manual_krech == "B":
                             # Fixed override
-                            override_value = round(self.rng.uniform(-100, 200), 2)
+                            override_value = round(self._pool.uniform(-100, 200), 2)
                             kwert = override_value
                             kbetr = override_value
                         else:
                             # Percentage adjustment
-                            adj_pct = self.rng.uniform(-0.10, 0.15)
+                            adj_pct = self._pool.uniform(-0.10, 0.15)
                             kbetr = round(adj_pct * 100, 2)
                             kwert = round(running_value * adj_pct, 2)
 
-                        condition = PricingCondition(
-                            knumv=knumv,
-                            kposn=posnr,
-                            stunr=f"{manual_step:03d}",
-                            zaession=f"{manual_counter:02d}",
-                            kschl=manual_kschl,
-                            kbetr=kbetr,
-                            konwa=currency if manual_krech == "B" else "%",
-                            kpein=1.0,
-                            kmein="EA",
-                            kwert=kwert,
-                            krech=manual_krech,
-                            kawrt=running_value,
-                            ktext=manual_ktext,
-                        )
-                        conditions.append(asdict(condition))
+                        conditions.append({
+                            "knumv": knumv,
+                            "kposn": posnr,
+                            "stunr": manual_stunr,
+                            "zaession": manual_zaession,
+                            "kschl": manual_kschl,
+                            "kbetr": kbetr,
+                            "konwa": currency if manual_krech == "B" else "%",
+                            "kpein": 1.0,
+                            "kmein": "EA",
+                            "kwert": kwert,
+                            "krech": manual_krech,
+                            "kawrt": running_value,
+                            "ktext": manual_ktext,
+                        })
 
         # Add header-level conditions (kposn = "000000")
         # Header discount
-        if self.rng.random() < 0.08:
-            hd_pct = self.rng.uniform(0.02, 0.10)
+        if self._pool.random() < 0.08:
+            hd_pct = self._pool.uniform(0.02, 0.10)
             hd_value = -round(total_gross * hd_pct, 2)
-            condition = PricingCondition(
-                knumv=knumv,
-                kposn="000000",
-                stunr="400",
-                zaession="00",
-                kschl="HD00",
-                kbetr=-round(hd_pct * 100, 2),
-                konwa="%",
-                kpein=1.0,
-                kmein="",
-                kwert=hd_value,
-                krech="A",
-                kawrt=total_gross,
-                ktext="Header Discount",
-            )
-            conditions.append(asdict(condition))
+            conditions.append({
+                "knumv": knumv,
+                "kposn": "000000",
+                "stunr": "400",
+                "zaession": "00",
+                "kschl": "HD00",
+                "kbetr": -round(hd_pct * 100, 2),
+                "konwa": "%",
+                "kpein": 1.0,
+                "kmein": "",
+                "kwert": hd_value,
+                "krech": "A",
+                "kawrt": total_gross,
+                "ktext": "Header Discount",
+            })
             total_discounts += abs(hd_value)
 
         # Minimum order surcharge for small orders
-        if total_gross < 100 and self.rng.random() < 0.5:
-            surcharge = round(self.rng.uniform(10, 25), 2)
-            condition = PricingCondition(
-                knumv=knumv,
-                kposn="000000",
-                stunr="500",
-                zaession="00",
-                kschl="AMIW",
-                kbetr=surcharge,
-                konwa=currency,
-                kpein=1.0,
-                kmein="",
-                kwert=surcharge,
-                krech="B",
-                kawrt=0.0,
-                ktext="Minimum Value Surcharge",
-            )
-            conditions.append(asdict(condition))
+        if total_gross < 100 and self._pool.random() < 0.5:
+            surcharge = round(self._pool.uniform(10, 25), 2)
+            conditions.append({
+                "knumv": knumv,
+                "kposn": "000000",
+                "stunr": "500",
+                "zaession": "00",
+                "kschl": "AMIW",
+                "kbetr": surcharge,
+                "konwa": currency,
+                "kpein": 1.0,
+                "kmein": "",
+                "kwert": surcharge,
+                "krech": "B",
+                "kawrt": 0.0,
+                "ktext": "Minimum Value Surcharge",
+            })
             total_freight += surcharge
 
         # Calculate final net value
         net_value = round(total_gross - total_discounts + total_freight + total_tax, 2)
 
         # Add net value subtotal
-        condition = PricingCondition(
-            knumv=knumv,
-            kposn="000000",
-            stunr="900",
-            zaession="00",
-            kschl="NETW",
-            kbetr=0.0,
-            konwa=currency,
-            kpein=1.0,
-            kmein="",
-            kwert=net_value,
-            krech="X",
-            kawrt=0.0,
-            ktext="Net Value",
-        )
-        conditions.append(asdict(condition))
+        conditions.append({
+            "knumv": knumv,
+            "kposn": "000000",
+            "stunr": "900",
+            "zaession": "00",
+            "kschl": "NETW",
+            "kbetr": 0.0,
+            "konwa": currency,
+            "kpein": 1.0,
+            "kmein": "",
+            "kwert": net_value,
+            "krech": "X",
+            "kawrt": 0.0,
+            "ktext": "Net Value",
+        })
 
         return conditions, net_value
 
@@ -1033,87 +1404,94 @@ class SAPSDGenerator:
     # DOCUMENT GENERATION
     # =========================================================================
 
-    def _generate_sales_order(self, customer: Customer) -> SalesOrder:
-        """Generate a single sales order with items."""
-        order_date = self._random_date()
+    def _generate_sales_order(
+        self, customer: Customer, order_day: int | None = None
+    ) -> tuple[SalesOrder, PatternContext, int, int]:
+        """
+        Generate a single sales order with items.
+
+        order_day is the order date as a day offset from start_date; a
+        random day is drawn when it is not pre-sampled. Returns the order,
+        its resolved text pattern (which also drives its deliveries) and its
+        order and requested delivery dates as day offsets.
+        """
+        if order_day is None:
+            order_day = self._pool.integers(0, self.date_range_days)
         vkorg = customer.vkorg
         ernam = self._get_user_for_org(vkorg)
 
         # Generate text pattern
         text_content, pattern_category = self._generate_text_pattern()
-        text_patterns = [text_content] if text_content else []
+        pattern = PatternContext.resolve(text_content, pattern_category)
 
-        # Determine order type
-        order_type_weights = {"OR": 0.85, "ZOR": 0.05, "RE": 0.03, "CR": 0.02}
-
-        # Override for return patterns
+        # Determine order type, overridden for return patterns
         if pattern_category == "return":
-            auart = "RE"
+            order_type = ORDER_RE
             self.stats["returns"] += 1
         else:
-            auart = self._weighted_choice(order_type_weights)
-            if auart == "RE":
+            order_type = bisect_right(ORDER_TYPE_CDF, self._pool.random())
+            if order_type == ORDER_RE:
                 self.stats["returns"] += 1
-            elif auart == "CR":
+            elif order_type == ORDER_CR:
                 self.stats["credit_memos"] += 1
 
         # ~5% cancellations (tracked separately)
-        if self.rng.random() < 0.05 and auart == "OR":
+        if self._pool.random() < 0.05 and order_type == ORDER_OR:
             self.stats["cancellations"] += 1
 
         # Requested delivery date: 5-14 days from order
-        vdatu = order_date + timedelta(days=int(self.rng.integers(5, 15)))
+        vdatu_day = order_day + self._pool.integers(5, 15)
 
         # Generate items (1-5 items per order typically)
-        num_items = int(self.rng.integers(1, 6))
+        num_items = self._pool.integers(1, _MAX_ORDER_ITEMS + 1)
         items = []
-        available_plants = PLANT_TO_SALES_ORG.get(vkorg, list(PLANTS.keys()))
+        # Item category based on order type
+        pstyv = ITEM_CATEGORY_BY_ORDER_TYPE[order_type]
+        org_idx = _SALES_ORG_INDEX[vkorg]
+        currency = _SALES_ORG_CURRENCY[org_idx]
+        available_plants = _PLANTS_BY_SALES_ORG[org_idx]
 
         for item_idx in range(1, num_items + 1):
-            material = self.rng.choice(self.materials)
-            kwmeng = float(self.rng.integers(1, 100))
+            material = self.materials[self._pool.integers(0, len(self.materials))]
+            kwmeng = float(self._pool.integers(1, 100))
             base_price = material.base_price
-            price = self._apply_price_modification(base_price, text_patterns, pattern_category)
+            price = self._apply_price_modification(base_price, pattern)
             netwr = round(kwmeng * price, 2)
 
-            # Item category based on order type
-            pstyv = "TAN" if auart not in ("RE", "CR") else "REN"
-
             # Item texts (15% of items have texts)
             item_texts = []
-            if self.rng.random() < 0.15:
+            if self._pool.random() < 0.15:
                 item_text, _ = self._generate_text_pattern()
                 if item_text:
                     item_texts.append(
-                        self._create_text_record(item_text, order_date)
+                        self._create_text_record(item_text, order_day)
                     )
 
             # Generate schedule lines (VBEP) for this item
             schedule_lines = self._generate_schedule_lines(
-                order_date=order_date,
-                requested_date=vdatu,
+                order_day=order_day,
+                requested_day=vdatu_day,
                 quantity=kwmeng,
-                text_patterns=text_patterns,
-                pattern_category=pattern_category,
+                pattern=pattern,
             )
 
             item = SalesOrderItem(
-                posnr=f"{item_idx * 10:06d}",
+                posnr=_POSNR_LABELS[item_idx],
                 matnr=material.matnr,
-                werks=self.rng.choice(available_plants),
+                werks=available_plants[self._pool.integers(0, len(available_plants))],
                 kwmeng=kwmeng,
                 netwr=netwr,
-                waerk=SALES_ORGS[vkorg]["currency"],
+                waerk=currency,
                 pstyv=pstyv,
                 item_texts=item_texts,
                 schedule_lines=schedule_lines,
             )
-            items.append(asdict(item))
+            items.append(row_record(item))
 
         # Header texts
         header_texts = []
         if text_content:
-            header_texts.append(self._create_text_record(text_content, order_date))
+            header_texts.append(self._create_text_record(text_content, order_day))
 
         # Generate document number first (needed for pricing conditions)
         vbeln = self._next_order_number()
@@ -1123,137 +1501,143 @@ class SAPSDGenerator:
             vbeln=vbeln,
             items=items,
             vkorg=vkorg,
-            pattern_category=pattern_category,
-            text_patterns=text_patterns,
+            pattern=pattern,
         )
 
         order = SalesOrder(
             vbeln=vbeln,
-            auart=auart,
+            auart=ORDER_TYPES[order_type],
             vkorg=vkorg,
-            vtweg=self.rng.choice(["10", "20"]),
-            spart=self.rng.choice(["00", "10"]),
+            vtweg=DISTRIBUTION_CHANNELS[self._pool.integers(0, len(DISTRIBUTION_CHANNELS))],
+            spart=DIVISIONS[self._pool.integers(0, len(DIVISIONS))],
             kunnr=customer.kunnr,
-            erdat=order_date.strftime("%Y-%m-%d"),
+            erdat=self._date_label(order_day),
             erzet=self._random_time(),
             ernam=ernam,
-            vdatu=vdatu.strftime("%Y-%m-%d"),
+            vdatu=self._date_label(vdatu_day),
             knumv=f"K{vbeln}",  # Condition document number
             netwr=order_netwr,
-            waerk=SALES_ORGS[vkorg]["currency"],
+            waerk=currency,
             header_texts=header_texts,
             items=items,
             conditions=conditions,
         )
 
-        return order, text_patterns, pattern_category
+        return order, pattern, order_day, vdatu_day
 
     def _generate_deliveries(
         self,
         order: SalesOrder,
-        text_patterns: List[str],
-        pattern_category: Optional[str],
-    ) -> List[Delivery]:
-        """Generate deliveries for a sales order (0-3 per order)."""
+        pattern: PatternContext,
+        order_day: int,
+        requested_day: int,
+    ) -> list[tuple[Delivery, int]]:
+        """
+        Generate deliveries for a sales order (0-3 per order).
+
+        Returns each delivery with its actual goods issue date as a day
+        offset, which its invoice is dated from.
+        """
         # Return orders and credit memos may not have deliveries
         if order.auart in ("CR",):
             return []
 
         # Determine number of deliveries
-        num_deliveries = self._determine_delivery_count(text_patterns, pattern_category)
+        num_deliveries = self._determine_delivery_count(pattern)
 
         # Random chance of no delivery (partial fulfillment scenarios)
-        if self.rng.random() < 0.02:
+        if self._pool.random() < 0.02:
             return []
 
-        order_date = datetime.strptime(order.erdat, "%Y-%m-%d")
-        requested_date = datetime.strptime(order.vdatu, "%Y-%m-%d")
-
         deliveries = []
 
-        # Split items across deliveries
-        items_per_delivery = [[] for _ in range(num_deliveries)]
-        for idx, item in enumerate(order.items):
-            delivery_idx = idx % num_deliveries
-            items_per_delivery[delivery_idx].append(item)
-
-        for del_idx, del_items in enumerate(items_per_delivery):
+        # Split items round-robin across deliveries
+        for del_idx in range(num_deliveries):
+            del_items = order.items[del_idx::num_deliveries]
             if not del_items:
                 continue
 
             # Calculate timing
-            planned_date, actual_date, _ = self._calculate_delivery_timing(
-                order_date, requested_date, text_patterns, pattern_category
+            planned_day, actual_day, _ = self._calculate_delivery_timing(
+                order_day, requested_day, pattern
             )
 
             # Stagger subsequent deliveries
             if del_idx > 0:
-                actual_date += timedelta(days=int(self.rng.integers(3, 10)) * del_idx)
-                planned_date = actual_date - timedelta(days=int(self.rng.integers(0, 3)))
+                actual_day += self._pool.integers(3, 10) * del_idx
+                planned_day = actual_day - self._pool.integers(0, 3)
 
-            # Create delivery items
+            # Create delivery items and their flow references in one pass
             delivery_items = []
+            flow_posnr = []
+            flow_qty = []
             for item in del_items:
+                posnr = item["posnr"]
+                lfimg = item["kwmeng"]  # Full quantity delivered
                 del_item = DeliveryItem(
-                    posnr=item["posnr"],
+                    posnr=posnr,
                     matnr=item["matnr"],
-                    lfimg=item["kwmeng"],  # Full quantity delivered
+                    lfimg=lfimg,
                     werks=item["werks"],
                     vbeln_ref=order.vbeln,
-                    posnr_ref=item["posnr"],
+                    posnr_ref=posnr,
                 )
-                delivery_items.append(asdict(del_item))
+                delivery_items.append(row_record(del_item))
+                flow_posnr.append(posnr)
+                flow_qty.append(lfimg)
 
             delivery = Delivery(
                 vbeln=self._next_delivery_number(),
-                erdat=order_date.strftime("%Y-%m-%d"),
-                wadat=planned_date.strftime("%Y-%m-%d"),
-                wadat_ist=actual_date.strftime("%Y-%m-%d"),
+                erdat=order.erdat,
+                wadat=self._date_label(planned_day),
+                wadat_ist=self._date_label(actual_day),
                 kunnr=order.kunnr,
                 items=delivery_items,
             )
-            deliveries.append(delivery)
+            deliveries.append((delivery, actual_day))
 
             # Create document flow records: Order -> Delivery
-            for del_item in delivery_items:
-                flow = DocFlow(
-                    vbelv=order.vbeln,
-                    posnv=del_item["posnr_ref"],
-                    vbtyp_v="C",  # Sales Order
-                    vbeln=delivery.vbeln,
-                    posnn=del_item["posnr"],
-                    vbtyp_n="J",  # Delivery
-                    rfmng=del_item["lfimg"],
-                    erdat=delivery.erdat,
-                )
-                self.doc_flows.append(flow)
+            self.doc_flows.add_document(
+                vbelv=order.vbeln,
+                vbtyp_v="C",  # Sales Order
+                vbeln=delivery.vbeln,
+                vbtyp_n="J",  # Delivery
+                erdat=delivery.erdat,
+                posnv=flow_posnr,
+                posnn=flow_posnr,
+                rfmng=flow_qty,
+            )
 
         return deliveries
 
     def _generate_invoice(
         self,
         delivery: Delivery,
+        delivery_day: int,
         order: SalesOrder,
-        text_patterns: List[str],
-    ) -> Optional[Invoice]:
-        """Generate invoice for a delivery (0-1 per delivery)."""
+        order_items_by_posnr: dict[str, dict],
+    ) -> Invoice | None:
+        """
+        Generate invoice for a delivery (0-1 per delivery).
+
+        delivery_day is the delivery's actual goods issue date as a day offset;
+        order_items_by_posnr maps the order's item numbers to its items.
+        """
         # ~5% of deliveries don't get invoiced immediately
-        if self.rng.random() < 0.05:
+        if self._pool.random() < 0.05:
             return None
 
-        delivery_date = datetime.strptime(delivery.wadat_ist, "%Y-%m-%d")
-        invoice_date = self._calculate_invoice_date(delivery_date, text_patterns)
+        invoice_date = self._date_label(self._calculate_invoice_date(delivery_day))
 
-        # Calculate invoice items and total
+        # Calculate invoice items, their flow references and the total
         invoice_items = []
+        flow_posnr = []
+        flow_qty = []
         total_netwr = 0.0
 
         for del_item in delivery.items:
             # Find matching order item for pricing
-            order_item = next(
-                (oi for oi in order.items if oi["posnr"] == del_item["posnr_ref"]),
-                None
-            )
+            order_item = order_items_by_posnr.get(del_item["posnr_ref"])
             if not order_item:
                 continue
 
@@ -1263,39 +1647,41 @@ class SAPSDGenerator:
             )
             total_netwr += netwr
 
+            posnr = del_item["posnr"]
+            fkimg = del_item["lfimg"]
             inv_item = InvoiceItem(
-                posnr=del_item["posnr"],
+                posnr=posnr,
                 matnr=del_item["matnr"],
-                fkimg=del_item["lfimg"],
+                fkimg=fkimg,
                 netwr=netwr,
                 vbeln_ref=delivery.vbeln,
-                posnr_ref=del_item["posnr"],
+                posnr_ref=posnr,
             )
-            invoice_items.append(asdict(inv_item))
+            invoice_items.append(row_record(inv_item))
+            flow_posnr.append(posnr)
+            flow_qty.append(fkimg)
 
         invoice = Invoice(
             vbeln=self._next_invoice_number(),
-            fkdat=invoice_date.strftime("%Y-%m-%d"),
-            erdat=invoice_date.strftime("%Y-%m-%d"),
+            fkdat=invoice_date,
+            erdat=invoice_date,
             netwr=round(total_netwr, 2),
-            waerk=SALES_ORGS[order.vkorg]["currency"],
+            waerk=order.waerk,
             kunrg=order.kunnr,
             items=invoice_items,
         )
 
         # Create document flow records: Delivery -> Invoice
-        for inv_item in invoice_items:
-            flow = DocFlow(
-                vbelv=delivery.vbeln,
-                posnv=inv_item["posnr_ref"],
-                vbtyp_v="J",  # Delivery
-                vbeln=invoice.vbeln,
-                posnn=inv_item["posnr"],
-                vbtyp_n="M",  # Invoice
-                rfmng=inv_item["fkimg"],
-                erdat=invoice.erdat,
-            )
-            self.doc_flows.append(flow)
+        self.doc_flows.add_document(
+            vbelv=delivery.vbeln,
+            vbtyp_v="J",  # Delivery
+            vbeln=invoice.vbeln,
+            vbtyp_n="M",  # Invoice
+            erdat=invoice.erdat,
+            posnv=flow_posnr,
+            posnn=flow_posnr,
+            rfmng=flow_qty,
+        )
 
         return invoice
 
@@ -1326,29 +1712,10 @@ class SAPSDGenerator:
         # Generate transaction data
         print(f"\nGenerating {self.count} sales orders with document chains...")
 
-        for i in range(self.count):
-            # Select customer (weighted toward some customers having more orders)
-            customer = self.rng.choice(self.customers)
-
-            # Generate sales order
-            order, text_patterns, pattern_category = self._generate_sales_order(customer)
-            self.sales_orders.append(order)
-
-            # Generate deliveries
-            order_deliveries = self._generate_deliveries(
-                order, text_patterns, pattern_category
-            )
-            self.deliveries.extend(order_deliveries)
-
-            # Generate invoices
-            for delivery in order_deliveries:
-                invoice = self._generate_invoice(delivery, order, text_patterns)
-                if invoice:
-                    self.invoices.append(invoice)
-
-            # Progress update
-            if (i + 1) % 1000 == 0:
-                print(f"  Generated {i + 1} orders...")
+        if self.jobs > 1 and self.count > 1:
+            self._generate_documents_parallel()
+        else:
+            self._generate_documents()
 
         print(f"\nGeneration complete:")
         print(f"  Sales Orders: {len(self.sales_orders)}")
@@ -1373,34 +1740,244 @@ class SAPSDGenerator:
         print(f"  Severely Delayed (>10 days): {self.stats['deliveries_severely_delayed']}")
         print(f"  Invoice Lag (>7 days): {self.stats['invoices_lagged']}")
 
-    def save_output(self) -> None:
-        """Save all generated data to JSON files."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    def _generate_documents(self, report_progress: bool = True) -> None:
+        """Generate `count` order -> delivery -> invoice chains in this process."""
+        self._index_users()
+
+        # Order dates (as day offsets from start_date) and customers for the
+        # whole run, drawn up front
+        order_days = self.rng.integers(0, self.date_range_days, size=self.count).tolist()
+        customer_idxs = self.rng.integers(0, len(self.customers), size=self.count).tolist()
+
+        for i in range(self.count):
+            customer = self.customers[customer_idxs[i]]
 
-        def to_dict_list(items):
-            """Convert dataclass items to dict list."""
-            return [asdict(item) if hasattr(item, "__dataclass_fields__") else item for item in items]
-
-        # Save transaction data as arrays of objects
-        files = {
-            "orders.json": [asdict(o) for o in self.sales_orders],
-            "deliveries.json": [asdict(d) for d in self.deliveries],
-            "invoices.json": [asdict(i) for i in self.invoices],
-            "doc_flows.json": [asdict(df) for df in self.doc_flows],
-            "customers.json": [asdict(c) for c in self.customers],
-            "materials.json": [asdict(m) for m in self.materials],
-            "vendors.json": [],  # Stub for MM module compatibility
+            # Generate sales order
+            order, pattern, order_day, requested_day = self._generate_sales_order(
+                customer, order_days[i]
+            )
+            self.sales_orders.append(order)
+
+            # Generate deliveries, then invoices
+            order_items_by_posnr = {oi["posnr"]: oi for oi in order.items}
+            for delivery, delivery_day in self._generate_deliveries(
+                order, pattern, order_day, requested_day
+            ):
+                self.deliveries.append(delivery)
+                invoice = self._generate_invoice(
+                    delivery, delivery_day, order, order_items_by_posnr
+                )
+                if invoice:
+                    self.invoices.append(invoice)
+
+            # Progress update
+            if report_progress and (i + 1) % 1000 == 0:
+                print(f"  Generated {i + 1} orders...")
+
+    def _generate_documents_parallel(self) -> None:
+        """
+        Generate the document chains in `jobs` worker processes.
+
+        The order range is split into contiguous shards. Each shard gets its
+        own random stream spawned from the seed, so output is reproducible
+        for a given seed and job count (but differs from a single-process
+        run). Each shard numbers its orders from its first order index and
+        its deliveries and invoices from _MAX_ORDER_DELIVERIES times that,
+        so delivery and invoice number ranges have gaps between shards.
+        """
+        jobs = min(self.jobs, self.count)
+        bounds = np.linspace(0, self.count, jobs + 1).astype(int)
+        shard_seeds = np.random.SeedSequence(self.seed).spawn(jobs)
+        master_data = (self.customers, self.materials, self.users)
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _generate_shard,
+                    self._shard_params(start, stop, shard_seed),
+                    master_data,
+                )
+                for start, stop, shard_seed in zip(
+                    bounds[:-1], bounds[1:], shard_seeds, strict=True
+                )
+            ]
+            for future in futures:
+                orders, deliveries, invoices, doc_flows, stats = future.result()
+                self.sales_orders.extend(orders)
+                self.deliveries.extend(deliveries)
+                self.invoices.extend(invoices)
+                self.doc_flows.extend(doc_flows)
+                for key, value in stats.items():
+                    self.stats[key] += value
+                print(f"  Generated {len(self.sales_orders)} orders...")
+
+    def _shard_params(
+        self, start: int, stop: int, shard_seed: np.random.SeedSequence
+    ) -> dict[str, Any]:
+        """Constructor and counter settings for the generator of one shard."""
+        return {
+            "count": int(stop - start),
+            "seed": int(shard_seed.generate_state(1)[0]),
+            "start_date": self.start_date.strftime("%Y-%m-%d"),
+            "end_date": self.end_date.strftime("%Y-%m-%d"),
+            "first_doc": int(start),
         }
 
+    def save_output(self, output_format: str = "json") -> None:
+        """
+        Save all generated data, one file per table.
+
+        Args:
+            output_format: 'json' (indented JSON arrays, documents with
+                nested items) or 'parquet' (normalized columnar tables,
+                requires pyarrow)
+        """
+        if output_format == "parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+            written = self._save_parquet()
+        elif output_format == "json":
+            written = self._save_json()
+        else:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
         print("\nSaving output files...")
-        for filename, data in files.items():
-            filepath = self.output_dir / filename
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"  {filepath} ({len(data)} records)")
+        for filepath, count in written:
+            print(f"  {filepath} ({count} records)")
 
         print("\nDone!")
 
+    def _save_json(self) -> Iterator[tuple[Path, int]]:
+        """
+        Write one JSON file per table, yielding each path and record count.
+
+        Each table is streamed record by record (see record_io.dump_records), so no
+        list of all record dicts is built.
+        """
+        tables = {
+            "orders": self.sales_orders,
+            "deliveries": self.deliveries,
+            "invoices": self.invoices,
+            "doc_flows": self.doc_flows,
+            "customers": self.customers,
+            "materials": self.materials,
+            "vendors": [],  # Stub for MM module compatibility
+        }
+        for name, rows in tables.items():
+            filepath = self.output_dir / f"{name}.json"
+            yield filepath, dump_records(filepath, _records(rows))
+
+    def _save_parquet(self) -> Iterator[tuple[Path, int]]:
+        """
+        Write one Parquet file per table, yielding each path and row count.
+
+        Document headers, document flows and master data are written
+        column-wise. Document items are normalized into their own tables
+        keyed by document number (order_items, schedule_lines,
+        order_conditions, order_texts, delivery_items, invoice_items), so no
+        column is nested. Order header texts have a null posnr. The empty
+        vendors stub of the JSON output is not written.
+        """
+        orders, deliveries, invoices = self.sales_orders, self.deliveries, self.invoices
+        row_tables = {
+            "orders": (SalesOrder, orders),
+            "deliveries": (Delivery, deliveries),
+            "invoices": (Invoice, invoices),
+            "customers": (Customer, self.customers),
+            "materials": (Material, self.materials),
+        }
+        for name, (cls, rows) in row_tables.items():
+            filepath = self.output_dir / f"{name}.parquet"
+            yield filepath, _write_rows_parquet(filepath, _arrow_schema(cls), rows)
+
+        # Flows are already columnar: one Arrow array per column
+        filepath = self.output_dir / "doc_flows.parquet"
+        pq.write_table(
+            pa.table(self.doc_flows.columns(), schema=_arrow_schema(DocFlow)),
+            filepath, compression="snappy", use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+        )
+        yield filepath, len(self.doc_flows)
+
+        record_tables = {
+            "order_items": (
+                _arrow_schema(SalesOrderItem, ("vbeln",)),
+                ({"vbeln": order.vbeln, **item} for order in orders for item in order.items),
+            ),
+            "schedule_lines": (
+                _arrow_schema(ScheduleLine, ("vbeln", "posnr")),
+                (
+                    {"vbeln": order.vbeln, "posnr": item["posnr"], **line}
+                    for order in orders
+                    for item in order.items
+                    for line in item["schedule_lines"]
+                ),
+            ),
+            "order_conditions": (
+                _arrow_schema(PricingCondition),
+                (condition for order in orders for condition in order.conditions),
+            ),
+            "order_texts": (
+                _arrow_schema(TextRecord, ("vbeln", "posnr")),
+                self._order_text_records(),
+            ),
+            "delivery_items": (
+                _arrow_schema(DeliveryItem, ("vbeln",)),
+                ({"vbeln": d.vbeln, **item} for d in deliveries for item in d.items),
+            ),
+            "invoice_items": (
+                _arrow_schema(InvoiceItem, ("vbeln",)),
+                ({"vbeln": inv.vbeln, **item} for inv in invoices for item in inv.items),
+            ),
+        }
+        for name, (schema, records) in record_tables.items():
+            filepath = self.output_dir / f"{name}.parquet"
+            yield filepath, _write_parquet(filepath, schema, records)
+
+    def _order_text_records(self) -> Iterator[dict[str, Any]]:
+        """Order header and item texts as flat records keyed by vbeln/posnr."""
+        for order in self.sales_orders:
+            for text in order.header_texts:
+                yield {"vbeln": order.vbeln, "posnr": None, **text}
+            for item in order.items:
+                for text in item["item_texts"]:
+                    yield {"vbeln": order.vbeln, "posnr": item["posnr"], **text}
+
+
+def _generate_shard(
+    params: dict[str, Any],
+    master_data: tuple[list[Customer], list[Material], list[UserMaster]],
+) -> tuple[list[SalesOrder], list[Delivery], list[Invoice], DocFlowTable, dict[str, int]]:
+    """
+    Generate one shard of document chains in a worker process.
+
+    Returns only the shard's documents, flows and statistics, so none of the
+    worker generator's other state is pickled back to the parent.
+    """
+    first_doc = params.pop("first_doc")
+    generator = SAPSDGenerator(**params)
+    generator.order_counter += first_doc
+    generator.delivery_counter += first_doc * _MAX_ORDER_DELIVERIES
+    generator.invoice_counter += first_doc * _MAX_ORDER_DELIVERIES
+
+    generator.customers, generator.materials, generator.users = master_data
+    generator.customer_by_id = {customer.kunnr: customer for customer in generator.customers}
+    generator.material_by_id = {material.matnr: material for material in generator.materials}
+    for user in generator.users:
+        generator.user_by_org[user.vkorg].append(user)
+
+    generator._generate_documents(report_progress=False)
+
+    return (
+        generator.sales_orders,
+        generator.deliveries,
+        generator.invoices,
+        generator.doc_flows,
+        generator.stats,
+    )
+
 
 def main():
     """Main entry point for the generator CLI."""
@@ -1411,6 +1988,7 @@ def main():
 Examples:
   python src/generate_sd.py --count 10000 --output sample_output/ --seed 42
   python src/generate_sd.py --count 5000 --seed 123
+  python src/generate_sd.py --count 50000 --format parquet
         """
     )
     parser.add_argument(
@@ -1443,8 +2021,22 @@ Examples:
         default="2024-12-31",
         help="End date for documents (default: 2024-12-31)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for document generation; 0 uses all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "parquet"],
+        default="json",
+        help="Output file format; parquet requires pyarrow (default: json)",
+    )
 
     args = parser.parse_args()
+    if args.format == "parquet" and not PYARROW_AVAILABLE:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
 
     generator = SAPSDGenerator(
         count=args.count,
@@ -1452,10 +2044,11 @@ Examples:
         output_dir=args.output,
         start_date=args.start_date,
         end_date=args.end_date,
+        jobs=args.jobs,
     )
 
     generator.generate_all()
-    generator.save_output()
+    generator.save_output(args.format)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""
+Record serialization shared by the SAP SD and MM synthetic data generators.
+
+Converts slotted document dataclasses to plain record dicts and streams
+records to JSON array files, using orjson when it is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from functools import cache, partial
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@cache
+def _row_accessor(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    """Field names of a dataclass and a getter returning their values as a tuple."""
+    names = tuple(f.name for f in fields(cls))
+    return names, attrgetter(*names)
+
+
+def row_record(row: Any) -> dict[str, Any]:
+    """
+    Return a dataclass row's fields as a dict, without asdict()'s deep copy.
+
+    Nested values of the document dataclasses are already plain dicts and
+    lists, so they are shared with the row rather than copied.
+    """
+    names, getter = _row_accessor(type(row))
+    return dict(zip(names, getter(row), strict=True))
+
+
+def dump_records(path: Path, records: Iterable[dict[str, Any]], indent: int | None = 2) -> int:
+    """
+    Stream record dicts to path as a JSON array, one record at a time.
+
+    Only one record is encoded at a time, so memory does not grow with the
+    number of records. Uses orjson when installed (much faster, and NumPy
+    values serialize natively), otherwise the standard library. orjson only
+    supports 2-space indentation, so any truthy indent is written that way.
+    The output matches dumping the whole list in one call.
+
+    Returns:
+        Number of records written
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        encode = partial(orjson.dumps, option=option)
+        separator = b","
+    else:
+        def encode(record: dict[str, Any]) -> bytes:
+            return json.dumps(record, indent=indent or None).encode()
+        separator = b", "
+
+    if indent:
+        # Nest each record one level inside the array
+        pad = b"\n" + b" " * (2 if ORJSON_AVAILABLE else indent)
+        open_, separator, close = b"[" + pad, b"," + pad, b"\n]"
+    else:
+        pad, open_, close = None, b"[", b"]"
+
+    count = 0
+    with open(path, "wb") as f:
+        for record in records:
+            data = encode(record)
+            f.write(separator if count else open_)
+            f.write(data.replace(b"\n", pad) if pad else data)
+            count += 1
+        f.write(close if count else b"[]")
+    return count
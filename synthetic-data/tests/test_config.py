@@ -0,0 +1,79 @@
+"""
+Tests for generator configuration.
+
+Tests cover:
+- Default configs are plain, independent containers
+- Default configs survive asdict, deepcopy and pickle
+- Presets
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from src.config import GeneratorConfig, apply_preset, get_default_config
+
+
+class TestGeneratorConfigDefaults:
+    """Tests for GeneratorConfig default values."""
+
+    def test_defaults_are_plain_containers(self):
+        """Test collection defaults are plain lists and dicts."""
+        config = GeneratorConfig()
+
+        assert type(config.sales_orgs) is list
+        assert type(config.plant_sales_org_map) is dict
+        assert all(type(v) is list for v in config.plant_sales_org_map.values())
+        assert type(config.order_types) is dict
+        assert type(config.timing) is dict
+        assert type(config.timing["normal_delivery"]) is dict
+
+    def test_defaults_are_independent(self):
+        """Test editing one config's collections leaves other configs unchanged."""
+        config = GeneratorConfig()
+        config.sales_orgs.append("9000")
+        config.plant_sales_org_map["1000"].append("9000")
+        config.timing["normal_delivery"]["mean"] = 99
+
+        other = GeneratorConfig()
+        assert "9000" not in other.sales_orgs
+        assert "9000" not in other.plant_sales_org_map["1000"]
+        assert other.timing["normal_delivery"]["mean"] == 5
+
+    def test_asdict(self):
+        """Test a default config converts to a dict."""
+        data = dataclasses.asdict(GeneratorConfig())
+
+        assert data["sales_orgs"] == GeneratorConfig().sales_orgs
+        assert data["timing"]["delivery_to_invoice"]["max"] == 14
+
+    def test_deepcopy(self):
+        """Test a default config and the default config set deep-copy."""
+        config = GeneratorConfig()
+        assert copy.deepcopy(config) == config
+
+        defaults = get_default_config()
+        assert copy.deepcopy(defaults)["generator"] == defaults["generator"]
+
+    def test_pickle(self):
+        """Test a default config round-trips through pickle."""
+        config = GeneratorConfig()
+        assert pickle.loads(pickle.dumps(config)) == config
+
+
+class TestPresets:
+    """Tests for apply_preset."""
+
+    def test_apply_preset(self):
+        """Test a preset overrides the output counts."""
+        config = apply_preset(GeneratorConfig(), "large")
+
+        assert config.num_sales_orders == 25000
+        assert config.num_customers == 400
+
+    def test_unknown_preset(self):
+        """Test an unknown preset raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown preset"):
+            apply_preset(GeneratorConfig(), "huge")
@@ -0,0 +1,177 @@
+"""
+Tests for the SAP MM document generator.
+
+Tests cover:
+- Reproducible output for a fixed seed and job count
+- Unique document numbers across parallel shards
+- Goods receipt delays for the matched quality pattern
+- Parquet output matching the JSON output row for row
+- Parquet schemas rejecting fields without an Arrow type
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from src.generate_mm import SAPMMGenerator
+from src.record_io import row_record
+
+
+def _generate(tmp_path, jobs):
+    generator = SAPMMGenerator(count=300, seed=11, output_dir=str(tmp_path), jobs=jobs)
+    generator.generate_all()
+    return generator
+
+
+def _documents(generator):
+    return (
+        [row_record(po) for po in generator.purchase_orders],
+        [row_record(gr) for gr in generator.goods_receipts],
+        [row_record(ir) for ir in generator.invoice_receipts],
+        generator.doc_flows.columns(),
+        generator.stats,
+    )
+
+
+class TestParallelGeneration:
+    """Tests for generating document chains in worker processes."""
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_fixed_seed_and_jobs_is_reproducible(self, tmp_path, jobs):
+        """Test the same seed and job count give identical documents."""
+        first = _documents(_generate(tmp_path, jobs))
+        second = _documents(_generate(tmp_path, jobs))
+
+        assert first == second
+
+    def test_document_numbers_unique_across_shards(self, tmp_path):
+        """Test PO, GR and IR numbers do not collide between shards."""
+        generator = _generate(tmp_path, jobs=3)
+
+        assert len(generator.purchase_orders) == 300
+        for numbers in (
+            [po.ebeln for po in generator.purchase_orders],
+            [gr.mblnr for gr in generator.goods_receipts],
+            [ir.belnr for ir in generator.invoice_receipts],
+        ):
+            assert len(set(numbers)) == len(numbers)
+
+
+class TestGoodsReceiptTiming:
+    """Tests for goods receipt timing by text pattern."""
+
+    @pytest.mark.parametrize("pattern_key", ["DAMAGED GOODS", None])
+    def test_no_quality_hold_without_hold_days(self, tmp_path, pattern_key):
+        """Test quality patterns without hold_days add no delay."""
+        generator = SAPMMGenerator(count=1, seed=11, output_dir=str(tmp_path))
+
+        assert generator._calculate_gr_timing(10, "quality", pattern_key, 2) == 12
+
+    def test_quality_hold_adds_hold_days(self, tmp_path):
+        """Test QC HOLD delays the goods receipt by its hold_days range."""
+        generator = SAPMMGenerator(count=1, seed=11, output_dir=str(tmp_path))
+
+        for _ in range(50):
+            gr_day = generator._calculate_gr_timing(10, "quality", "QC HOLD", 2)
+            assert 12 + 3 <= gr_day <= 12 + 14
+
+
+class TestParquetOutput:
+    """Tests for the normalized Parquet tables."""
+
+    @pytest.fixture
+    def output_dir(self, tmp_path):
+        """Write one generated data set as both JSON and Parquet."""
+        pytest.importorskip("pyarrow")
+        generator = _generate(tmp_path, jobs=1)
+        generator.save_output("json")
+        generator.save_output("parquet")
+        return tmp_path
+
+    @staticmethod
+    def _json(output_dir, name):
+        return json.loads((output_dir / f"{name}.json").read_text())
+
+    @staticmethod
+    def _parquet(output_dir, name):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(output_dir / f"{name}.parquet").to_pylist()
+
+    @staticmethod
+    def _without(records, nested):
+        return [{k: v for k, v in r.items() if k not in nested} for r in records]
+
+    def test_header_and_master_tables_match_json(self, output_dir):
+        """Test document headers, flows and master data match the JSON rows."""
+        nested = {
+            "purchase_orders": ("header_texts", "items"),
+            "goods_receipts": ("items",),
+            "invoice_receipts": ("items",),
+            "mm_doc_flows": (),
+            "vendors": (),
+            "mm_materials": (),
+        }
+        for name, fields in nested.items():
+            expected = self._without(self._json(output_dir, name), fields)
+            assert self._parquet(output_dir, name) == expected, name
+
+    def test_item_tables_match_json(self, output_dir):
+        """Test normalized item and text tables match the nested JSON items."""
+        pos = self._json(output_dir, "purchase_orders")
+        grs = self._json(output_dir, "goods_receipts")
+        irs = self._json(output_dir, "invoice_receipts")
+
+        po_texts = []
+        for po in pos:
+            po_texts += [{"ebeln": po["ebeln"], "ebelp": None, **t} for t in po["header_texts"]]
+            for item in po["items"]:
+                po_texts += [
+                    {"ebeln": po["ebeln"], "ebelp": item["ebelp"], **t}
+                    for t in item["item_texts"]
+                ]
+
+        expected = {
+            "po_items": self._without(
+                [{"ebeln": po["ebeln"], **i} for po in pos for i in po["items"]],
+                ("item_texts",),
+            ),
+            "po_texts": po_texts,
+            "gr_items": [{"mblnr": gr["mblnr"], **i} for gr in grs for i in gr["items"]],
+            "ir_items": [{"belnr": ir["belnr"], **i} for ir in irs for i in ir["items"]],
+        }
+        for name, records in expected.items():
+            assert self._parquet(output_dir, name) == records, name
+
+
+class TestArrowSchema:
+    """Tests for deriving Parquet schemas from dataclasses."""
+
+    def test_list_fields_are_skipped(self):
+        """Test nested list fields are left to their own tables."""
+        pytest.importorskip("pyarrow")
+        from src.generate_mm import _arrow_schema
+
+        @dataclass
+        class Row:
+            ebeln: str
+            netwr: float
+            items: list[dict]
+
+        assert _arrow_schema(Row, ("key",)).names == ["key", "ebeln", "netwr"]
+
+    def test_unknown_scalar_type_raises(self):
+        """Test a field without an Arrow type is an error, not dropped."""
+        pytest.importorskip("pyarrow")
+        from src.generate_mm import _arrow_schema
+
+        @dataclass
+        class Row:
+            ebeln: str
+            menge: int
+
+        with pytest.raises(TypeError, match="Row.menge"):
+            _arrow_schema(Row)
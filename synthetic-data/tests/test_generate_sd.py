@@ -0,0 +1,171 @@
+"""
+Tests for the SAP SD document generator.
+
+Tests cover:
+- Reproducible output for a fixed seed and job count
+- Unique document numbers across parallel shards
+- Parquet output matching the JSON output row for row
+- Parquet schemas rejecting fields without an Arrow type
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from src.generate_sd import SAPSDGenerator
+from src.record_io import row_record
+
+
+def _generate(tmp_path, count=200, seed=11, jobs=1):
+    generator = SAPSDGenerator(count=count, seed=seed, output_dir=str(tmp_path), jobs=jobs)
+    generator.generate_all()
+    return generator
+
+
+def _documents(generator):
+    return (
+        [row_record(order) for order in generator.sales_orders],
+        [row_record(delivery) for delivery in generator.deliveries],
+        [row_record(invoice) for invoice in generator.invoices],
+        generator.doc_flows.columns(),
+        generator.stats,
+    )
+
+
+class TestParallelGeneration:
+    """Tests for generating document chains in worker processes."""
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_fixed_seed_and_jobs_is_reproducible(self, tmp_path, jobs):
+        """Test the same seed and job count give identical documents."""
+        first = _documents(_generate(tmp_path, jobs=jobs))
+        second = _documents(_generate(tmp_path, jobs=jobs))
+
+        assert first == second
+
+    def test_document_numbers_unique_across_shards(self, tmp_path):
+        """Test order, delivery and invoice numbers do not collide between shards."""
+        generator = _generate(tmp_path, jobs=3)
+
+        assert len(generator.sales_orders) == 200
+        for numbers in (
+            [order.vbeln for order in generator.sales_orders],
+            [delivery.vbeln for delivery in generator.deliveries],
+            [invoice.vbeln for invoice in generator.invoices],
+        ):
+            assert len(set(numbers)) == len(numbers)
+
+
+class TestParquetOutput:
+    """Tests for the normalized Parquet tables."""
+
+    @pytest.fixture
+    def output_dir(self, tmp_path):
+        """Write one generated data set as both JSON and Parquet."""
+        pytest.importorskip("pyarrow")
+        generator = _generate(tmp_path)
+        generator.save_output("json")
+        generator.save_output("parquet")
+        return tmp_path
+
+    @staticmethod
+    def _json(output_dir, name):
+        return json.loads((output_dir / f"{name}.json").read_text())
+
+    @staticmethod
+    def _parquet(output_dir, name):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(output_dir / f"{name}.parquet").to_pylist()
+
+    @staticmethod
+    def _without(records, nested):
+        return [{k: v for k, v in r.items() if k not in nested} for r in records]
+
+    def test_header_and_master_tables_match_json(self, output_dir):
+        """Test document headers, flows and master data match the JSON rows."""
+        nested = {
+            "orders": ("header_texts", "items", "conditions"),
+            "deliveries": ("items",),
+            "invoices": ("items",),
+            "doc_flows": (),
+            "customers": (),
+            "materials": (),
+        }
+        for name, fields in nested.items():
+            expected = self._without(self._json(output_dir, name), fields)
+            assert self._parquet(output_dir, name) == expected, name
+
+    def test_item_tables_match_json(self, output_dir):
+        """Test normalized item tables match the nested JSON items."""
+        orders = self._json(output_dir, "orders")
+        deliveries = self._json(output_dir, "deliveries")
+        invoices = self._json(output_dir, "invoices")
+
+        expected = {
+            "order_items": self._without(
+                [{"vbeln": o["vbeln"], **i} for o in orders for i in o["items"]],
+                ("item_texts", "schedule_lines"),
+            ),
+            "schedule_lines": [
+                {"vbeln": o["vbeln"], "posnr": i["posnr"], **line}
+                for o in orders for i in o["items"] for line in i["schedule_lines"]
+            ],
+            "order_conditions": [c for o in orders for c in o["conditions"]],
+            "delivery_items": [
+                {"vbeln": d["vbeln"], **i} for d in deliveries for i in d["items"]
+            ],
+            "invoice_items": [
+                {"vbeln": inv["vbeln"], **i} for inv in invoices for i in inv["items"]
+            ],
+        }
+        for name, records in expected.items():
+            assert self._parquet(output_dir, name) == records, name
+
+    def test_text_table_matches_json(self, output_dir):
+        """Test header and item texts are keyed by order and item number."""
+        orders = self._json(output_dir, "orders")
+        expected = []
+        for order in orders:
+            expected += [{"vbeln": order["vbeln"], "posnr": None, **t} for t in order["header_texts"]]
+            for item in order["items"]:
+                expected += [
+                    {"vbeln": order["vbeln"], "posnr": item["posnr"], **t}
+                    for t in item["item_texts"]
+                ]
+
+        assert self._parquet(output_dir, "order_texts") == expected
+
+
+class TestArrowSchema:
+    """Tests for deriving Parquet schemas from dataclasses."""
+
+    def test_list_fields_are_skipped(self):
+        """Test nested list fields are left to their own tables."""
+        pytest.importorskip("pyarrow")
+        from src.generate_sd import _arrow_schema
+
+        @dataclass
+        class Row:
+            vbeln: str
+            netwr: float
+            text: str | None
+            items: list[dict]
+
+        assert _arrow_schema(Row, ("key",)).names == ["key", "vbeln", "netwr", "text"]
+
+    def test_unknown_scalar_type_raises(self):
+        """Test a field without an Arrow type is an error, not dropped."""
+        pytest.importorskip("pyarrow")
+        from src.generate_sd import _arrow_schema
+
+        @dataclass
+        class Row:
+            vbeln: str
+            count: int
+
+        with pytest.raises(TypeError, match="Row.count"):
+            _arrow_schema(Row)